@@ -1,10 +1,11 @@
 from django.contrib import admin
 
 from bookings.models import Booking
+from common.admin import LargeTableAdminMixin
 
 
 @admin.register(Booking)
-class BookingsAdmin(admin.ModelAdmin):
+class BookingsAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = (
         "kind",
         "user",
@@ -17,3 +18,8 @@ class BookingsAdmin(admin.ModelAdmin):
     )
 
     list_filter = ("kind",)
+
+    list_select_related = ("user", "room", "experience")
+    # 변경 form에서 user/room/experience 전체를 select option으로 불러오지 않도록
+    autocomplete_fields = ("user", "room")
+    raw_id_fields = ("experience",)
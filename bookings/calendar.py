@@ -0,0 +1,66 @@
+import base64
+import calendar
+from datetime import date, timedelta
+
+from bookings.models import Booking
+from common.cache import get_or_build
+
+CALENDAR_CACHE_TIMEOUT = 60 * 60
+
+
+def month_range(month: date):
+    """month가 속한 달의 [start, end) 기간"""
+    start = month.replace(day=1)
+    days = calendar.monthrange(start.year, start.month)[1]
+    return start, start + timedelta(days=days)
+
+
+def encode_bitmap(days):
+    """
+    하루를 1bit로 표현 (1일 -> 첫 byte의 최하위 bit), base64로 인코딩
+    31일도 4byte -> 8글자
+    """
+    bitmap = bytearray((len(days) + 7) // 8)
+    for i, occupied in enumerate(days):
+        if occupied:
+            bitmap[i // 8] |= 1 << (i % 8)
+    return base64.b64encode(bytes(bitmap)).decode()
+
+
+def build_room_calendar(room_id, month: date):
+    start, end = month_range(month)
+    days = [False] * (end - start).days
+
+    bookings = (
+        Booking.objects.overlapping(start, end)
+        .filter(room_id=room_id)
+        .values_list("check_in", "check_out")
+    )
+    for check_in, check_out in bookings:
+        # 체크아웃 날짜는 다른 손님이 체크인할 수 있으므로 비어있음
+        for i in range(
+            (max(check_in, start) - start).days,
+            (min(check_out, end) - start).days,
+        ):
+            days[i] = True
+
+    return {
+        "month": start.strftime("%Y-%m"),
+        "start": start.isoformat(),
+        "days": len(days),
+        "occupied": encode_bitmap(days),
+    }
+
+
+def calendar_namespace(room_id):
+    """room의 모든 달 calendar cache namespace (bookings.signals에서 무효화)"""
+    return f"room-calendar:{room_id}"
+
+
+def get_room_calendar(room_id, month: date):
+    return get_or_build(
+        [calendar_namespace(room_id)],
+        lambda: build_room_calendar(room_id, month),
+        f"{month:%Y-%m}",
+        timeout=CALENDAR_CACHE_TIMEOUT,
+    )
@@ -0,0 +1,107 @@
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from bookings.models import Booking
+from rooms.models import Room
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "bookings 테이블 크기별로 room 예약 겹침 확인 쿼리 시간을 측정합니다. 생성한 데이터는 모두 rollback 됩니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            default=[10_000, 100_000, 1_000_000],
+            help="측정할 bookings 갯수 (누적해서 생성)",
+        )
+        parser.add_argument("--rooms", type=int, default=1000)
+        parser.add_argument("--checks", type=int, default=1000)
+        parser.add_argument("--batch-size", type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                self.run(**options)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def run(self, sizes, rooms, checks, batch_size, **options):
+        random.seed(0)
+        today = timezone.localtime(timezone.now()).date()
+
+        owner = get_user_model().objects.create_user(
+            email="benchmark-booking@example.com", password=None
+        )
+        Room.objects.bulk_create(
+            [
+                Room(
+                    owner=owner,
+                    title=f"benchmark room {i}",
+                    country="한국",
+                    city="서울",
+                    price=100,
+                    rooms=1,
+                    toilets=1,
+                    description="",
+                    address="",
+                    pet_friendly=False,
+                    kind=Room.KindChoices.ENTIRE_PLACE,
+                )
+                for i in range(rooms)
+            ],
+            batch_size=batch_size,
+        )
+        room_ids = list(Room.objects.filter(owner=owner).values_list("id", flat=True))
+
+        def random_stay():
+            check_in = today + timedelta(days=random.randrange(3650))
+            return check_in, check_in + timedelta(days=random.randrange(1, 8))
+
+        self.stdout.write(f"{'bookings':>10} {'avg(ms)':>10} {'p95(ms)':>10}")
+        created = 0
+        for size in sorted(sizes):
+            while created < size:
+                count = min(batch_size, size - created)
+                bookings = []
+                for _ in range(count):
+                    check_in, check_out = random_stay()
+                    bookings.append(
+                        Booking(
+                            kind=Booking.BookingKindChoices.ROOM,
+                            user=owner,
+                            room_id=random.choice(room_ids),
+                            check_in=check_in,
+                            check_out=check_out,
+                            guests=1,
+                        )
+                    )
+                Booking.objects.bulk_create(bookings)
+                created += count
+
+            timings = []
+            for _ in range(checks):
+                room_id = random.choice(room_ids)
+                check_in, check_out = random_stay()
+                started = time.perf_counter()
+                Booking.objects.overlapping(check_in, check_out).filter(
+                    room_id=room_id
+                ).exists()
+                timings.append((time.perf_counter() - started) * 1000)
+
+            timings.sort()
+            average = sum(timings) / len(timings)
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            self.stdout.write(f"{size:>10} {average:>10.3f} {p95:>10.3f}")
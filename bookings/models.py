@@ -4,6 +4,16 @@ from django.db import models
 from common.models import CommonModel
 
 
+class BookingQuerySet(models.QuerySet):
+    def overlapping(self, check_in, check_out):
+        """[check_in, check_out) 기간과 하루라도 겹치는 room 예약"""
+        return self.filter(
+            kind=self.model.BookingKindChoices.ROOM,
+            check_in__lt=check_out,
+            check_out__gt=check_in,
+        )
+
+
 class Booking(CommonModel):
     """Booking Model Definition"""
 
@@ -49,5 +59,27 @@ class Booking(CommonModel):
     experience_time = models.DateTimeField(null=True, blank=True)
     guests = models.PositiveIntegerField()
 
+    objects = BookingQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # room별 예약 기간 겹침 확인 (BookingQuerySet.overlapping)
+            models.Index(
+                fields=["room", "check_in", "check_out"],
+                name="booking_room_dates_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # room이 바뀌는 경우 이전 room의 calendar도 무효화하기 위해 저장
+        instance._loaded_values = {
+            field: instance.__dict__[field]
+            for field in ("room_id",)
+            if field in instance.__dict__
+        }
+        return instance
+
     def __str__(self):
         return f"{self.kind.title()} booking for: {self.user}"
@@ -1,7 +1,9 @@
+from django.db import transaction
 from django.utils import timezone
 from rest_framework import serializers
 
 from bookings.models import Booking
+from rooms.models import Room
 
 
 class PublicBookingSerializer(serializers.ModelSerializer):
@@ -28,6 +30,15 @@ class PrivateBookingSerializer(serializers.ModelSerializer):
         )
 
 
+class RoomCalendarQuerySerializer(serializers.Serializer):
+    """?month=2023-08 (없으면 이번 달)"""
+
+    month = serializers.DateField(input_formats=["%Y-%m"], required=False)
+
+    def validate_month(self, value):
+        return value.replace(day=1)
+
+
 class CreateRoomBookingSerializer(serializers.ModelSerializer):
     check_in = serializers.DateField()
     check_out = serializers.DateField()
@@ -56,10 +67,31 @@ class CreateRoomBookingSerializer(serializers.ModelSerializer):
         if attr["check_out"] <= attr["check_in"]:
             raise serializers.ValidationError("저기여!! 체크아웃이 체크인보다 빠르면 오또케~")
 
-        exist = Booking.objects.filter(
-            check_in__lte=attr["check_out"],
-            check_out__gte=attr["check_in"],
-        ).exists()
+        # (room_id, check_in, check_out) index를 타도록 같은 room의 예약만 확인
+        exist = (
+            Booking.objects.overlapping(attr["check_in"], attr["check_out"])
+            .filter(room=self.context["room"])
+            .exists()
+        )
         if exist:
             raise serializers.ValidationError("이미 예약된 방을 예약하려하면 오또케")
         return attr
+
+    def create(self, validated_data):
+        room = validated_data["room"]
+        with transaction.atomic():
+            # INSERT를 먼저 해서 SQLite에서는 write lock을 잡고,
+            # 다른 DB에서는 room row lock으로 같은 room의 예약 생성을 직렬화
+            booking = super().create(validated_data)
+            Room.objects.select_for_update().only("pk").get(pk=room.pk)
+
+            # lock을 잡은 뒤 다시 확인 (validate 이후 먼저 커밋된 예약이 있을 수 있음)
+            exist = (
+                Booking.objects.overlapping(booking.check_in, booking.check_out)
+                .filter(room=room)
+                .exclude(pk=booking.pk)
+                .exists()
+            )
+            if exist:
+                raise serializers.ValidationError("이미 예약된 방을 예약하려하면 오또케")
+        return booking
@@ -0,0 +1,37 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from bookings.calendar import calendar_namespace
+from bookings.models import Booking
+from common.cache import bump_on_commit
+
+
+def _invalidate_calendars(*room_ids):
+    namespaces = [calendar_namespace(room_id) for room_id in set(room_ids) - {None}]
+    if namespaces:
+        bump_on_commit(*namespaces)
+
+
+@receiver(pre_save, sender=Booking)
+def remember_booking_room(sender, instance: Booking, **kwargs):
+    # DB에서 불러온 instance는 from_db에서 저장한 값을 사용 (query 없음)
+    loaded = getattr(instance, "_loaded_values", None)
+    if instance.pk is None or (loaded is not None and "room_id" in loaded):
+        return
+    instance._loaded_values = {
+        "room_id": Booking.objects.filter(pk=instance.pk)
+        .values_list("room_id", flat=True)
+        .first()
+    }
+
+
+@receiver(post_save, sender=Booking)
+def invalidate_calendar_on_save(sender, instance: Booking, **kwargs):
+    loaded = getattr(instance, "_loaded_values", None) or {}
+    _invalidate_calendars(instance.room_id, loaded.get("room_id"))
+    instance._loaded_values = {"room_id": instance.room_id}
+
+
+@receiver(post_delete, sender=Booking)
+def invalidate_calendar_on_delete(sender, instance: Booking, **kwargs):
+    _invalidate_calendars(instance.room_id)
@@ -1,5 +1,9 @@
-from django.db import IntegrityError
+from django.contrib.admin.widgets import AutocompleteSelect, ForeignKeyRawIdWidget
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from django.utils import timezone
 
 from bookings.models import Booking
@@ -83,3 +87,56 @@ class BookingsModelTest(TestCase):
                 room=self.room,
                 **extra_fields,
             )
+
+
+class BookingsAdminTest(TestCase):
+    def setUp(self):
+        self.default_object_create = DefaultObjectCreate()
+        self.admin = get_user_model().objects.create_superuser(
+            email="admin@example.com", password="password123"
+        )
+        self.client.force_login(self.admin)
+
+    def create_bookings(self, count):
+        for _ in range(count):
+            Booking.objects.create(
+                kind=Booking.BookingKindChoices.ROOM,
+                user=self.default_object_create.create_user(
+                    email=f"guest{Booking.objects.count()}@example.com"
+                ),
+                room=self.default_object_create.create_room(owner=self.admin),
+                experience=self.default_object_create.create_experience(
+                    host=self.admin
+                ),
+                check_in="2023-07-28",
+                check_out="2023-07-29",
+                guests=1,
+            )
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(url)
+        self.assertEqual(res.status_code, 200)
+        return len(queries)
+
+    def test_changelist_queries_constant(self):
+        url = reverse("admin:bookings_booking_changelist")
+        self.create_bookings(2)
+        few = self.count_queries(url)
+        self.create_bookings(8)
+        self.assertEqual(self.count_queries(url), few)
+
+    def test_change_form_without_select_options(self):
+        """user/room/experience를 전부 option으로 그리지 않음"""
+        self.create_bookings(3)
+        url = reverse(
+            "admin:bookings_booking_change", args=(Booking.objects.first().pk,)
+        )
+
+        res = self.client.get(url)
+
+        self.assertEqual(res.status_code, 200)
+        fields = res.context["adminform"].form.fields
+        for name in ("user", "room"):
+            self.assertIsInstance(fields[name].widget.widget, AutocompleteSelect)
+        self.assertIsInstance(fields["experience"].widget, ForeignKeyRawIdWidget)
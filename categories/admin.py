@@ -11,3 +11,4 @@ class CategoryAdmin(admin.ModelAdmin):
     )
 
     list_filter = ("kind",)
+    search_fields = ("name",)
@@ -0,0 +1,9 @@
+from categories.models import Category
+from common.conditional import list_state
+
+# 공개 category 응답 cache namespace (categories.signals에서 무효화)
+CATEGORY_LIST = "category-list"
+
+
+def category_list_state(request, *args, **kwargs):
+    return list_state(Category.objects.all())
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from categories.cache import CATEGORY_LIST
+from categories.models import Category
+from common.cache import bump_on_commit
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_list(sender, instance: Category, **kwargs):
+    bump_on_commit(CATEGORY_LIST)
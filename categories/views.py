@@ -8,16 +8,22 @@ from rest_framework.response import Response
 from rest_framework.serializers import Serializer
 from rest_framework.views import APIView
 
+from categories.cache import CATEGORY_LIST, category_list_state
 from categories.models import Category
 from categories.serializers import CategorySerializer
+from common.cache import get_or_build
+from common.conditional import conditional_view
 
 
 class Categories(APIView):
+    @conditional_view(category_list_state)
     def get(self, request: Request) -> Response:
-        all_categories: QuerySet[Category] = Category.objects.all()
-        serializer: Serializer = CategorySerializer(all_categories, many=True)
+        def build() -> list:
+            all_categories: QuerySet[Category] = Category.objects.all()
+            serializer: Serializer = CategorySerializer(all_categories, many=True)
+            return list(serializer.data)
 
-        return Response(serializer.data)
+        return Response(get_or_build([CATEGORY_LIST], build))
 
     def post(self, request: Request) -> Response:
         serializer: Serializer = CategorySerializer(data=request.data)
@@ -1 +1,62 @@
-# Register your models here.
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    검색/필터가 없는 전체 목록이면 COUNT(*) 대신 DB 통계의 row 수를 사용
+    수백만 row 테이블에서 changelist를 열 때마다 전체 scan하지 않도록
+
+    추정치가 ESTIMATE_THRESHOLD보다 작으면 정확한 COUNT(*)를 사용
+    """
+
+    ESTIMATE_THRESHOLD = 100_000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if getattr(queryset, "query", None) is None or queryset.query.where:
+            return super().count
+        estimate = estimate_count(queryset)
+        if estimate is None or estimate < self.ESTIMATE_THRESHOLD:
+            return super().count
+        return estimate
+
+
+def estimate_count(queryset):
+    """테이블 전체 row 수 추정치 (알 수 없으면 None)"""
+    connection = connections[queryset.db]
+    table = queryset.model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(table)],
+            )
+        elif connection.vendor == "mysql":
+            cursor.execute(
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s",
+                [table],
+            )
+        else:
+            # 통계가 없는 DB는 max(pk)로 추정 (pk index만 읽음, 삭제된 row만큼 큼)
+            cursor.execute(
+                f"SELECT MAX({connection.ops.quote_name(queryset.model._meta.pk.column)}) "
+                f"FROM {connection.ops.quote_name(table)}"
+            )
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class LargeTableAdminMixin:
+    """
+    큰 테이블용 changelist 설정
+    전체 갯수는 추정치, 필터 결과 옆의 "(전체 n개)"용 COUNT(*)는 생략
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
@@ -0,0 +1,63 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+def get_response_cache():
+    return caches[settings.RESPONSE_CACHE_ALIAS]
+
+
+def _version_key(namespace):
+    return f"response-version:{namespace}"
+
+
+def get_versions(*namespaces):
+    cache = get_response_cache()
+    keys = [_version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+    for key in set(keys) - set(versions):
+        # 이전에 쓰던 version과 겹치지 않도록 시간값으로 시작
+        versions[key] = time.time_ns()
+        cache.add(key, versions[key], timeout=None)
+    return [versions[key] for key in keys]
+
+
+def bump(*namespaces):
+    """namespace에 속한 모든 cache를 무효화 (version을 올림)"""
+    cache = get_response_cache()
+    for namespace in namespaces:
+        try:
+            cache.incr(_version_key(namespace))
+        except ValueError:
+            cache.set(_version_key(namespace), time.time_ns(), timeout=None)
+
+
+def bump_on_commit(*namespaces):
+    """
+    transaction이 commit된 뒤에 bump
+    commit 전에 bump하면 그 사이 요청이 변경 전 값으로 cache를 다시 채움
+    """
+    transaction.on_commit(lambda: bump(*namespaces))
+
+
+def make_key(namespaces, *key_parts):
+    versions = get_versions(*namespaces)
+    raw_key = f"{list(zip(namespaces, versions))}|{key_parts}"
+    return f"response:{hashlib.md5(raw_key.encode()).hexdigest()}"
+
+
+def get_or_build(namespaces, build, *key_parts, timeout=None):
+    """
+    namespaces의 version과 key_parts(url 등)로 cache key를 만들고
+    cache에 없으면 build()로 만들어서 저장 (timeout 기본값 RESPONSE_CACHE_TIMEOUT)
+    """
+    cache = get_response_cache()
+    key = make_key(namespaces, *key_parts)
+    payload = cache.get(key)
+    if payload is None:
+        payload = build()
+        cache.set(key, payload, timeout=timeout or settings.RESPONSE_CACHE_TIMEOUT)
+    return payload
@@ -0,0 +1,49 @@
+import hashlib
+
+from django.db.models import Count, F, Func, Max, Subquery
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+
+def make_etag(*parts):
+    return hashlib.md5(repr(parts).encode()).hexdigest()
+
+
+def aggregate_subquery(queryset, function, field="updated_at"):
+    """OuterRef로 묶인 queryset의 MAX/COUNT 등을 GROUP BY 없이 subquery로"""
+    return Subquery(
+        queryset.order_by()
+        .annotate(value=Func(F(field), function=function))
+        .values("value")[:1]
+    )
+
+
+def list_state(queryset, *extra):
+    """
+    목록의 (etag, last_modified)
+    updated_at 최댓값과 갯수로 추가/수정/삭제를 모두 구분
+    삭제는 updated_at 최댓값을 바꾸지 않으므로 Last-Modified는 쓰지 않음 (None)
+    """
+    state = queryset.aggregate(last_modified=Max("updated_at"), count=Count("pk"))
+    return make_etag(state["last_modified"], state["count"], *extra), None
+
+
+def conditional_view(get_state):
+    """
+    get_state(request, *args, **kwargs) -> (etag, last_modified)
+    응답이 user나 삭제에 따라 달라지면 last_modified는 None (ETag로만 비교)
+    변경이 없으면 view를 실행하지 않고 304를 반환 (GET/HEAD)
+    get_state는 요청당 한번만 실행
+    """
+
+    def state(request, *args, **kwargs):
+        if not hasattr(request, "_conditional_state"):
+            request._conditional_state = get_state(request, *args, **kwargs)
+        return request._conditional_state
+
+    return method_decorator(
+        condition(
+            etag_func=lambda *args, **kwargs: state(*args, **kwargs)[0],
+            last_modified_func=lambda *args, **kwargs: state(*args, **kwargs)[1],
+        )
+    )
@@ -0,0 +1,124 @@
+import json
+from datetime import date
+from functools import reduce
+from operator import or_
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+
+
+def _invert(order):
+    return order[1:] if order.startswith("-") else f"-{order}"
+
+
+def _encode_value(value):
+    # datetime은 microsecond까지 그대로 (같은 초에 만든 row를 구분)
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"cursor에 넣을 수 없는 값: {value!r}")
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    ordering의 모든 필드 값을 cursor에 담는 keyset 페이지네이션
+
+    DRF CursorPagination은 첫번째 ordering 필드만 cursor 위치로 쓰고
+    같은 값이 여러개면 OFFSET으로 건너뜀 (offset_cutoff 이상이면 페이지가 끝나지 않음)
+    여기서는 (값, ..., id)를 cursor에 넣고
+    (f1 > v1) OR (f1 = v1 AND f2 > v2) ... 조건으로 다음 페이지를 조회
+    -> 같은 값이 많아도 OFFSET 없이 끝까지 이어짐
+
+    ordering의 마지막은 unique 필드(id)여야 하고, 모든 필드가 NULL이 아니어야 함
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor is not None and self.cursor.reverse
+        current_position = self.cursor and self.cursor.position
+
+        if reverse:
+            queryset = queryset.order_by(*[_invert(order) for order in self.ordering])
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if current_position is not None:
+            queryset = queryset.filter(self.keyset_filter(current_position, reverse))
+
+        # 다음 페이지가 있는지 확인하기 위해 하나 더 조회
+        results = list(queryset[: self.page_size + 1])
+        self.page = results[: self.page_size]
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(
+                results[-1], self.ordering
+            )
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None
+            self.has_previous = has_following_position
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = current_position is not None
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def keyset_filter(self, position, reverse=False):
+        """cursor 위치 다음에 오는 row 조건"""
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        fields = [order.lstrip("-") for order in self.ordering]
+        conditions = []
+        for i, order in enumerate(self.ordering):
+            lookup = "lt" if order.startswith("-") != reverse else "gt"
+            # 앞의 필드는 cursor 값과 같고 i번째 필드는 cursor 다음
+            equal = dict(zip(fields[:i], values))
+            conditions.append(Q(**equal, **{f"{fields[i]}__{lookup}": values[i]}))
+        return reduce(or_, conditions)
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = [
+            instance[order.lstrip("-")]
+            if isinstance(instance, dict)
+            else getattr(instance, order.lstrip("-"))
+            for order in ordering
+        ]
+        return json.dumps(values, default=_encode_value)
+
+
+class NewestFirstCursorPagination(KeysetCursorPagination):
+    """
+    (created_at, id) 기준 최신순 keyset 페이지네이션
+
+    cursor에 (created_at, id)를 모두 담아서 OFFSET 없이 다음 페이지를 조회하므로
+    뒤쪽 페이지로 가도, created_at이 같은 row가 많아도 쿼리 비용이 일정하고,
+    next/previous에는 인코딩된 cursor가 담긴 url이 내려감
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -1 +1,17 @@
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from common.bloom import BloomFilter
+
+
+class BloomFilterTest(SimpleTestCase):
+    def test_contains(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"item-{i}")
+
+        self.assertTrue(all(f"item-{i}" in bloom for i in range(1000)))
+        self.assertEqual(len(bloom), 1000)
+        self.assertTrue(bloom.is_full)
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
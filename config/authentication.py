@@ -1,4 +1,26 @@
+from django.conf import settings
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from users.models import TokenClaimsUser
+from users.revocation import revocation_store
+
+# access token에 넣어서 DB 조회 없이 쓰는 user 필드 (TokenClaimsUser.from_claims)
+# (claim이 있는 token만 JWT_TRUSTED_CLAIMS 인증을 사용)
+USER_CLAIM_FIELDS = ("is_staff", "is_host")
+
+
+class ClaimsRefreshToken(RefreshToken):
+    """USER_CLAIM_FIELDS를 claim으로 넣은 token (access token에도 복사됨)"""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for field in USER_CLAIM_FIELDS:
+            token[field] = getattr(user, field)
+        return token
 
 
 class SimpleJWTAuthentication(JWTAuthentication):
@@ -9,4 +31,37 @@ class SimpleJWTAuthentication(JWTAuthentication):
 
         validated_token = self.get_validated_token(raw_token)
 
+        if settings.JWT_TRUSTED_CLAIMS:
+            user = self.get_claims_user(validated_token)
+            if user is not None:
+                return user, validated_token
         return self.get_user(validated_token), validated_token
+
+    def get_validated_token(self, raw_token):
+        validated_token = super().get_validated_token(raw_token)
+        if revocation_store.is_revoked(validated_token):
+            raise InvalidToken("폐기된 token이에요")
+        return validated_token
+
+    def get_claims_user(self, validated_token):
+        """
+        user 조회 query 없이 claim으로 user를 만듦 (나머지 필드는 접근할 때 불러옴)
+        claim이 없는 이전 token이면 None
+        """
+        claims = (api_settings.USER_ID_CLAIM, *USER_CLAIM_FIELDS)
+        if not all(claim in validated_token for claim in claims):
+            return None
+
+        # user id claim은 문자열로 들어있음
+        user_id = TokenClaimsUser._meta.pk.to_python(
+            validated_token[api_settings.USER_ID_CLAIM]
+        )
+        user = TokenClaimsUser.from_claims(
+            user_id, {field: validated_token[field] for field in USER_CLAIM_FIELDS}
+        )
+        # 삭제/비활성화된 user는 token이 만료되기 전이라도 거절 (401)
+        if user is None:
+            raise AuthenticationFailed("user를 찾을 수 없어요", code="user_not_found")
+        if not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed("비활성화된 user에요", code="user_inactive")
+        return user
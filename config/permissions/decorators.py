@@ -21,8 +21,8 @@ def authentication_required(func):
         try:
             instance = apiview_class.get_object()  # room
             for fk in ["owner", "host", "user"]:
-                if hasattr(instance, fk):
-                    if getattr(instance, fk) != request.user:
+                if hasattr(instance, f"{fk}_id"):
+                    if getattr(instance, f"{fk}_id") != request.user.pk:
                         return Response(
                             PermissionDenied.default_detail,
                             status=status.HTTP_403_FORBIDDEN,
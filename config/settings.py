@@ -96,10 +96,29 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # in-memory(shared cache) DB는 table lock을 기다리지 않고 바로 에러를 내서
+        # 동시성 테스트가 실제 DB와 같은 조건에서 돌도록 파일로 생성
+        "TEST": {
+            "NAME": BASE_DIR / "test_db.sqlite3",
+        },
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+}
+
+# 공개 room/category/amenity 응답 cache (common.cache)
+RESPONSE_CACHE_ALIAS = "default"
+RESPONSE_CACHE_TIMEOUT = 60 * 5
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -154,6 +173,13 @@ REST_FRAMEWORK = {
 
 
 PAGE_SIZE = 3
+ROOMS_PAGE_SIZE = 20
+ROOM_DETAIL_REVIEWS = 5
+# /api/v1/wishlists 목록에서 wishlist마다 보여줄 cover photo 갯수
+WISHLIST_COVER_PHOTOS = 3
+# rooms.bulk import/export 한번에 처리할 room 갯수
+ROOM_IMPORT_BATCH_SIZE = 500
+ROOM_EXPORT_CHUNK_SIZE = 500
 
 MEDIA_URL = "user-uploads/"
 MEDIA_ROOT = "uploads"
@@ -171,6 +197,18 @@ SIMPLE_JWT = {
     "UPDATE_LAST_LOGIN": False,
 }
 
+# True면 access token의 user를 DB 조회 없이 claim(is_staff, is_host)으로 인증
+# (config.authentication, 권한이 바뀌면 새 token을 발급받을 때 반영)
+# 삭제/비활성화 여부와 나머지 user 필드는 JWT_USER_CACHE_TIMEOUT초 동안 cache,
+# user 저장/삭제시 무효화
+JWT_TRUSTED_CLAIMS = False
+JWT_USER_CACHE_TIMEOUT = 60
+# 폐기된 token 확인 (users.revocation)
+# 다른 process에서 폐기한 token은 TOKEN_REVOCATION_SYNC_INTERVAL초 안에 반영
+TOKEN_REVOCATION_BLOOM_CAPACITY = 100_000
+TOKEN_REVOCATION_BLOOM_ERROR_RATE = 0.001
+TOKEN_REVOCATION_SYNC_INTERVAL = 1
+
 # 서버로부터 로컬호스트:3000이 fetch하는걸 허용
 CORS_ALLOWED_ORIGINS = ["http://localhost:3000", "http://127.0.0.1:3000"]
 CORS_ALLOW_CREDENTIALS = True  # 자바스크립트로 요청을 받는걸 허용
@@ -34,5 +34,25 @@ class Review(CommonModel):
     payload = models.TextField()
     rating = models.PositiveIntegerField()
 
+    class Meta:
+        indexes = [
+            # room별 최신순 review cursor 페이지네이션
+            models.Index(
+                fields=["room", "-created_at", "-id"],
+                name="review_room_created_at_id_idx",
+            ),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # room 집계 갱신시 이전 값과 비교하기 위해 저장
+        instance._loaded_values = {
+            field: instance.__dict__[field]
+            for field in ("room_id", "rating")
+            if field in instance.__dict__
+        }
+        return instance
+
     def __str__(self):
         return f"{self.user} / {self.rating}"
@@ -0,0 +1,43 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from reviews.models import Review
+from rooms.models import Room
+
+
+def _update_room_rating(room_id, count, rating):
+    if room_id is None:
+        return
+    Room.objects.filter(pk=room_id).update(
+        review_count=F("review_count") + count,
+        rating_sum=F("rating_sum") + rating,
+    )
+
+
+@receiver(post_save, sender=Review)
+def update_room_rating_on_save(sender, instance: Review, created, **kwargs):
+    loaded = getattr(instance, "_loaded_values", None)
+
+    if created:
+        _update_room_rating(instance.room_id, 1, instance.rating)
+    elif loaded is None or len(loaded) != 2:
+        # 이전 값을 모르면 관련된 room 집계를 다시 계산
+        if instance.room_id is not None:
+            Room.objects.filter(pk=instance.room_id).refresh_rating_aggregates()
+    elif (loaded["room_id"], loaded["rating"]) != (instance.room_id, instance.rating):
+        _update_room_rating(loaded["room_id"], -1, -loaded["rating"])
+        _update_room_rating(instance.room_id, 1, instance.rating)
+
+    instance._loaded_values = {
+        "room_id": instance.room_id,
+        "rating": instance.rating,
+    }
+
+
+@receiver(post_delete, sender=Review)
+def update_room_rating_on_delete(sender, instance: Review, **kwargs):
+    loaded = getattr(instance, "_loaded_values", None)
+    if loaded is None or len(loaded) != 2:
+        loaded = {"room_id": instance.room_id, "rating": instance.rating}
+    _update_room_rating(loaded["room_id"], -1, -loaded["rating"])
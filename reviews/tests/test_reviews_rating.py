@@ -0,0 +1,108 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from common.utils import DefaultObjectCreate
+from reviews.models import Review
+from rooms.models import Room
+
+
+class RoomRatingAggregateTest(TestCase):
+    """
+    Review 생성/수정/삭제시 Room.review_count, Room.rating_sum이 갱신되는지 확인
+    """
+
+    def setUp(self) -> None:
+        self.default_object_create = DefaultObjectCreate()
+        self.user = self.default_object_create.create_user()
+        self.room = self.default_object_create.create_room(owner=self.user)
+
+    def create_review(self, rating, room=None):
+        return self.default_object_create.create_review(
+            user=self.user,
+            room=room or self.room,
+            payload="review",
+            rating=rating,
+        )
+
+    def test_create_review_updates_room_rating(self):
+        self.create_review(rating=3)
+        self.create_review(rating=4)
+
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.review_count, 2)
+        self.assertEqual(self.room.rating_sum, 7)
+        self.assertEqual(self.room.rating(), 3.5)
+
+    def test_update_review_rating(self):
+        review = self.create_review(rating=3)
+        review.rating = 5
+        review.save()
+
+        review = Review.objects.get(id=review.id)
+        review.rating = 1
+        review.save()
+
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.review_count, 1)
+        self.assertEqual(self.room.rating_sum, 1)
+
+    def test_move_review_to_other_room(self):
+        other_room = self.default_object_create.create_room(owner=self.user)
+        review = self.create_review(rating=4)
+
+        review = Review.objects.get(id=review.id)
+        review.room = other_room
+        review.save()
+
+        self.room.refresh_from_db()
+        other_room.refresh_from_db()
+        self.assertEqual((self.room.review_count, self.room.rating_sum), (0, 0))
+        self.assertEqual((other_room.review_count, other_room.rating_sum), (1, 4))
+
+    def test_delete_review_updates_room_rating(self):
+        review = self.create_review(rating=3)
+        self.create_review(rating=5)
+        review.delete()
+
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.review_count, 1)
+        self.assertEqual(self.room.rating(), 5)
+
+        Review.objects.all().delete()
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.rating(), 0)
+
+    def test_room_save_keeps_aggregates(self):
+        """review 생성 전에 불러온 room을 save해도 집계 값을 덮어쓰지 않음"""
+        amenity = self.default_object_create.create_amenity(name="wifi")
+        room = Room.objects.get(id=self.room.id)
+        self.create_review(rating=4)
+        Room.objects.get(id=self.room.id).amenities.add(amenity)
+
+        room.title = "changed"
+        room.save()
+
+        room.refresh_from_db()
+        self.assertEqual(room.title, "changed")
+        self.assertEqual((room.review_count, room.rating_sum), (1, 4))
+        self.assertNotEqual(room.amenity_mask, 0)
+
+    def test_rating_is_read_without_query(self):
+        self.create_review(rating=3)
+        room = Room.objects.get(id=self.room.id)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(room.rating(), 3)
+
+    def test_refresh_room_aggregates_command(self):
+        self.create_review(rating=2)
+        self.create_review(rating=4)
+        Room.objects.update(review_count=0, rating_sum=0)
+
+        call_command("refresh_room_aggregates", batch_size=1, stdout=StringIO())
+
+        self.room.refresh_from_db()
+        self.assertEqual(self.room.review_count, 2)
+        self.assertEqual(self.room.rating_sum, 6)
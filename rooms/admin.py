@@ -1,10 +1,63 @@
 from django.contrib import admin
 
+from common.admin import LargeTableAdminMixin
 from rooms.models import Room, Amenity
 
 
+class PriceRangeFilter(admin.SimpleListFilter):
+    """
+    price 값 목록(DISTINCT) 대신 고정된 가격 구간으로 필터
+    room_price_id_idx로 범위 조건 조회
+    """
+
+    title = "price"
+    parameter_name = "price_range"
+    # (parameter, 표시 이름, 최소 가격, 최대 가격(미포함))
+    RANGES = (
+        ("0-50000", "~ 5만", 0, 50_000),
+        ("50000-100000", "5만 ~ 10만", 50_000, 100_000),
+        ("100000-200000", "10만 ~ 20만", 100_000, 200_000),
+        ("200000-500000", "20만 ~ 50만", 200_000, 500_000),
+        ("500000-", "50만 ~", 500_000, None),
+    )
+
+    def lookups(self, request, model_admin):
+        return [(value, label) for value, label, _, _ in self.RANGES]
+
+    def queryset(self, request, queryset):
+        for value, _, min_price, max_price in self.RANGES:
+            if self.value() != value:
+                continue
+            queryset = queryset.filter(price__gte=min_price)
+            if max_price is not None:
+                queryset = queryset.filter(price__lt=max_price)
+            return queryset
+        return queryset
+
+
+class AmenityFilter(admin.SimpleListFilter):
+    """
+    m2m join + DISTINCT 대신 amenity_mask로 필터 (RoomQuerySet.with_all_amenities)
+    """
+
+    title = "amenity"
+    parameter_name = "amenity"
+
+    def lookups(self, request, model_admin):
+        return Amenity.objects.order_by("name").values_list("pk", "name")
+
+    def queryset(self, request, queryset):
+        if self.value() is None:
+            return queryset
+        try:
+            amenity_id = int(self.value())
+        except ValueError:
+            return queryset.none()
+        return queryset.with_all_amenities([amenity_id])
+
+
 @admin.register(Room)
-class RoomAdmin(admin.ModelAdmin):
+class RoomAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = (
         "title",
         "total_amenities",
@@ -13,18 +66,28 @@ class RoomAdmin(admin.ModelAdmin):
         "owner",
     )
 
+    # city, rooms, toilets처럼 값 종류가 많은 컬럼은 sidebar가 커지므로 제외
     list_filter = (
         "country",
-        "city",
-        "price",
-        "rooms",
-        "toilets",
+        PriceRangeFilter,
         "pet_friendly",
         "kind",
-        "amenities",
+        AmenityFilter,
     )
 
+    list_select_related = ("owner",)
+    search_fields = ("=id", "^title")
+    autocomplete_fields = ("owner", "amenities", "category")
+
+    def get_queryset(self, request):
+        # total_amenities를 row마다 COUNT 하지 않도록
+        return super().get_queryset(request).with_stats()
+
+    @admin.display(description="total amenities", ordering="amenity_count")
+    def total_amenities(self, room):
+        return room.total_amenities()
+
 
 @admin.register(Amenity)
 class AmenityAdmin(admin.ModelAdmin):
-    pass
+    search_fields = ("name",)
@@ -0,0 +1,281 @@
+import csv
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+from categories.models import Category
+from common.cache import bump
+from medias.models import Photo
+from rooms.cache import ROOM_LIST
+from rooms.models import Amenity, Room
+from rooms.search import index_rooms
+
+# import/export 레코드의 컬럼 (csv header 순서)
+ROOM_RECORD_FIELDS = (
+    "title",
+    "country",
+    "city",
+    "price",
+    "rooms",
+    "toilets",
+    "description",
+    "address",
+    "latitude",
+    "longitude",
+    "pet_friendly",
+    "kind",
+)
+ROOM_RECORD_COLUMNS = ("id", *ROOM_RECORD_FIELDS, "category", "amenities")
+# csv에서 amenity id 구분자 (1|2|3)
+CSV_AMENITY_DELIMITER = "|"
+
+
+class RoomImportSerializer(serializers.ModelSerializer):
+    """
+    import 레코드 한 줄 검증
+    category, amenities는 batch 단위로 한번에 조회해서 확인
+    """
+
+    category = serializers.IntegerField(required=False, allow_null=True)
+    amenities = serializers.ListField(
+        child=serializers.IntegerField(), required=False, default=list
+    )
+
+    class Meta:
+        model = Room
+        fields = (*ROOM_RECORD_FIELDS, "category", "amenities")
+        extra_kwargs = {"pet_friendly": {"required": True}}
+
+    def validate_category(self, value):
+        if value is None:
+            return None
+        category = self.context["categories"].get(value)
+        if category is None:
+            raise serializers.ValidationError(f"Category not found: {value}")
+        if category.kind != Category.KindCategoryChoices.ROOMS:
+            raise serializers.ValidationError("ROOM 카테고리만 넣을 수 있어요")
+        return category
+
+    def validate_amenities(self, value):
+        missing = sorted(set(value) - self.context["amenity_bits"].keys())
+        if missing:
+            raise serializers.ValidationError(f"Amenity not found: {missing}")
+        return set(value)
+
+
+def parse_ndjson(lines):
+    """(line 번호, record) - json이 아닌 줄은 record 대신 에러 메세지"""
+    for line_no, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield line_no, "json 형식이 아니에요"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, "json object로 넣어주세요"
+            continue
+        yield line_no, record
+
+
+def parse_csv(lines):
+    """header가 있는 csv, amenities는 1|2|3"""
+    lines = (
+        line.decode("utf-8") if isinstance(line, bytes) else line for line in lines
+    )
+    # header가 1번째 줄
+    for line_no, row in enumerate(csv.DictReader(lines), start=2):
+        record = {
+            key: value
+            for key, value in row.items()
+            if key is not None and value not in ("", None)
+        }
+        amenities = record.get("amenities")
+        if amenities is not None:
+            record["amenities"] = [
+                amenity_id
+                for amenity_id in amenities.split(CSV_AMENITY_DELIMITER)
+                if amenity_id
+            ]
+        yield line_no, record
+
+
+def _batches(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _batch_context(records):
+    """batch 안의 category, amenity를 query 한번씩으로 조회"""
+    category_ids = set()
+    amenity_ids = set()
+    for record in records:
+        try:
+            if record.get("category") not in (None, ""):
+                category_ids.add(int(record["category"]))
+            amenity_ids.update(int(a) for a in record.get("amenities") or [])
+        except (TypeError, ValueError):
+            # 잘못된 값은 serializer에서 에러로 처리
+            pass
+    return {
+        "categories": Category.objects.in_bulk(category_ids),
+        "amenity_bits": dict(
+            Amenity.objects.filter(id__in=amenity_ids).values_list("id", "bit")
+        ),
+    }
+
+
+def import_rooms(records, owner, batch_size=None):
+    """
+    records: (line 번호, record) iterable (parse_ndjson, parse_csv)
+    batch 단위로 검증 -> bulk_create -> amenity through bulk_create
+    batch마다 transaction을 나누고, 에러가 있는 줄만 건너뜀
+
+    return {"created": 생성 갯수, "errors": [{"line":, "errors":}]}
+    """
+    batch_size = batch_size or settings.ROOM_IMPORT_BATCH_SIZE
+    created = 0
+    errors = []
+
+    for batch in _batches(records, batch_size):
+        context = _batch_context(
+            [record for _, record in batch if isinstance(record, dict)]
+        )
+        rooms = []
+        room_amenities = []
+        for line_no, record in batch:
+            if not isinstance(record, dict):
+                errors.append({"line": line_no, "errors": record})
+                continue
+            serializer = RoomImportSerializer(data=record, context=context)
+            if not serializer.is_valid():
+                errors.append({"line": line_no, "errors": serializer.errors})
+                continue
+            data = dict(serializer.validated_data)
+            room_amenities.append(data.pop("amenities", set()))
+            room = Room(owner=owner, **data)
+            room.update_geohash()
+            # through를 bulk_create하면 m2m_changed가 없으므로 mask를 직접 계산
+            room.amenity_mask = sum(
+                1 << context["amenity_bits"][amenity_id]
+                for amenity_id in room_amenities[-1]
+                if context["amenity_bits"][amenity_id] is not None
+            )
+            rooms.append(room)
+
+        if not rooms:
+            continue
+
+        with transaction.atomic():
+            Room.objects.bulk_create(rooms, batch_size=batch_size)
+            Room.amenities.through.objects.bulk_create(
+                [
+                    Room.amenities.through(room_id=room.pk, amenity_id=amenity_id)
+                    for room, amenity_ids in zip(rooms, room_amenities)
+                    for amenity_id in amenity_ids
+                ],
+                batch_size=batch_size,
+            )
+            index_rooms(rooms)
+        created += len(rooms)
+
+    if created:
+        # bulk_create는 signal이 발생하지 않으므로 검색 index와 cache를 직접 갱신
+        bump(ROOM_LIST)
+    return {"created": created, "errors": errors}
+
+
+def iter_room_records(queryset=None, chunk_size=None):
+    """
+    import와 같은 형식의 record를 chunk 단위로 조회하면서 하나씩 반환
+    메모리에는 chunk 하나만 올라감
+    """
+    if queryset is None:
+        queryset = Room.objects.all()
+    rooms = (
+        queryset.order_by("pk")
+        .only("pk", *ROOM_RECORD_FIELDS, "category")
+        .prefetch_related(Prefetch("amenities", queryset=Amenity.objects.only("pk")))
+        .iterator(chunk_size=chunk_size or settings.ROOM_EXPORT_CHUNK_SIZE)
+    )
+    for room in rooms:
+        record = {field: getattr(room, field) for field in ROOM_RECORD_FIELDS}
+        record["id"] = room.pk
+        record["category"] = room.category_id
+        record["amenities"] = sorted(amenity.pk for amenity in room.amenities.all())
+        yield record
+
+
+def iter_catalog_records(queryset=None, chunk_size=None):
+    """
+    partner용 전체 catalog (/api/v1/rooms/export)
+    category는 join, amenity와 photo는 chunk마다 prefetch
+    """
+    if queryset is None:
+        queryset = Room.objects.all()
+    rooms = (
+        queryset.order_by("pk")
+        .select_related("category")
+        .prefetch_related(
+            Prefetch("amenities", queryset=Amenity.objects.only("pk", "name")),
+            Prefetch(
+                "photos",
+                queryset=Photo.objects.only("pk", "file", "description", "room_id"),
+            ),
+        )
+        .iterator(chunk_size=chunk_size or settings.ROOM_EXPORT_CHUNK_SIZE)
+    )
+    for room in rooms:
+        record = {"id": room.pk}
+        record.update({field: getattr(room, field) for field in ROOM_RECORD_FIELDS})
+        record.update(
+            {
+                "category": room.category
+                and {"id": room.category.pk, "name": room.category.name},
+                "amenities": [
+                    {"id": amenity.pk, "name": amenity.name}
+                    for amenity in room.amenities.all()
+                ],
+                "photos": [
+                    {"file": photo.file, "description": photo.description}
+                    for photo in room.photos.all()
+                ],
+                "rating": room.rating(),
+                "review_count": room.review_count,
+                "created_at": room.created_at.isoformat(),
+                "updated_at": room.updated_at.isoformat(),
+            }
+        )
+        yield record
+
+
+def iter_ndjson(records):
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def write_ndjson(records, stream):
+    for line in iter_ndjson(records):
+        stream.write(line)
+
+
+def write_csv(records, stream):
+    writer = csv.DictWriter(stream, fieldnames=ROOM_RECORD_COLUMNS)
+    writer.writeheader()
+    for record in records:
+        writer.writerow(
+            {
+                **record,
+                "amenities": CSV_AMENITY_DELIMITER.join(
+                    str(amenity_id) for amenity_id in record["amenities"]
+                ),
+            }
+        )
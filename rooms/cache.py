@@ -0,0 +1,86 @@
+from django.db.models import OuterRef
+
+from common.cache import get_versions
+from common.conditional import aggregate_subquery, list_state, make_etag
+from medias.models import Photo
+from reviews.models import Review
+from rooms.models import Amenity, Room
+from rooms.serializers import get_liked_room_ids
+
+# 공개 room 응답 cache namespace (rooms.signals에서 무효화)
+ROOM_LIST = "room-list"
+ROOM_DETAIL = "room-detail"
+AMENITY_LIST = "amenity-list"
+
+
+def room_namespace(room_id):
+    return f"room:{room_id}"
+
+
+def personalize(room_data, room_id, owner_id, request):
+    """cache된 공통 payload에 user별 필드(is_owner, is_liked)를 채움"""
+    if "is_owner" in room_data:
+        room_data["is_owner"] = (
+            request.user.is_authenticated and owner_id == request.user.pk
+        )
+    if "is_liked" in room_data:
+        room_data["is_liked"] = room_id in get_liked_room_ids(request)
+    return room_data
+
+
+def amenity_list_state(request, *args, **kwargs):
+    return list_state(Amenity.objects.all())
+
+
+def room_detail_state(request, room_id, *args, **kwargs):
+    """
+    room 상세의 (etag, last_modified)
+    room과 review, photo, amenity, category의 updated_at과 갯수로 계산 (query 1번)
+    응답이 user(is_owner, is_liked)와 삭제에 따라 달라지므로
+    updated_at 최댓값만으로는 판단할 수 없음 -> Last-Modified는 쓰지 않음 (None)
+    """
+    room = (
+        Room.objects.filter(pk=room_id)
+        .annotate(
+            reviews_updated_at=aggregate_subquery(
+                Review.objects.filter(room=OuterRef("pk")), "MAX"
+            ),
+            photos_updated_at=aggregate_subquery(
+                Photo.objects.filter(room=OuterRef("pk")), "MAX"
+            ),
+            photo_count=aggregate_subquery(
+                Photo.objects.filter(room=OuterRef("pk")), "COUNT", "pk"
+            ),
+            amenities_updated_at=aggregate_subquery(
+                Amenity.objects.filter(room=OuterRef("pk")), "MAX"
+            ),
+            amenity_count=aggregate_subquery(
+                Amenity.objects.filter(room=OuterRef("pk")), "COUNT", "pk"
+            ),
+        )
+        .values(
+            "owner_id",
+            "updated_at",
+            "category__updated_at",
+            "review_count",
+            "reviews_updated_at",
+            "photos_updated_at",
+            "photo_count",
+            "amenities_updated_at",
+            "amenity_count",
+        )
+        .first()
+    )
+    if room is None:
+        return None, None
+
+    # 같은 room이라도 query(fields, expand)와 user별 필드에 따라 응답이 달라짐
+    # owner/review 작성자 정보 변경은 updated_at에 없으므로 cache version도 포함
+    etag = make_etag(
+        sorted(room.items()),
+        get_versions(ROOM_DETAIL, room_namespace(room_id)),
+        request.META.get("QUERY_STRING", ""),
+        request.user.pk,
+        int(room_id) in get_liked_room_ids(request),
+    )
+    return etag, None
@@ -0,0 +1,165 @@
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from rooms.geo import within_bbox, within_radius
+from rooms.models import Room, rating_score
+from rooms.search import search_rooms
+
+# ?ordering= 값과 cursor 페이지네이션에 사용할 정렬 (마지막은 항상 id로 tie-break)
+ROOM_ORDERINGS = {
+    "newest": ("-created_at", "-id"),
+    "price": ("price", "id"),
+    "-price": ("-price", "-id"),
+    "rating": ("-rating_score", "-id"),
+    # ?q= 검색 결과의 관련도 순 (q가 있으면 기본값)
+    "relevance": ("search_rank", "-id"),
+    # ?lat=&lng=&radius_km= 에서 가까운 순
+    "distance": ("distance_km", "id"),
+}
+DEFAULT_ROOM_ORDERING = "newest"
+
+
+def get_room_ordering(query_params):
+    """?ordering= (없으면 q가 있을 때 relevance, 아니면 newest)"""
+    default = "relevance" if query_params.get("q") else DEFAULT_ROOM_ORDERING
+    ordering = query_params.get("ordering") or default
+    return ROOM_ORDERINGS.get(ordering, ROOM_ORDERINGS[default])
+
+
+class RoomFilterSerializer(serializers.Serializer):
+    min_price = serializers.IntegerField(required=False, min_value=0)
+    max_price = serializers.IntegerField(required=False, min_value=0)
+    country = serializers.CharField(required=False)
+    city = serializers.CharField(required=False)
+    kind = serializers.ChoiceField(choices=Room.KindChoices.choices, required=False)
+    pet_friendly = serializers.BooleanField(required=False)
+    min_rooms = serializers.IntegerField(required=False, min_value=0)
+    min_toilets = serializers.IntegerField(required=False, min_value=0)
+    category = serializers.IntegerField(required=False)
+    amenities = serializers.CharField(required=False)
+    ordering = serializers.ChoiceField(choices=list(ROOM_ORDERINGS), required=False)
+    q = serializers.CharField(required=False, max_length=100)
+    bbox = serializers.CharField(required=False)
+    lat = serializers.FloatField(required=False, min_value=-90, max_value=90)
+    lng = serializers.FloatField(required=False, min_value=-180, max_value=180)
+    radius_km = serializers.FloatField(required=False, min_value=0, max_value=500)
+
+    def validate_amenities(self, value):
+        """?amenities=1,2,3 -> {1, 2, 3}"""
+        try:
+            return {int(amenity_id) for amenity_id in value.split(",") if amenity_id}
+        except ValueError:
+            raise serializers.ValidationError("amenity id는 숫자로 넣어주세요")
+
+    def validate_bbox(self, value):
+        """?bbox=min_lat,min_lng,max_lat,max_lng (지도 화면 영역)"""
+        try:
+            min_lat, min_lng, max_lat, max_lng = (float(v) for v in value.split(","))
+        except ValueError:
+            raise serializers.ValidationError(
+                "bbox는 min_lat,min_lng,max_lat,max_lng로 넣어주세요"
+            )
+        if not (-90 <= min_lat <= max_lat <= 90 and -180 <= min_lng <= max_lng <= 180):
+            raise serializers.ValidationError("bbox 범위가 이상해요")
+        return min_lat, min_lng, max_lat, max_lng
+
+    def validate(self, attrs):
+        min_price = attrs.get("min_price")
+        max_price = attrs.get("max_price")
+        if min_price is not None and max_price is not None and min_price > max_price:
+            raise serializers.ValidationError("min_price가 max_price보다 크면 오또케")
+        if attrs.get("ordering") == "relevance" and not attrs.get("q"):
+            raise serializers.ValidationError("relevance 정렬은 q가 있어야 해요")
+        radius = [attrs.get(name) is not None for name in ("lat", "lng", "radius_km")]
+        if any(radius) and not all(radius):
+            raise serializers.ValidationError("lat, lng, radius_km를 같이 넣어주세요")
+        if attrs.get("ordering") == "distance" and not all(radius):
+            raise serializers.ValidationError(
+                "distance 정렬은 lat, lng, radius_km가 있어야 해요"
+            )
+        return attrs
+
+
+class RoomFilterBackend(BaseFilterBackend):
+    """
+    /api/v1/rooms 검색 조건
+
+    ?min_price=&max_price=&country=&city=&kind=&pet_friendly=
+    &min_rooms=&min_toilets=&category=&amenities=1,2&q=&ordering=price
+    &bbox=min_lat,min_lng,max_lat,max_lng 또는 &lat=&lng=&radius_km=
+    """
+
+    lookups = {
+        "min_price": "price__gte",
+        "max_price": "price__lte",
+        "country": "country",
+        "city": "city",
+        "kind": "kind",
+        "pet_friendly": "pet_friendly",
+        "min_rooms": "rooms__gte",
+        "min_toilets": "toilets__gte",
+        "category": "category_id",
+    }
+
+    def get_params(self, request):
+        serializer = RoomFilterSerializer(data=request.query_params.dict())
+        if not serializer.is_valid():
+            raise ValidationError(serializer.errors)
+        return serializer.validated_data
+
+    def filter_queryset(self, request, queryset, view):
+        params = self.get_params(request)
+
+        queryset = queryset.filter(
+            **{
+                lookup: params[param]
+                for param, lookup in self.lookups.items()
+                if param in params
+            }
+        )
+
+        if params.get("q"):
+            queryset = search_rooms(queryset, params["q"])
+
+        if "bbox" in params:
+            queryset = within_bbox(queryset, *params["bbox"])
+        if "radius_km" in params:
+            queryset = within_radius(
+                queryset, params["lat"], params["lng"], params["radius_km"]
+            )
+
+        amenities = params.get("amenities")
+        if amenities:
+            queryset = queryset.with_all_amenities(amenities)
+
+        if params.get("ordering") == "rating":
+            queryset = queryset.annotate(rating_score=rating_score())
+        return queryset
+
+
+class RoomAvailabilitySerializer(serializers.Serializer):
+    check_in = serializers.DateField()
+    check_out = serializers.DateField()
+
+    def validate_check_in(self, value):
+        now = timezone.localtime(timezone.now()).date()
+        if now > value:
+            raise serializers.ValidationError("저기요! 과거날짜에는 예약이 안되자나여!")
+        return value
+
+    def validate(self, attrs):
+        if attrs["check_out"] <= attrs["check_in"]:
+            raise serializers.ValidationError("저기여!! 체크아웃이 체크인보다 빠르면 오또케~")
+        return attrs
+
+
+class RoomAvailabilityFilterBackend(BaseFilterBackend):
+    """?check_in=&check_out= 기간에 예약 가능한 room만 남김"""
+
+    def filter_queryset(self, request, queryset, view):
+        serializer = RoomAvailabilitySerializer(data=request.query_params.dict())
+        if not serializer.is_valid():
+            raise ValidationError(serializer.errors)
+        return queryset.available(**serializer.validated_data)
@@ -0,0 +1,118 @@
+import math
+
+from django.db.models import F, FloatField, Q
+from django.db.models.functions import ASin, Cos, Power, Radians, Sin, Sqrt
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 111.32
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    """위도/경도 -> geohash (앞자리가 같을수록 가까운 위치)"""
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    is_lng = True
+    while len(chars) < precision:
+        target, coord = (lng_range, longitude) if is_lng else (lat_range, latitude)
+        middle = (target[0] + target[1]) / 2
+        value <<= 1
+        if coord >= middle:
+            value |= 1
+            target[0] = middle
+        else:
+            target[1] = middle
+        is_lng = not is_lng
+        bits += 1
+        if bits == 5:
+            chars.append(GEOHASH_ALPHABET[value])
+            bits = 0
+            value = 0
+    return "".join(chars)
+
+
+def geohash_cell_size(precision):
+    """precision 자리 geohash 한 칸의 (위도, 경도) 크기"""
+    total_bits = precision * 5
+    lng_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / 2**lat_bits, 360.0 / 2**lng_bits
+
+
+def covering_geohashes(min_lat, min_lng, max_lat, max_lng, max_cells=16):
+    """
+    bbox를 덮는 geohash prefix 목록
+    칸 갯수가 max_cells를 넘지 않는 가장 작은 칸 크기를 사용
+    """
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_size, lng_size = geohash_cell_size(precision)
+        rows = math.floor(max_lat / lat_size) - math.floor(min_lat / lat_size) + 1
+        cols = math.floor(max_lng / lng_size) - math.floor(min_lng / lng_size) + 1
+        if rows * cols <= max_cells:
+            break
+
+    prefixes = set()
+    for row in range(rows):
+        latitude = min(min_lat + row * lat_size, max_lat)
+        for col in range(cols):
+            longitude = min(min_lng + col * lng_size, max_lng)
+            prefixes.add(encode_geohash(latitude, longitude, precision))
+    # 경계가 칸의 끝에 걸리는 경우
+    prefixes.add(encode_geohash(max_lat, max_lng, precision))
+    return sorted(prefixes)
+
+
+def geohash_condition(prefixes, field="geohash"):
+    """
+    prefix들로 시작하는 geohash 조건
+    LIKE 대신 범위 조건으로 index를 사용 ("~"는 alphabet보다 큼)
+    """
+    condition = Q()
+    for prefix in prefixes:
+        condition |= Q(**{f"{field}__gte": prefix, f"{field}__lt": prefix + "~"})
+    return condition
+
+
+def within_bbox(queryset, min_lat, min_lng, max_lat, max_lng):
+    """geohash prefix로 후보를 좁힌 뒤 정확한 위도/경도 범위로 거름"""
+    prefixes = covering_geohashes(min_lat, min_lng, max_lat, max_lng)
+    return queryset.filter(geohash_condition(prefixes)).filter(
+        latitude__range=(min_lat, max_lat),
+        longitude__range=(min_lng, max_lng),
+    )
+
+
+def radius_bbox(latitude, longitude, radius_km):
+    """반경을 감싸는 bbox (min_lat, min_lng, max_lat, max_lng)"""
+    lat_delta = radius_km / KM_PER_DEGREE
+    lng_delta = radius_km / (
+        KM_PER_DEGREE * max(math.cos(math.radians(latitude)), 0.01)
+    )
+    return (
+        max(latitude - lat_delta, -90.0),
+        max(longitude - lng_delta, -180.0),
+        min(latitude + lat_delta, 90.0),
+        min(longitude + lng_delta, 180.0),
+    )
+
+
+def distance_km(latitude, longitude):
+    """(latitude, longitude)부터 room까지 거리 (haversine)"""
+    lat1 = math.radians(latitude)
+    lat2 = Radians(F("latitude"))
+    half_dlat = (lat2 - lat1) / 2
+    half_dlng = (Radians(F("longitude")) - math.radians(longitude)) / 2
+    a = Power(Sin(half_dlat), 2) + math.cos(lat1) * Cos(lat2) * Power(Sin(half_dlng), 2)
+    return ASin(Sqrt(a), output_field=FloatField()) * (2 * EARTH_RADIUS_KM)
+
+
+def within_radius(queryset, latitude, longitude, radius_km):
+    """반경 안의 room만 남기고 distance_km를 annotate"""
+    queryset = within_bbox(queryset, *radius_bbox(latitude, longitude, radius_km))
+    return queryset.annotate(distance_km=distance_km(latitude, longitude)).filter(
+        distance_km__lte=radius_km
+    )
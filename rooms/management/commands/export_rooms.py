@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from rooms.bulk import iter_room_records, write_csv, write_ndjson
+
+WRITERS = {"ndjson": write_ndjson, "csv": write_csv}
+
+
+class Command(BaseCommand):
+    help = "room을 import_rooms와 같은 NDJSON/CSV 형식으로 chunk 단위로 내보냅니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            help="저장할 파일 (없으면 stdout)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=list(WRITERS),
+            default="ndjson",
+        )
+        parser.add_argument("--chunk-size", type=int)
+
+    def handle(self, *args, **options):
+        write = WRITERS[options["format"]]
+        records = iter_room_records(chunk_size=options["chunk_size"])
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as f:
+                write(records, f)
+        else:
+            # stdout.write는 줄바꿈을 붙이므로 그대로 쓰도록
+            self.stdout.ending = ""
+            write(records, self.stdout)
@@ -0,0 +1,52 @@
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from rooms.bulk import import_rooms, parse_csv, parse_ndjson
+
+PARSERS = {"ndjson": parse_ndjson, "csv": parse_csv}
+
+
+class Command(BaseCommand):
+    help = "NDJSON/CSV 파일의 room을 batch 단위로 한번에 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="import할 파일 (- 이면 stdin)")
+        parser.add_argument(
+            "--owner",
+            required=True,
+            help="생성할 room의 owner email",
+        )
+        parser.add_argument(
+            "--format",
+            choices=list(PARSERS),
+            help="파일 형식 (없으면 확장자로 판단, 기본 ndjson)",
+        )
+        parser.add_argument("--batch-size", type=int)
+
+    def handle(self, *args, **options):
+        try:
+            owner = get_user_model().objects.get(email=options["owner"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"{options['owner']} 유저가 없어요")
+
+        path = options["path"]
+        file_format = options["format"] or (
+            "csv" if path.endswith(".csv") else "ndjson"
+        )
+        parse = PARSERS[file_format]
+
+        if path == "-":
+            result = import_rooms(parse(sys.stdin), owner, options["batch_size"])
+        else:
+            with open(path, encoding="utf-8", newline="") as f:
+                result = import_rooms(parse(f), owner, options["batch_size"])
+
+        for error in result["errors"]:
+            self.stderr.write(f"line {error['line']}: {error['errors']}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result['created']}개의 room을 생성했습니다. (에러 {len(result['errors'])}줄)"
+            )
+        )
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from rooms.search import fts5_enabled, rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "room 검색 index(SQLite FTS5)를 room 전체로 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한번에 index할 room 갯수",
+        )
+
+    def handle(self, *args, **options):
+        if not fts5_enabled():
+            self.stdout.write("FTS5를 사용할 수 없어서 icontains 검색을 사용합니다.")
+            return
+        indexed = rebuild_search_index(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"{indexed}개의 room을 index 했습니다."))
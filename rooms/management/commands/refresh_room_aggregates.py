@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from common.cache import bump
+from rooms.cache import ROOM_DETAIL, ROOM_LIST
+from rooms.models import Amenity, Room
+
+
+class Command(BaseCommand):
+    help = "Room에 저장된 집계 컬럼(review_count, rating_sum, amenity_mask)을 다시 계산합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한번의 UPDATE로 갱신할 room 갯수",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+
+        # bit가 없는 amenity(이전에 만들어진 amenity)에 bit 할당
+        for amenity in Amenity.objects.filter(bit=None).order_by("pk"):
+            amenity.assign_bit()
+            if amenity.bit is None:
+                break
+            amenity.save(update_fields=["bit"])
+
+        room_ids = Room.objects.order_by("pk").values_list("pk", flat=True)
+
+        updated = 0
+        last_id = 0
+        while True:
+            batch = list(room_ids.filter(pk__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            rooms = Room.objects.filter(pk__gte=batch[0], pk__lte=batch[-1])
+            updated += rooms.refresh_rating_aggregates()
+            rooms.refresh_amenity_masks()
+            last_id = batch[-1]
+
+        # UPDATE는 signal이 발생하지 않으므로 cache된 응답을 직접 무효화
+        bump(ROOM_LIST, ROOM_DETAIL)
+        self.stdout.write(self.style.SUCCESS(f"{updated}개의 room 집계를 갱신했습니다."))
@@ -1,7 +1,130 @@
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    Exists,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    Func,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce
 
 from common.models import CommonModel
 from config import settings
+from rooms.geo import encode_geohash
+
+
+def rating_score():
+    """Room.rating()과 같은 값 (정렬/annotate용)"""
+    return Case(
+        When(review_count=0, then=0.0),
+        default=F("rating_sum") * 1.0 / F("review_count"),
+        output_field=FloatField(),
+    )
+
+
+class RoomQuerySet(models.QuerySet):
+    def for_list(self, user=None):
+        """RoomListSerializer가 room 갯수와 상관없이 일정한 쿼리로 동작하도록 준비"""
+        if user is not None and user.is_authenticated:
+            is_owner = ExpressionWrapper(
+                Q(owner_id=user.pk),
+                output_field=BooleanField(),
+            )
+        else:
+            is_owner = Value(False)
+
+        return self.prefetch_related("photos").annotate(is_owner=is_owner)
+
+    def with_stats(self):
+        """
+        amenity 갯수(amenity_count)와 평점(rating_score)을 annotate
+        room마다 COUNT query를 하지 않고 목록 query 한번으로 조회
+        """
+        amenity_count = (
+            Room.amenities.through.objects.filter(room=OuterRef("pk"))
+            .order_by()
+            .annotate(count=Func(F("pk"), function="COUNT"))
+            .values("count")
+        )
+        return self.annotate(
+            amenity_count=Coalesce(Subquery(amenity_count), 0),
+            rating_score=rating_score(),
+        )
+
+    def available(self, check_in, check_out):
+        """[check_in, check_out) 기간에 겹치는 예약이 없는 room (anti-join)"""
+        from bookings.models import Booking
+
+        bookings = Booking.objects.overlapping(check_in, check_out).filter(
+            room=OuterRef("pk")
+        )
+        return self.filter(~Exists(bookings))
+
+    def with_all_amenities(self, amenity_ids):
+        """
+        amenity를 모두 가진 room
+        amenity_mask & mask = mask 조건 하나로 확인 (join 없음)
+        bit가 없는 amenity(64번째 이후)만 through 테이블로 확인
+        """
+        bits = dict(Amenity.objects.filter(id__in=amenity_ids).values_list("id", "bit"))
+        if len(bits) < len(set(amenity_ids)):
+            return self.none()
+
+        queryset = self
+        mask = sum(1 << bit for bit in bits.values() if bit is not None)
+        if mask:
+            queryset = queryset.alias(
+                matched_amenity_mask=F("amenity_mask").bitand(mask)
+            ).filter(matched_amenity_mask=mask)
+
+        without_bit = [amenity_id for amenity_id, bit in bits.items() if bit is None]
+        if without_bit:
+            rooms = (
+                Room.amenities.through.objects.filter(amenity_id__in=without_bit)
+                .values("room_id")
+                .annotate(matched=Count("amenity_id"))
+                .filter(matched=len(without_bit))
+                .values("room_id")
+            )
+            queryset = queryset.filter(id__in=rooms)
+        return queryset
+
+    def refresh_amenity_masks(self):
+        """amenity_mask를 through 테이블 기준으로 다시 계산"""
+        masks = (
+            Room.amenities.through.objects.filter(
+                room=OuterRef("pk"), amenity__bit__isnull=False
+            )
+            .order_by()
+            .values("room")
+            .annotate(mask=Sum(Value(1).bitleftshift(F("amenity__bit"))))
+            .values("mask")
+        )
+        return self.update(amenity_mask=Coalesce(Subquery(masks), 0))
+
+    def refresh_rating_aggregates(self):
+        """review_count / rating_sum을 reviews 테이블 기준으로 다시 계산"""
+        from reviews.models import Review
+
+        reviews = Review.objects.filter(room=OuterRef("pk")).order_by().values("room")
+        return self.update(
+            review_count=Coalesce(
+                Subquery(reviews.annotate(count=Count("pk")).values("count")), 0
+            ),
+            rating_sum=Coalesce(
+                Subquery(reviews.annotate(total=Sum("rating")).values("total")), 0
+            ),
+        )
 
 
 class Room(CommonModel):
@@ -57,33 +180,144 @@ class Room(CommonModel):
         on_delete=models.SET_NULL,
     )
 
+    latitude = models.FloatField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-90), MaxValueValidator(90)],
+    )
+    longitude = models.FloatField(
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(-180), MaxValueValidator(180)],
+    )
+    # 위치 검색용 (rooms.geo), save할 때 latitude/longitude로 계산
+    geohash = models.CharField(
+        max_length=12,
+        blank=True,
+        default="",
+        editable=False,
+    )
+
+    # amenity 조건 검색용 (1 << Amenity.bit 의 합), rooms.signals에서 갱신
+    amenity_mask = models.BigIntegerField(
+        default=0,
+        editable=False,
+    )
+
+    # reviews.signals에서 review 생성/수정/삭제시 갱신하는 집계 컬럼
+    review_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+    rating_sum = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+    )
+
+    objects = RoomQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # /api/v1/rooms cursor 페이지네이션
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="room_created_at_id_idx",
+            ),
+            # /api/v1/rooms 검색 조건 (rooms.filters.RoomFilterBackend)
+            models.Index(
+                fields=["price", "id"],
+                name="room_price_id_idx",
+            ),
+            models.Index(
+                fields=["country", "city", "price"],
+                name="room_location_price_idx",
+            ),
+            models.Index(
+                fields=["kind", "pet_friendly", "price"],
+                name="room_kind_pet_price_idx",
+            ),
+            models.Index(
+                fields=["category", "price"],
+                name="room_category_price_idx",
+            ),
+            # 지도 영역/반경 검색 (geohash prefix 범위 조건)
+            models.Index(
+                fields=["geohash"],
+                name="room_geohash_idx",
+            ),
+        ]
+
+    # signal에서 F()/UPDATE로만 갱신하는 컬럼
+    AGGREGATE_FIELDS = ("amenity_mask", "review_count", "rating_sum")
+
+    def save(self, *args, **kwargs):
+        self.update_geohash()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None:
+            if not self._state.adding and not kwargs.get("force_insert"):
+                # 불러온 뒤 signal에서 갱신된 집계 값을 이전 값으로 덮어쓰지 않도록 제외
+                kwargs["update_fields"] = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key and field.name not in self.AGGREGATE_FIELDS
+                ]
+        elif {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "geohash"}
+        super().save(*args, **kwargs)
+
+    def update_geohash(self):
+        if self.latitude is None or self.longitude is None:
+            self.geohash = ""
+        else:
+            self.geohash = encode_geohash(self.latitude, self.longitude)
+
     def total_amenities(self):
+        # RoomQuerySet.with_stats()로 조회했으면 annotate된 값 사용
+        if hasattr(self, "amenity_count"):
+            return self.amenity_count
         return self.amenities.count()
 
-    def rating(room):
-        count = room.reviews.count()
-        if count == 0:
+    def rating(self):
+        if self.review_count == 0:
             return 0
-
-        total_rating = 0
-        for review in room.reviews.all().values("rating"):
-            total_rating += review["rating"]
-        return round(total_rating / count, 2)
+        return round(self.rating_sum / self.review_count, 2)
 
     def __str__(self):
         return self.title
 
 
 class Amenity(CommonModel):
+    # Room.amenity_mask에서 사용하는 bit (BigIntegerField라 63개까지)
+    MAX_BITS = 63
+
     name = models.CharField(max_length=150)
     description = models.CharField(
         max_length=150,
         null=True,
         blank=True,
     )
+    bit = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        unique=True,
+        editable=False,
+    )
 
     class Meta:
         verbose_name_plural = "amenities"
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and self.bit is None:
+            self.assign_bit()
+        super().save(*args, **kwargs)
+
+    def assign_bit(self):
+        """사용하지 않는 가장 작은 bit (모두 사용중이면 None)"""
+        used = set(Amenity.objects.exclude(bit=None).values_list("bit", flat=True))
+        self.bit = next(
+            (bit for bit in range(self.MAX_BITS) if bit not in used),
+            None,
+        )
+
     def __str__(self):
         return self.name
@@ -0,0 +1,20 @@
+from django.conf import settings
+
+from common.pagination import NewestFirstCursorPagination
+from rooms.filters import get_room_ordering
+
+
+class RoomCursorPagination(NewestFirstCursorPagination):
+    page_size = settings.ROOMS_PAGE_SIZE
+
+    def get_ordering(self, request, queryset, view):
+        return get_room_ordering(request.query_params)
+
+
+class RoomReviewCursorPagination(NewestFirstCursorPagination):
+    page_size = settings.PAGE_SIZE
+
+    def get_paginated_response(self, data, count=None):
+        response = super().get_paginated_response(data)
+        response.data = {"count": count, **response.data}
+        return response
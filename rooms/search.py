@@ -0,0 +1,136 @@
+import re
+import sqlite3
+from functools import lru_cache
+
+from django.db import connections
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+from rooms.models import Room
+
+# SQLite FTS5 역색인 (rowid = room id)
+ROOM_SEARCH_TABLE = "rooms_room_search"
+ROOM_SEARCH_FIELDS = ("title", "description", "address", "city")
+
+
+@lru_cache
+def _sqlite_has_fts5():
+    connection = sqlite3.connect(":memory:")
+    try:
+        connection.execute("CREATE VIRTUAL TABLE t USING fts5(a)")
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        connection.close()
+
+
+def fts5_enabled(using="default"):
+    """FTS5를 못쓰는 DB에서는 icontains 검색으로 대체"""
+    return connections[using].vendor == "sqlite" and _sqlite_has_fts5()
+
+
+def get_search_terms(query):
+    """공백/특수문자로 나눈 검색어 (최대 10개)"""
+    return re.findall(r"\w+", query)[:10]
+
+
+def _match_expression(terms):
+    # 각 단어를 prefix 검색 ("서울"* -> 서울역, 서울시), 모든 단어를 포함해야함
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def create_search_table(using="default"):
+    if not fts5_enabled(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {ROOM_SEARCH_TABLE} "
+            f"USING fts5({', '.join(ROOM_SEARCH_FIELDS)}, tokenize='unicode61')"
+        )
+
+
+def index_rooms(rooms, using="default"):
+    """room(들)의 검색 index를 추가/갱신"""
+    if not fts5_enabled(using):
+        return
+    rows = [
+        (room.pk, *(getattr(room, field) for field in ROOM_SEARCH_FIELDS))
+        for room in rooms
+    ]
+    if not rows:
+        return
+    with connections[using].cursor() as cursor:
+        cursor.executemany(
+            f"INSERT OR REPLACE INTO {ROOM_SEARCH_TABLE} "
+            f"(rowid, {', '.join(ROOM_SEARCH_FIELDS)}) "
+            f"VALUES ({', '.join(['%s'] * len(rows[0]))})",
+            rows,
+        )
+
+
+def unindex_rooms(room_ids, using="default"):
+    if not fts5_enabled(using):
+        return
+    with connections[using].cursor() as cursor:
+        cursor.executemany(
+            f"DELETE FROM {ROOM_SEARCH_TABLE} WHERE rowid = %s",
+            [(room_id,) for room_id in room_ids],
+        )
+
+
+def rebuild_search_index(batch_size=1000, using="default"):
+    """검색 index를 비우고 room 전체를 다시 넣음"""
+    if not fts5_enabled(using):
+        return 0
+    create_search_table(using)
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {ROOM_SEARCH_TABLE}")
+
+    indexed = 0
+    rooms = Room.objects.using(using).only("pk", *ROOM_SEARCH_FIELDS).order_by("pk")
+    last_id = 0
+    while batch := list(rooms.filter(pk__gt=last_id)[:batch_size]):
+        index_rooms(batch, using)
+        indexed += len(batch)
+        last_id = batch[-1].pk
+    return indexed
+
+
+def search_rooms(queryset, query):
+    """
+    검색어를 모두 포함하는 room만 남기고 search_rank(작을수록 관련도 높음)를 annotate
+    FTS5: bm25 rank / 그 외: title, description, address, city icontains
+    """
+    terms = get_search_terms(query)
+    if not terms:
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    if not fts5_enabled(queryset.db):
+        condition = Q()
+        for term in terms:
+            term_condition = Q()
+            for field in ROOM_SEARCH_FIELDS:
+                term_condition |= Q(**{f"{field}__icontains": term})
+            condition &= term_condition
+        return queryset.filter(condition).annotate(
+            search_rank=Value(0.0, output_field=FloatField())
+        )
+
+    match = _match_expression(terms)
+    room_table = Room._meta.db_table
+    return queryset.filter(
+        id__in=RawSQL(
+            f"SELECT rowid FROM {ROOM_SEARCH_TABLE} "
+            f"WHERE {ROOM_SEARCH_TABLE} MATCH %s",
+            (match,),
+        )
+    ).annotate(
+        search_rank=RawSQL(
+            f"SELECT rank FROM {ROOM_SEARCH_TABLE} "
+            f"WHERE {ROOM_SEARCH_TABLE} MATCH %s "
+            f'AND rowid = "{room_table}"."id"',
+            (match,),
+            output_field=FloatField(),
+        )
+    )
@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 from rest_framework.serializers import ModelSerializer
 
@@ -7,26 +8,55 @@ from reviews.serializers import ReviewSerializer
 from rooms.models import Amenity, Room
 from users.serializers import TinyUserSerializer
 from wishlists.models import Wishlist
-from medias.serializers import PhotoSerializer
 
 
 class AmenitySerializer(ModelSerializer):
     class Meta:
         model = Amenity
-        fields = "__all__"
+        # bit는 amenity_mask 검색용 내부 값이라 내보내지 않음
+        fields = (
+            "id",
+            "created_at",
+            "updated_at",
+            "name",
+            "description",
+        )
+
+
+def get_liked_room_ids(request):
+    """요청한 user가 좋아요한 room id를 request당 한번만 조회해서 재사용"""
+    if not (request and request.user.is_authenticated):
+        return set()
+
+    liked_room_ids = getattr(request, "_liked_room_ids", None)
+    if liked_room_ids is None:
+        liked_room_ids = Wishlist.objects.liked_room_ids(request.user)
+        request._liked_room_ids = liked_room_ids
+    return liked_room_ids
+
+
+class LikedRoomMixin:
+    """is_liked를 room마다 쿼리하지 않고 get_liked_room_ids로 확인"""
 
+    def get_is_liked(self, room: Room):
+        return room.id in get_liked_room_ids(self.context.get("request"))
+
+
+class RoomDetailSerializer(LikedRoomMixin, ModelSerializer):
+    """
+    fields: 응답에 포함할 필드 (None이면 전체)
+    expand: 포함할 nested collection (None이면 전체, expandable_fields 중에서)
+    """
+
+    expandable_fields = ("amenities", "reviews", "photos")
 
-class RoomDetailSerializer(ModelSerializer):
     is_owner = serializers.SerializerMethodField()
     owner = TinyUserSerializer(read_only=True)
     amenities = AmenitySerializer(read_only=True, many=True, required=False)
     category = CategorySerializer(read_only=True)
 
     rating = serializers.SerializerMethodField()
-    reviews = ReviewSerializer(
-        many=True,
-        read_only=True,
-    )
+    reviews = serializers.SerializerMethodField()
     photos = PhotoSerializer(read_only=True, many=True)
     is_liked = serializers.SerializerMethodField()
 
@@ -42,6 +72,8 @@ class RoomDetailSerializer(ModelSerializer):
             "toilets",
             "description",
             "address",
+            "latitude",
+            "longitude",
             "pet_friendly",
             "kind",
             "owner",
@@ -57,20 +89,33 @@ class RoomDetailSerializer(ModelSerializer):
             "is_liked",
         )
 
-    def get_is_liked(self, room: Room):
-        request = self.context.get("request")
-        if request and request.user.is_authenticated:
-            return Wishlist.objects.filter(
-                user=request.user, rooms__id=room.id
-            ).exists()
-        return False
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        allowed = set(self.fields) if fields is None else set(fields)
+        if expand is not None:
+            allowed -= set(self.expandable_fields) - set(expand)
+            if fields is not None:
+                allowed |= set(expand) & set(self.expandable_fields)
+
+        for field_name in set(self.fields) - allowed:
+            self.fields.pop(field_name)
 
     def get_is_owner(self, room: Room):
         request = self.context.get("request")
         if request:
-            return room.owner == request.user
+            return room.owner_id == request.user.pk
         return False
 
+    def get_reviews(self, room: Room):
+        # 전체 review 대신 최신 review 일부만 포함
+        reviews = room.reviews.select_related("user").order_by("-created_at", "-id")
+        return ReviewSerializer(
+            reviews[: settings.ROOM_DETAIL_REVIEWS],
+            many=True,
+            context=self.context,
+        ).data
+
     def create(self, validated_data):
         return Room.objects.create(**validated_data)
 
@@ -78,10 +123,11 @@ class RoomDetailSerializer(ModelSerializer):
         return room.rating()
 
 
-class RoomListSerializer(ModelSerializer):
+class RoomListSerializer(LikedRoomMixin, ModelSerializer):
     is_owner = serializers.SerializerMethodField()
     rating = serializers.SerializerMethodField()
     photos = PhotoSerializer(many=True)
+    is_liked = serializers.SerializerMethodField()
 
     class Meta:
         model = Room
@@ -90,17 +136,23 @@ class RoomListSerializer(ModelSerializer):
             "title",
             "country",
             "city",
+            "latitude",
+            "longitude",
             "price",
             "rating",
             "is_owner",
             "photos",
+            "is_liked",
         )
 
     def get_rating(self, room: Room):
         return room.rating()
 
     def get_is_owner(self, room: Room):
+        # Room.objects.for_list()에서 annotate된 값이 있으면 그대로 사용
+        if hasattr(room, "is_owner"):
+            return room.is_owner
         if self.context.get("request", False):
             request = self.context["request"]
-            return room.owner == request.user
+            return room.owner_id == request.user.pk
         return False
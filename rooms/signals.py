@@ -0,0 +1,142 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
+
+from categories.models import Category
+from common.cache import bump_on_commit
+from medias.models import Photo
+from reviews.models import Review
+from rooms.cache import AMENITY_LIST, ROOM_DETAIL, ROOM_LIST, room_namespace
+from rooms.models import Amenity, Room
+from rooms.search import create_search_table, index_rooms, unindex_rooms
+from users.models import TokenClaimsUser
+from users.serializers import TinyUserSerializer
+
+
+def _bump_rooms(*room_ids):
+    bump_on_commit(
+        ROOM_LIST, *(room_namespace(room_id) for room_id in room_ids if room_id)
+    )
+
+
+@receiver(post_save, sender=Room)
+@receiver(post_delete, sender=Room)
+def invalidate_room(sender, instance: Room, **kwargs):
+    _bump_rooms(instance.pk)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def invalidate_review_room(sender, instance: Review, **kwargs):
+    # reviews.signals보다 먼저 실행되므로 _loaded_values는 변경 전 값
+    loaded = getattr(instance, "_loaded_values", None) or {}
+    _bump_rooms(instance.room_id, loaded.get("room_id"))
+
+
+@receiver(post_save, sender=Photo)
+@receiver(post_delete, sender=Photo)
+def invalidate_photo_room(sender, instance: Photo, **kwargs):
+    _bump_rooms(instance.room_id)
+
+
+@receiver(m2m_changed, sender=Room.amenities.through)
+def invalidate_room_amenities(sender, instance, action, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if isinstance(instance, Room):
+        _bump_rooms(instance.pk)
+    else:
+        # amenity.room_set 쪽에서 변경한 경우
+        bump_on_commit(ROOM_LIST, ROOM_DETAIL)
+
+
+@receiver(post_save, sender=Amenity)
+@receiver(post_delete, sender=Amenity)
+def invalidate_amenity(sender, instance: Amenity, **kwargs):
+    bump_on_commit(AMENITY_LIST, ROOM_LIST, ROOM_DETAIL)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_rooms(sender, instance: Category, **kwargs):
+    bump_on_commit(ROOM_LIST, ROOM_DETAIL)
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_save, sender=TokenClaimsUser)
+def invalidate_owner_rooms(sender, instance, created, update_fields=None, **kwargs):
+    # room 상세에 owner와 review 작성자 정보(TinyUserSerializer)가 포함됨
+    # 이 user가 owner이거나 review를 쓴 room의 상세 cache만 무효화
+    if created:
+        return
+    if update_fields is not None and not (
+        set(update_fields) & set(TinyUserSerializer.Meta.fields)
+    ):
+        return
+    room_ids = (
+        Room.objects.filter(owner=instance)
+        .values_list("pk", flat=True)
+        .union(
+            Review.objects.filter(user=instance, room__isnull=False).values_list(
+                "room_id", flat=True
+            )
+        )
+    )
+    namespaces = [room_namespace(room_id) for room_id in room_ids]
+    if namespaces:
+        bump_on_commit(*namespaces)
+
+
+@receiver(post_migrate)
+def create_room_search_table(sender, using, **kwargs):
+    if sender.name == "rooms":
+        create_search_table(using)
+
+
+@receiver(post_save, sender=Room)
+def index_room(sender, instance: Room, using, **kwargs):
+    index_rooms([instance], using)
+
+
+@receiver(post_delete, sender=Room)
+def unindex_room(sender, instance: Room, using, **kwargs):
+    unindex_rooms([instance.pk], using)
+
+
+@receiver(m2m_changed, sender=Room.amenities.through)
+def refresh_room_amenity_mask(sender, instance, action, pk_set, **kwargs):
+    if isinstance(instance, Room):
+        if action in ("post_add", "post_remove", "post_clear"):
+            Room.objects.filter(pk=instance.pk).refresh_amenity_masks()
+            # instance의 amenity_mask도 갱신된 값으로 맞춤
+            instance.refresh_from_db(fields=["amenity_mask"])
+        return
+
+    # amenity.room_set 쪽에서 변경한 경우 pk_set은 room id
+    if action == "pre_clear":
+        instance._cleared_room_ids = list(
+            instance.room_set.values_list("pk", flat=True)
+        )
+    elif action in ("post_add", "post_remove"):
+        Room.objects.filter(pk__in=pk_set).refresh_amenity_masks()
+    elif action == "post_clear":
+        room_ids = getattr(instance, "_cleared_room_ids", [])
+        Room.objects.filter(pk__in=room_ids).refresh_amenity_masks()
+
+
+@receiver(pre_delete, sender=Amenity)
+def remember_amenity_rooms(sender, instance: Amenity, **kwargs):
+    # 삭제시 through row는 m2m_changed 없이 지워지므로 room을 기억해둠
+    instance._room_ids = list(instance.room_set.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Amenity)
+def refresh_amenity_rooms_mask(sender, instance: Amenity, **kwargs):
+    room_ids = getattr(instance, "_room_ids", [])
+    Room.objects.filter(pk__in=room_ids).refresh_amenity_masks()
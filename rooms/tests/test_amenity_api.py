@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
@@ -21,6 +22,7 @@ def amenity_detail_url(amenity_id: int) -> str:
 
 class PublicAmenityAPITests(TestCase):
     def setUp(self) -> None:
+        cache.clear()
         self.default_object_create = DefaultObjectCreate()
         self.client = APIClient()
 
@@ -34,6 +36,14 @@ class PublicAmenityAPITests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, serializer.data)
 
+    def test_amenity_bit_not_exposed(self):
+        amenity = self.default_object_create.create_amenity(name="item1")
+
+        res = self.client.get(AMENITY_URL)
+        self.assertNotIn("bit", res.data[0])
+        res = self.client.get(amenity_detail_url(amenity.id))
+        self.assertNotIn("bit", res.data)
+
     def test_create_amenity(self):
         """post"""
         payload = {
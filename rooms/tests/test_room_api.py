@@ -1,11 +1,13 @@
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
 from common.utils import DefaultObjectCreate, create_user
 from config.snippets import get_tokens_for_user
+from medias.models import Photo
 from reviews.serializers import ReviewSerializer
 from rooms.models import Room
 from rooms.serializers import RoomListSerializer, RoomDetailSerializer
@@ -53,6 +55,37 @@ class PublicRoomAPisTest(TestCase):
 
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
+    def test_get_rooms_cursor_pagination(self):
+        """next cursor를 따라가면 모든 room을 최신순으로 중복없이 조회"""
+        rooms = [
+            self.default_object_create.create_room(owner=self.user, title=f"room{i}")
+            for i in range(25)
+        ]
+        expected_ids = [
+            room.id
+            for room in sorted(rooms, key=lambda r: (r.created_at, r.id), reverse=True)
+        ]
+
+        ids = []
+        pages = []
+        url = f"{ROOM_URL}?page_size=10"
+        while url:
+            res = self.client.get(url)
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            pages.append(res.data)
+            ids += [room["id"] for room in res.data["results"]]
+            url = res.data["next"]
+
+        self.assertEqual(ids, expected_ids)
+        self.assertEqual([len(page["results"]) for page in pages], [10, 10, 5])
+        self.assertIsNone(pages[0]["previous"])
+
+        res = self.client.get(pages[-1]["previous"])
+        self.assertEqual(
+            [room["id"] for room in res.data["results"]],
+            expected_ids[10:20],
+        )
+
     def test_get_room_reviews(self):
         room = self.default_object_create.create_room(owner=self.user)
         # experience = self.default_object_create.create_experience(host=self.user)
@@ -70,9 +103,12 @@ class PublicRoomAPisTest(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
         room = Room.objects.get(id=room.id)
-        serializer = ReviewSerializer(room.reviews.all(), many=True)
+        serializer = ReviewSerializer(
+            room.reviews.order_by("-created_at", "-id"), many=True
+        )
 
-        self.assertEqual(serializer.data, res.data)
+        self.assertEqual(serializer.data, res.data["results"])
+        self.assertEqual(res.data["count"], 1)
 
     def test_get_room_reviews_with_pagination(self):
         room = self.default_object_create.create_room(owner=self.user)
@@ -85,14 +121,23 @@ class PublicRoomAPisTest(TestCase):
                 rating=3,
             )
 
-        for page in range(1, 5):
-            url = f"/api/v1/rooms/{room.id}/reviews/?page={page}"
+        expected_ids = list(
+            room.reviews.order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+
+        ids = []
+        page_lengths = []
+        url = room_review_url(room.id)
+        while url:
             res = self.client.get(url)
             self.assertEqual(res.status_code, status.HTTP_200_OK)
-            if page != 4:
-                self.assertEqual(len(res.data), 3)
-            else:
-                self.assertEqual(len(res.data), 1)
+            self.assertEqual(res.data["count"], 10)
+            page_lengths.append(len(res.data["results"]))
+            ids += [review["id"] for review in res.data["results"]]
+            url = res.data["next"]
+
+        self.assertEqual(page_lengths, [3, 3, 3, 1])
+        self.assertEqual(ids, expected_ids)
 
 
 class PrivateRoomAPisTest(TestCase):
@@ -106,6 +151,7 @@ class PrivateRoomAPisTest(TestCase):
     """
 
     def setUp(self):
+        cache.clear()
         self.default_object_create = DefaultObjectCreate()
         self.user = self.default_object_create.create_user()
         self.client = APIClient()
@@ -134,6 +180,28 @@ class PrivateRoomAPisTest(TestCase):
         # self.assertTrue(is_owner)  # 작성자가 같은지 비교
         # self.assertEqual(res.data[0], serializer.data[0])
 
+    def test_get_rooms_constant_queries(self):
+        """room 갯수와 상관없이 GET /rooms 쿼리 수가 일정한지 확인"""
+        other_user = create_user(email="other@example.com", password="test123!@#")
+        for i in range(10):
+            owner = self.user if i % 2 else other_user
+            room = self.default_object_create.create_room(owner=owner)
+            Photo.objects.create(file="http://example.com", description="", room=room)
+            self.default_object_create.create_review(
+                user=self.user, room=room, payload="review", rating=i % 5 + 1
+            )
+
+        # rooms, photos, 좋아요한 room id
+        with self.assertNumQueries(3):
+            res = self.client.get(ROOM_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        for room_data in res.data["results"]:
+            room = Room.objects.get(id=room_data["id"])
+            self.assertEqual(room_data["is_owner"], room.owner == self.user)
+            self.assertEqual(room_data["rating"], room.rating())
+            self.assertEqual(len(room_data["photos"]), 1)
+
     def test_get_room_exact_fields(self):
         """매칠되는 필드만 조회"""
         room = self.default_object_create.create_room(owner=self.user)
@@ -148,7 +216,7 @@ class PrivateRoomAPisTest(TestCase):
         )
 
         url = room_detail_url(room.id)
-        res = self.client.get(url)
+        res = self.client.get(f"{url}?expand=reviews")
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         target_keys = [
@@ -157,6 +225,83 @@ class PrivateRoomAPisTest(TestCase):
         for key in target_keys:
             self.assertIn(key, res.data)
 
+    def test_get_room_without_expand(self):
+        """expand 하지 않으면 nested collection은 조회하지 않음"""
+        room = self.default_object_create.create_room(owner=self.user)
+        room.amenities.add(self.default_object_create.create_amenity(name="item1"))
+        Photo.objects.create(file="http://example.com", description="", room=room)
+
+        url = room_detail_url(room.id)
+        # ETag 상태, 좋아요한 room id, room(owner, category, total_amenities)
+        with self.assertNumQueries(3):
+            res = self.client.get(url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        for key in ["reviews", "photos", "amenities"]:
+            self.assertNotIn(key, res.data)
+        self.assertTrue(res.data["is_owner"])
+
+        res = self.client.get(f"{url}?expand=photos,amenities")
+        self.assertEqual(len(res.data["photos"]), 1)
+        self.assertEqual(len(res.data["amenities"]), 1)
+        self.assertNotIn("reviews", res.data)
+
+    def test_get_room_selected_fields(self):
+        room = self.default_object_create.create_room(owner=self.user)
+
+        url = room_detail_url(room.id)
+        # ETag 상태, 좋아요한 room id, room
+        with self.assertNumQueries(3):
+            res = self.client.get(f"{url}?fields=id,title,price")
+        self.assertEqual(set(res.data), {"id", "title", "price"})
+
+        res = self.client.get(f"{url}?fields=id,title&expand=reviews")
+        self.assertEqual(set(res.data), {"id", "title", "reviews"})
+
+    @override_settings(ROOM_DETAIL_REVIEWS=3)
+    def test_get_room_recent_reviews_only(self):
+        room = self.default_object_create.create_room(owner=self.user)
+        reviews = [
+            self.default_object_create.create_review(
+                user=self.user, room=room, payload=f"review{i}", rating=3
+            )
+            for i in range(5)
+        ]
+
+        res = self.client.get(f"{room_detail_url(room.id)}?expand=reviews")
+
+        self.assertEqual(
+            [review["id"] for review in res.data["reviews"]],
+            [review.id for review in reversed(reviews)][:3],
+        )
+
+    def test_create_and_update_room_amenities_with_form_data(self):
+        """form 요청은 amenities=1&amenities=2 형식"""
+        category = self.default_object_create.create_category(kind="rooms")
+        item1, item2 = [
+            self.default_object_create.create_amenity(name=f"item{i}")
+            for i in range(1, 3)
+        ]
+        payload = self.default_object_create.room_defaults.copy()
+        payload.update({"category": category.id, "amenities": [item1.id, item2.id]})
+
+        res = self.client.post(ROOM_URL, payload, format="multipart")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        room = Room.objects.get(id=res.data["id"])
+        self.assertCountEqual(
+            room.amenities.values_list("id", flat=True), [item1.id, item2.id]
+        )
+
+        res = self.client.put(
+            room_detail_url(room.id),
+            {"amenities": [item2.id], "amenities_mode": "replace"},
+            format="multipart",
+        )
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(room.amenities.values_list("id", flat=True), [item2.id])
+
     def test_create_rooms_with_amenity(self):
         """2. POST /rooms -> rooms 생성"""
         payload = self.default_object_create.room_defaults.copy()
@@ -351,3 +496,74 @@ class PrivateRoomAPisTest(TestCase):
         room.refresh_from_db()
         after_serializer = RoomDetailSerializer(room)
         self.assertEqual(before_serializer.data, after_serializer.data)
+
+    def test_create_room_with_many_amenities_bulk(self):
+        """amenity 갯수와 상관없이 query 수가 일정해야함"""
+        category = self.default_object_create.create_category(kind="rooms")
+        amenities = [
+            self.default_object_create.create_amenity(name=f"item{i}")
+            for i in range(50)
+        ]
+        payload = self.default_object_create.room_defaults.copy()
+        payload.update(
+            {
+                "category": category.id,
+                "amenities": [amenity.id for amenity in amenities],
+            }
+        )
+
+        with self.assertNumQueries(15):
+            res = self.client.post(ROOM_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        room = Room.objects.get(id=res.data["id"])
+        self.assertEqual(room.amenities.count(), 50)
+
+    def test_create_room_missing_amenities_message(self):
+        category = self.default_object_create.create_category(kind="rooms")
+        amenity = self.default_object_create.create_amenity(name="item1")
+        payload = self.default_object_create.room_defaults.copy()
+        payload.update({"category": category.id, "amenities": [amenity.id, 300, 200]})
+
+        res = self.client.post(ROOM_URL, payload, format="json")
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("[200, 300]", res.data["detail"])
+        self.assertFalse(Room.objects.exists())
+
+    def test_update_room_amenities_append_and_replace(self):
+        room = self.default_object_create.create_room(owner=self.user)
+        item1, item2, item3 = [
+            self.default_object_create.create_amenity(name=f"item{i}")
+            for i in range(1, 4)
+        ]
+        room.amenities.add(item1)
+        url = room_detail_url(room.id)
+
+        # 기본은 append
+        res = self.client.put(url, {"amenities": [item2.id]}, format="json")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(
+            room.amenities.values_list("id", flat=True), [item1.id, item2.id]
+        )
+        self.assertEqual(res.data["total_amenities"], 2)
+
+        res = self.client.put(
+            url,
+            {"amenities": [item3.id], "amenities_mode": "replace"},
+            format="json",
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(room.amenities.values_list("id", flat=True), [item3.id])
+        self.assertEqual(res.data["total_amenities"], 1)
+
+        res = self.client.put(
+            url, {"amenities": [], "amenities_mode": "replace"}, format="json"
+        )
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertFalse(room.amenities.exists())
+
+        res = self.client.put(
+            url, {"amenities": [item1.id], "amenities_mode": "merge"}, format="json"
+        )
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,193 @@
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from common.utils import DefaultObjectCreate
+from medias.models import Photo
+from wishlists.models import Wishlist
+
+ROOM_URL = reverse("rooms:room-list")
+AMENITY_URL = reverse("rooms:amenity-list")
+CATEGORY_URL = reverse("category:list")
+
+generator = DefaultObjectCreate()
+
+
+def detail_url(room_id):
+    return reverse("rooms:room-detail", args=(room_id,))
+
+
+class RoomResponseCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = generator.create_user()
+        self.guest = generator.create_user(email="guest@example.com")
+        self.room = generator.create_room(owner=self.owner, title="cached")
+        self.client = APIClient()
+
+    def test_room_list_cached(self):
+        self.client.get(ROOM_URL)
+
+        with self.assertNumQueries(0):
+            res = self.client.get(ROOM_URL)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["results"][0]["title"], "cached")
+
+    def test_room_list_cache_is_per_query(self):
+        self.client.get(ROOM_URL)
+
+        res = self.client.get(f"{ROOM_URL}?min_price=999999")
+        self.assertEqual(res.data["results"], [])
+
+    def test_room_detail_cached(self):
+        self.client.get(detail_url(self.room.id))
+
+        # ETag 상태 조회만
+        with self.assertNumQueries(1):
+            res = self.client.get(detail_url(self.room.id))
+        self.assertEqual(res.data["title"], "cached")
+
+    def test_room_detail_not_found_not_cached(self):
+        res = self.client.get(detail_url(self.room.id + 100))
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+        room = generator.create_room(owner=self.owner, title="new")
+        res = self.client.get(detail_url(room.id))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_user_fields_not_shared(self):
+        """cache된 응답이라도 is_owner, is_liked는 요청한 user 기준"""
+        wishlist = Wishlist.objects.create(user=self.guest, name="wish")
+        wishlist.rooms.add(self.room)
+
+        self.client.force_authenticate(self.owner)
+        res = self.client.get(detail_url(self.room.id))
+        self.assertTrue(res.data["is_owner"])
+        self.assertFalse(res.data["is_liked"])
+
+        self.client.force_authenticate(self.guest)
+        res = self.client.get(detail_url(self.room.id))
+        self.assertFalse(res.data["is_owner"])
+        self.assertTrue(res.data["is_liked"])
+
+        res = self.client.get(ROOM_URL)
+        self.assertFalse(res.data["results"][0]["is_owner"])
+        self.assertTrue(res.data["results"][0]["is_liked"])
+
+    def test_room_update_invalidates(self):
+        self.client.get(ROOM_URL)
+        self.client.get(detail_url(self.room.id))
+
+        self.room.title = "changed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.room.save()
+
+        res = self.client.get(ROOM_URL)
+        self.assertEqual(res.data["results"][0]["title"], "changed")
+        res = self.client.get(detail_url(self.room.id))
+        self.assertEqual(res.data["title"], "changed")
+
+    def test_review_invalidates(self):
+        self.client.get(ROOM_URL)
+        self.client.get(detail_url(self.room.id))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            generator.create_review(
+                user=self.guest, room=self.room, payload="hi", rating=4
+            )
+
+        res = self.client.get(ROOM_URL)
+        self.assertEqual(res.data["results"][0]["rating"], 4)
+        res = self.client.get(detail_url(self.room.id))
+        self.assertEqual(res.data["rating"], 4)
+
+    def test_photo_invalidates(self):
+        self.client.get(ROOM_URL)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Photo.objects.create(room=self.room, file="https://example.com/a.jpg")
+
+        res = self.client.get(ROOM_URL)
+        self.assertEqual(len(res.data["results"][0]["photos"]), 1)
+
+    def test_amenity_invalidates(self):
+        amenity = generator.create_amenity(name="wifi")
+        self.client.get(AMENITY_URL)
+        self.client.get(f"{detail_url(self.room.id)}?expand=amenities")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.room.amenities.add(amenity)
+        res = self.client.get(f"{detail_url(self.room.id)}?expand=amenities")
+        self.assertEqual([a["name"] for a in res.data["amenities"]], ["wifi"])
+
+        amenity.name = "fast wifi"
+        with self.captureOnCommitCallbacks(execute=True):
+            amenity.save()
+        res = self.client.get(AMENITY_URL)
+        self.assertEqual([a["name"] for a in res.data], ["fast wifi"])
+        res = self.client.get(f"{detail_url(self.room.id)}?expand=amenities")
+        self.assertEqual([a["name"] for a in res.data["amenities"]], ["fast wifi"])
+
+    def test_user_update_invalidates_own_rooms_only(self):
+        other_room = generator.create_room(owner=self.guest, title="other")
+        generator.create_review(user=self.guest, room=self.room, payload="hi", rating=4)
+        self.client.get(detail_url(self.room.id))
+        self.client.get(f"{detail_url(self.room.id)}?expand=reviews")
+        etag = self.client.get(detail_url(other_room.id))["ETag"]
+
+        self.owner.username = "changed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.owner.save()
+
+        res = self.client.get(detail_url(self.room.id))
+        self.assertEqual(res.data["owner"]["username"], "changed")
+        # 상관없는 room은 cache와 ETag가 그대로
+        with self.assertNumQueries(1):
+            res = self.client.get(detail_url(other_room.id), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # review 작성자가 바뀌면 review를 쓴 room도 무효화
+        self.guest.username = "guest changed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.guest.save()
+        res = self.client.get(f"{detail_url(self.room.id)}?expand=reviews")
+        self.assertEqual(res.data["reviews"][0]["user"]["username"], "guest changed")
+
+    def test_last_login_does_not_invalidate(self):
+        self.client.get(detail_url(self.room.id))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.owner.save(update_fields=["last_login"])
+
+        with self.assertNumQueries(1):
+            self.client.get(detail_url(self.room.id))
+
+    def test_category_invalidates(self):
+        category = generator.create_category(kind="rooms")
+        self.client.get(CATEGORY_URL)
+
+        with self.assertNumQueries(1):
+            self.client.get(CATEGORY_URL)
+
+        category.name = "changed"
+        with self.captureOnCommitCallbacks(execute=True):
+            category.save()
+        res = self.client.get(CATEGORY_URL)
+        self.assertEqual(res.data[0]["name"], "changed")
+
+    def test_invalidate_after_commit(self):
+        """commit 전에는 무효화하지 않음 (변경 전 값으로 cache가 다시 채워지지 않도록)"""
+        self.client.get(ROOM_URL)
+
+        self.room.title = "changed"
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.room.save()
+        res = self.client.get(ROOM_URL)
+        self.assertEqual(res.data["results"][0]["title"], "cached")
+
+        for callback in callbacks:
+            callback()
+        res = self.client.get(ROOM_URL)
+        self.assertEqual(res.data["results"][0]["title"], "changed")
@@ -0,0 +1,126 @@
+import time
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from common.utils import DefaultObjectCreate
+from medias.models import Photo
+
+AMENITY_URL = reverse("rooms:amenity-list")
+CATEGORY_URL = reverse("category:list")
+
+generator = DefaultObjectCreate()
+
+
+def detail_url(room_id):
+    return reverse("rooms:room-detail", args=(room_id,))
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = generator.create_user()
+        self.guest = generator.create_user(email="guest@example.com")
+        self.room = generator.create_room(owner=self.owner)
+        self.client = APIClient()
+
+    def assertNotModified(self, url, etag):
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        return res
+
+    def assertModified(self, url, etag):
+        res = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res["ETag"], etag)
+        return res
+
+    def test_room_detail_not_modified(self):
+        url = detail_url(self.room.id)
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res["ETag"].startswith('"'))
+        self.assertNotIn("Last-Modified", res)
+
+        with self.assertNumQueries(1):
+            res = self.assertNotModified(url, res["ETag"])
+        self.assertEqual(res.content, b"")
+
+    def test_room_detail_ignores_if_modified_since(self):
+        """삭제나 user가 바뀌어도 updated_at 최댓값은 그대로 -> 304를 주면 안 됨"""
+        url = detail_url(self.room.id)
+        review = generator.create_review(
+            user=self.guest, room=self.room, payload="good", rating=5
+        )
+        since = http_date(time.time() + 60)
+
+        review.delete()
+        res = self.client.get(url, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(self.owner)
+        res = self.client.get(url, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIs(res.data["is_owner"], True)
+
+    def test_room_detail_modified_by_related_rows(self):
+        url = detail_url(self.room.id)
+        etag = self.client.get(url)["ETag"]
+
+        review = generator.create_review(
+            user=self.guest, room=self.room, payload="good", rating=5
+        )
+        etag = self.assertModified(url, etag)["ETag"]
+
+        review.delete()
+        etag = self.assertModified(url, etag)["ETag"]
+
+        photo = Photo.objects.create(room=self.room, file="https://example.com/a.jpg")
+        etag = self.assertModified(url, etag)["ETag"]
+
+        photo.delete()
+        etag = self.assertModified(url, etag)["ETag"]
+
+        self.room.amenities.add(generator.create_amenity(name="wifi"))
+        self.assertModified(url, etag)
+
+    def test_room_detail_etag_per_query_and_user(self):
+        url = detail_url(self.room.id)
+        etag = self.client.get(url)["ETag"]
+
+        self.assertModified(f"{url}?fields=id,title", etag)
+
+        self.client.force_authenticate(self.owner)
+        self.assertModified(url, etag)
+
+    def test_room_detail_not_found(self):
+        res = self.client.get(detail_url(self.room.id + 100), HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_amenity_list_not_modified(self):
+        amenity = generator.create_amenity(name="wifi")
+        etag = self.client.get(AMENITY_URL)["ETag"]
+
+        with self.assertNumQueries(1):
+            self.assertNotModified(AMENITY_URL, etag)
+
+        amenity.delete()
+        self.assertModified(AMENITY_URL, etag)
+        res = self.client.get(AMENITY_URL, HTTP_IF_MODIFIED_SINCE=http_date())
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_category_list_not_modified(self):
+        category = generator.create_category(kind="rooms")
+        etag = self.client.get(CATEGORY_URL)["ETag"]
+
+        self.assertNotModified(CATEGORY_URL, etag)
+
+        category.name = "changed"
+        with self.captureOnCommitCallbacks(execute=True):
+            category.save()
+        res = self.assertModified(CATEGORY_URL, etag)
+        self.assertEqual(res.data[0]["name"], "changed")
@@ -1,8 +1,11 @@
-from datetime import datetime
+import base64
+from datetime import datetime, timedelta
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -200,3 +203,195 @@ class PrivateRoomApisWithPropertyTest(TestCase):
         res = self.client.post(target_url, payload)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+def room_available_url(check_in, check_out, **params):
+    query = "&".join(f"{key}={value}" for key, value in params.items())
+    return (
+        f"{reverse('rooms:room-available')}"
+        f"?check_in={check_in}&check_out={check_out}&{query}"
+    )
+
+
+class RoomAvailabilityApisTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password"
+        )
+        self.client = APIClient()
+
+        today = timezone.localtime(timezone.now()).date()
+        self.day = lambda n: (today + timedelta(days=n)).isoformat()
+
+        self.booked = create_room(owner=self.user, title="booked", price=100)
+        self.free = create_room(owner=self.user, title="free", price=200)
+        self.back_to_back = create_room(owner=self.user, title="back_to_back")
+
+        create_booking(
+            self.user, self.booked, check_in=self.day(10), check_out=self.day(15)
+        )
+        # 다른 room의 예약은 영향 없음
+        create_booking(
+            self.user, self.free, check_in=self.day(30), check_out=self.day(35)
+        )
+        # 체크아웃 날짜에 체크인하는 것은 가능
+        create_booking(
+            self.user, self.back_to_back, check_in=self.day(5), check_out=self.day(12)
+        )
+
+    def get_titles(self, url):
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return [room["title"] for room in res.data["results"]]
+
+    def test_available_rooms(self):
+        titles = self.get_titles(room_available_url(self.day(12), self.day(14)))
+        self.assertCountEqual(titles, ["free", "back_to_back"])
+
+        titles = self.get_titles(room_available_url(self.day(15), self.day(20)))
+        self.assertCountEqual(titles, ["booked", "free", "back_to_back"])
+
+    def test_available_rooms_with_room_filters(self):
+        titles = self.get_titles(
+            room_available_url(self.day(16), self.day(18), min_price=150)
+        )
+        self.assertEqual(titles, ["free"])
+
+    def test_available_rooms_constant_queries(self):
+        with self.assertNumQueries(2):
+            self.client.get(room_available_url(self.day(16), self.day(18)))
+
+    def test_available_rooms_invalid_dates_raise_error(self):
+        for check_in, check_out in [
+            (self.day(5), self.day(3)),
+            (self.day(-3), self.day(3)),
+            ("", self.day(3)),
+        ]:
+            res = self.client.get(room_available_url(check_in, check_out))
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class RoomBookingOverlapApisTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+        today = timezone.localtime(timezone.now()).date()
+        self.day = lambda n: (today + timedelta(days=n)).isoformat()
+
+        self.room = create_room(owner=self.user)
+        create_booking(
+            self.user, self.room, check_in=self.day(10), check_out=self.day(15)
+        )
+
+    def post_booking(self, room, check_in, check_out):
+        payload = {"check_in": check_in, "check_out": check_out, "guests": 2}
+        return self.client.post(room_booking_url(room.id), payload)
+
+    def test_overlap_in_same_room_raise_error(self):
+        res = self.post_booking(self.room, self.day(12), self.day(20))
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_other_room_is_not_blocked(self):
+        other_room = create_room(owner=self.user)
+        res = self.post_booking(other_room, self.day(12), self.day(20))
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+    def test_check_in_on_check_out_day(self):
+        res = self.post_booking(self.room, self.day(15), self.day(17))
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+        res = self.post_booking(self.room, self.day(8), self.day(10))
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+
+
+def room_calendar_url(room_id, month):
+    return (
+        f"{reverse('rooms:room-calendar', kwargs={'room_id': room_id})}?month={month}"
+    )
+
+
+def decode_occupied(room_calendar):
+    bitmap = base64.b64decode(room_calendar["occupied"])
+    return [
+        day + 1
+        for day in range(room_calendar["days"])
+        if bitmap[day // 8] & (1 << (day % 8))
+    ]
+
+
+class RoomCalendarApisTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password"
+        )
+        self.client = APIClient()
+        self.room = create_room(owner=self.user)
+
+        # 2월 말부터 3월 3일 체크아웃, 3월 30일부터 4월까지
+        create_booking(
+            self.user, self.room, check_in="2030-02-27", check_out="2030-03-03"
+        )
+        create_booking(
+            self.user, self.room, check_in="2030-03-30", check_out="2030-04-02"
+        )
+        create_booking(
+            self.user,
+            create_room(owner=self.user),
+            check_in="2030-03-10",
+            check_out="2030-03-12",
+        )
+
+    def test_get_calendar_bitmap(self):
+        res = self.client.get(room_calendar_url(self.room.id, "2030-03"))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data["month"], "2030-03")
+        self.assertEqual(res.data["days"], 31)
+        self.assertEqual(len(res.data["occupied"]), 8)
+        self.assertEqual(decode_occupied(res.data), [1, 2, 30, 31])
+
+    def test_calendar_is_cached_and_invalidated(self):
+        url = room_calendar_url(self.room.id, "2030-03")
+        self.client.get(url)
+
+        # room 조회 쿼리만 실행
+        with self.assertNumQueries(1):
+            self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            booking = create_booking(
+                self.user, self.room, check_in="2030-03-15", check_out="2030-03-17"
+            )
+        res = self.client.get(url)
+        self.assertEqual(decode_occupied(res.data), [1, 2, 15, 16, 30, 31])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            booking.delete()
+        res = self.client.get(url)
+        self.assertEqual(decode_occupied(res.data), [1, 2, 30, 31])
+
+    def test_move_booking_invalidates_both_rooms(self):
+        other_room = Booking.objects.get(check_in="2030-03-10").room
+        self.client.get(room_calendar_url(self.room.id, "2030-03"))
+        self.client.get(room_calendar_url(other_room.id, "2030-03"))
+
+        booking = Booking.objects.get(check_in="2030-03-10")
+        booking.room = self.room
+        # 불러온 값으로 이전 room을 알 수 있으므로 UPDATE만 실행
+        with self.assertNumQueries(1):
+            with self.captureOnCommitCallbacks(execute=True):
+                booking.save()
+
+        res = self.client.get(room_calendar_url(self.room.id, "2030-03"))
+        self.assertEqual(decode_occupied(res.data), [1, 2, 10, 11, 30, 31])
+        res = self.client.get(room_calendar_url(other_room.id, "2030-03"))
+        self.assertEqual(decode_occupied(res.data), [])
+
+    def test_invalid_month_raise_error(self):
+        res = self.client.get(room_calendar_url(self.room.id, "2030-13"))
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
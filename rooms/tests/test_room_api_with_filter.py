@@ -0,0 +1,251 @@
+import io
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from common.utils import DefaultObjectCreate
+from rooms.models import Amenity, Room
+
+ROOM_URL = reverse("rooms:room-list")
+
+generator = DefaultObjectCreate()
+
+
+class RoomFilterApisTest(TestCase):
+    def setUp(self):
+        self.user = generator.create_user()
+        self.client = APIClient()
+
+        self.wifi = generator.create_amenity(name="wifi")
+        self.kitchen = generator.create_amenity(name="kitchen")
+        self.category = generator.create_category(kind="rooms")
+
+        self.cheap = generator.create_room(
+            owner=self.user,
+            title="cheap",
+            price=100,
+            city="부산",
+            rooms=1,
+            toilets=1,
+            pet_friendly=False,
+            kind=Room.KindChoices.PRIVATE_ROOM,
+        )
+        self.middle = generator.create_room(
+            owner=self.user,
+            title="middle",
+            price=200,
+            rooms=2,
+            toilets=1,
+            category=self.category,
+        )
+        self.expensive = generator.create_room(
+            owner=self.user,
+            title="expensive",
+            price=300,
+            rooms=4,
+            toilets=2,
+            kind=Room.KindChoices.ENTIRE_PLACE,
+        )
+        self.middle.amenities.add(self.wifi, self.kitchen)
+        self.expensive.amenities.add(self.wifi)
+
+    def get_titles(self, query):
+        res = self.client.get(f"{ROOM_URL}?{query}")
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        return [room["title"] for room in res.data["results"]]
+
+    def test_filter_by_price_range(self):
+        titles = self.get_titles("min_price=150&max_price=300")
+        self.assertCountEqual(titles, ["middle", "expensive"])
+
+    def test_filter_by_location_and_kind(self):
+        self.assertEqual(self.get_titles("city=부산"), ["cheap"])
+        self.assertEqual(self.get_titles("kind=entire_place"), ["expensive"])
+
+    def test_filter_by_pet_friendly(self):
+        self.assertEqual(self.get_titles("pet_friendly=false"), ["cheap"])
+        self.assertCountEqual(
+            self.get_titles("pet_friendly=true"), ["middle", "expensive"]
+        )
+
+    def test_filter_by_min_rooms_and_toilets(self):
+        self.assertCountEqual(self.get_titles("min_rooms=2"), ["middle", "expensive"])
+        self.assertEqual(self.get_titles("min_rooms=2&min_toilets=2"), ["expensive"])
+
+    def test_filter_by_category(self):
+        self.assertEqual(self.get_titles(f"category={self.category.id}"), ["middle"])
+
+    def test_filter_by_all_amenities(self):
+        self.assertCountEqual(
+            self.get_titles(f"amenities={self.wifi.id}"), ["middle", "expensive"]
+        )
+        self.assertEqual(
+            self.get_titles(f"amenities={self.wifi.id},{self.kitchen.id}"), ["middle"]
+        )
+
+    def test_ordering_by_price(self):
+        self.assertEqual(
+            self.get_titles("ordering=price"), ["cheap", "middle", "expensive"]
+        )
+        self.assertEqual(
+            self.get_titles("ordering=-price"), ["expensive", "middle", "cheap"]
+        )
+
+    def test_ordering_by_rating(self):
+        generator.create_review(
+            user=self.user, room=self.cheap, payload="good", rating=5
+        )
+        generator.create_review(
+            user=self.user, room=self.expensive, payload="soso", rating=3
+        )
+        self.assertEqual(
+            self.get_titles("ordering=rating"), ["cheap", "expensive", "middle"]
+        )
+
+    def test_ordering_by_price_with_cursor(self):
+        res = self.client.get(f"{ROOM_URL}?ordering=price&page_size=2")
+        titles = [room["title"] for room in res.data["results"]]
+        res = self.client.get(res.data["next"])
+        titles += [room["title"] for room in res.data["results"]]
+
+        self.assertEqual(titles, ["cheap", "middle", "expensive"])
+
+    def test_invalid_params_raise_error(self):
+        for query in [
+            "min_price=abc",
+            "min_price=300&max_price=100",
+            "kind=castle",
+            "amenities=wifi",
+            "ordering=title",
+        ]:
+            res = self.client.get(f"{ROOM_URL}?{query}")
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, query)
+
+    def test_filter_by_unknown_amenity(self):
+        self.assertEqual(self.get_titles(f"amenities={self.wifi.id},999"), [])
+
+    def test_filter_by_amenities_without_join(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.get_titles(f"amenities={self.wifi.id},{self.kitchen.id}")
+        self.assertFalse(
+            any("rooms_room_amenities" in query["sql"] for query in queries)
+        )
+
+    def test_filter_by_amenity_without_bit(self):
+        """bit가 없는 amenity는 through 테이블로 확인"""
+        Amenity.objects.filter(pk=self.kitchen.pk).update(bit=None)
+        self.assertEqual(
+            self.get_titles(f"amenities={self.wifi.id},{self.kitchen.id}"), ["middle"]
+        )
+
+
+class RoomCursorTiesTest(TestCase):
+    """정렬 값이 같은 room이 DRF offset_cutoff(1000)보다 많아도 페이지가 끝나는지 확인"""
+
+    ROOM_COUNT = 1300
+
+    def setUp(self):
+        cache.clear()
+        owner = generator.create_user()
+        room_defaults = {**generator.room_defaults, "price": 100}
+        Room.objects.bulk_create(
+            [Room(owner=owner, **room_defaults) for _ in range(self.ROOM_COUNT)]
+        )
+        self.client = APIClient()
+
+    def collect_ids(self, ordering):
+        ids = []
+        url = f"{ROOM_URL}?ordering={ordering}&page_size=100"
+        for _ in range(self.ROOM_COUNT // 100 + 1):
+            res = self.client.get(url)
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            ids += [room["id"] for room in res.data["results"]]
+            url = res.data["next"]
+            if url is None:
+                break
+        self.assertIsNone(url, ordering)
+        return ids
+
+    def test_all_rooms_once(self):
+        for ordering in ("price", "-price", "rating", "newest"):
+            ids = self.collect_ids(ordering)
+            self.assertEqual(len(ids), self.ROOM_COUNT, ordering)
+            self.assertEqual(len(set(ids)), self.ROOM_COUNT, ordering)
+
+    def test_previous_page(self):
+        url = f"{ROOM_URL}?ordering=price&page_size=100"
+        first = self.client.get(url)
+        second = self.client.get(first.data["next"])
+
+        res = self.client.get(second.data["previous"])
+
+        self.assertEqual(
+            [room["id"] for room in res.data["results"]],
+            [room["id"] for room in first.data["results"]],
+        )
+        self.assertIsNone(res.data["previous"])
+
+    def test_invalid_cursor(self):
+        res = self.client.get(f"{ROOM_URL}?cursor=cD1hYmM%3D")
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class RoomAmenityMaskTest(TestCase):
+    def setUp(self):
+        self.user = generator.create_user()
+        self.wifi = generator.create_amenity(name="wifi")
+        self.kitchen = generator.create_amenity(name="kitchen")
+        self.room = generator.create_room(owner=self.user)
+
+    def assertMask(self, room, *amenities):
+        room.refresh_from_db()
+        self.assertEqual(
+            room.amenity_mask, sum(1 << amenity.bit for amenity in amenities)
+        )
+
+    def test_amenity_bits_unique(self):
+        self.assertNotEqual(self.wifi.bit, self.kitchen.bit)
+
+        bit = self.wifi.bit
+        self.wifi.delete()
+        self.assertEqual(generator.create_amenity(name="parking").bit, bit)
+
+    def test_mask_follows_room_amenities(self):
+        self.room.amenities.add(self.wifi, self.kitchen)
+        self.assertEqual(
+            self.room.amenity_mask, (1 << self.wifi.bit) | (1 << self.kitchen.bit)
+        )
+
+        self.room.amenities.remove(self.kitchen)
+        self.assertMask(self.room, self.wifi)
+
+        self.room.amenities.set([self.kitchen])
+        self.assertMask(self.room, self.kitchen)
+
+        self.room.amenities.clear()
+        self.assertMask(self.room)
+
+    def test_mask_follows_amenity_side(self):
+        self.kitchen.room_set.add(self.room)
+        self.assertMask(self.room, self.kitchen)
+
+        self.kitchen.room_set.clear()
+        self.assertMask(self.room)
+
+        self.room.amenities.add(self.wifi, self.kitchen)
+        self.kitchen.delete()
+        self.assertMask(self.room, self.wifi)
+
+    def test_refresh_command_rebuilds_mask(self):
+        self.room.amenities.add(self.wifi)
+        Room.objects.update(amenity_mask=0)
+
+        call_command("refresh_room_aggregates", stdout=io.StringIO())
+
+        self.assertMask(self.room, self.wifi)
@@ -0,0 +1,104 @@
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from common.utils import DefaultObjectCreate
+from rooms.geo import covering_geohashes, encode_geohash
+from rooms.models import Room
+
+ROOM_URL = reverse("rooms:room-list")
+
+generator = DefaultObjectCreate()
+
+
+class GeohashTest(TestCase):
+    def test_encode_geohash(self):
+        self.assertEqual(encode_geohash(57.64911, 10.40744), "u4pruydqq")
+        self.assertEqual(encode_geohash(57.64911, 10.40744, precision=5), "u4pru")
+
+    def test_covering_geohashes_contains_every_corner(self):
+        bbox = (37.49, 126.95, 37.58, 127.06)
+        prefixes = covering_geohashes(*bbox)
+
+        self.assertLessEqual(len(prefixes), 16)
+        for lat in (bbox[0], bbox[2], (bbox[0] + bbox[2]) / 2):
+            for lng in (bbox[1], bbox[3], (bbox[1] + bbox[3]) / 2):
+                geohash = encode_geohash(lat, lng)
+                self.assertTrue(
+                    any(geohash.startswith(prefix) for prefix in prefixes),
+                    (lat, lng),
+                )
+
+
+class RoomLocationApisTest(TestCase):
+    def setUp(self):
+        self.user = generator.create_user()
+        self.client = APIClient()
+
+        # 서울 시청, 강남역, 부산역
+        self.city_hall = generator.create_room(
+            owner=self.user, title="city hall", latitude=37.5663, longitude=126.9779
+        )
+        self.gangnam = generator.create_room(
+            owner=self.user, title="gangnam", latitude=37.4979, longitude=127.0276
+        )
+        self.busan = generator.create_room(
+            owner=self.user, title="busan", latitude=35.1151, longitude=129.0422
+        )
+        self.unknown = generator.create_room(owner=self.user, title="unknown")
+
+    def get_results(self, query):
+        res = self.client.get(f"{ROOM_URL}?{query}")
+        self.assertEqual(res.status_code, status.HTTP_200_OK, res.data)
+        return res.data["results"]
+
+    def test_geohash_saved(self):
+        self.assertEqual(self.city_hall.geohash, encode_geohash(37.5663, 126.9779))
+        self.assertEqual(self.unknown.geohash, "")
+
+        self.busan.latitude, self.busan.longitude = 37.5663, 126.9779
+        self.busan.save(update_fields=["latitude", "longitude"])
+        self.busan.refresh_from_db()
+        self.assertEqual(self.busan.geohash, self.city_hall.geohash)
+
+    def test_rooms_in_bbox(self):
+        results = self.get_results("bbox=37.4,126.9,37.6,127.1")
+        self.assertCountEqual(
+            [room["title"] for room in results], ["city hall", "gangnam"]
+        )
+        self.assertIn("latitude", results[0])
+
+        results = self.get_results("bbox=37.55,126.9,37.6,127.0")
+        self.assertEqual([room["title"] for room in results], ["city hall"])
+
+    def test_rooms_in_radius_ordered_by_distance(self):
+        # 시청 - 강남역 약 9km
+        results = self.get_results(
+            "lat=37.5663&lng=126.9779&radius_km=5&ordering=distance"
+        )
+        self.assertEqual([room["title"] for room in results], ["city hall"])
+
+        results = self.get_results(
+            "lat=37.4979&lng=127.0276&radius_km=15&ordering=distance"
+        )
+        self.assertEqual([room["title"] for room in results], ["gangnam", "city hall"])
+
+        results = self.get_results("lat=37.5663&lng=126.9779&radius_km=400")
+        self.assertEqual(len(results), 3)
+
+    def test_location_with_other_filters(self):
+        Room.objects.filter(pk=self.gangnam.pk).update(price=1)
+        results = self.get_results("bbox=37.4,126.9,37.6,127.1&max_price=10")
+        self.assertEqual([room["title"] for room in results], ["gangnam"])
+
+    def test_invalid_location_params_raise_error(self):
+        for query in [
+            "bbox=1,2,3",
+            "bbox=37.6,126.9,37.4,127.1",
+            "lat=37.5&lng=127",
+            "lat=100&lng=127&radius_km=1",
+            "ordering=distance",
+        ]:
+            res = self.client.get(f"{ROOM_URL}?{query}")
+            self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST, query)
@@ -221,3 +221,33 @@ class PrivateRoomApisWithPropertyTest(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
 
         self.assertTrue(res.data.get("is_liked"), True)
+
+    def test_is_liked_resolved_once_per_request(self):
+        """room 갯수와 상관없이 좋아요 여부는 쿼리 한번으로 조회"""
+        wishlist = create_wishlist(self.user)
+        other_wishlist = create_wishlist(self.user, name="wishlist2")
+        liked = []
+        for i in range(6):
+            room = create_room(owner=self.user)
+            if i % 2:
+                (wishlist if i % 3 else other_wishlist).rooms.add(room)
+                liked.append(room.id)
+
+        # rooms, photos, 좋아요한 room id
+        with self.assertNumQueries(3):
+            res = self.client.get(reverse("rooms:room-list"))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        for room_data in res.data["results"]:
+            self.assertEqual(room_data["is_liked"], room_data["id"] in liked)
+
+    def test_is_liked_in_wishlist_rooms(self):
+        wishlist = create_wishlist(self.user)
+        for _ in range(3):
+            wishlist.rooms.add(create_room(owner=self.user))
+
+        res = self.client.get(reverse("wishlists:detail", args=(wishlist.id,)))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["rooms"]), 3)
+        self.assertTrue(all(room["is_liked"] for room in res.data["rooms"]))
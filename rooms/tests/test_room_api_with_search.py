@@ -0,0 +1,112 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from common.utils import DefaultObjectCreate
+from rooms.search import fts5_enabled, rebuild_search_index
+
+ROOM_URL = reverse("rooms:room-list")
+
+generator = DefaultObjectCreate()
+
+
+class RoomSearchApisTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = generator.create_user()
+        self.client = APIClient()
+
+        self.ocean = generator.create_room(
+            owner=self.user,
+            title="Ocean view apartment",
+            description="quiet room near the beach",
+            city="부산",
+            price=300,
+        )
+        self.beach = generator.create_room(
+            owner=self.user,
+            title="Beach house",
+            description="beach beach beach, walk to the ocean",
+            city="부산",
+            price=100,
+        )
+        self.city = generator.create_room(
+            owner=self.user,
+            title="City loft",
+            description="downtown",
+            address="강남대로 1",
+            city="서울",
+            price=200,
+        )
+
+    def get_titles(self, query):
+        res = self.client.get(f"{ROOM_URL}?{query}")
+        self.assertEqual(res.status_code, status.HTTP_200_OK, res.data)
+        return [room["title"] for room in res.data["results"]]
+
+    def test_search_all_fields(self):
+        self.assertCountEqual(
+            self.get_titles("q=beach"), ["Ocean view apartment", "Beach house"]
+        )
+        self.assertEqual(self.get_titles("q=강남대로"), ["City loft"])
+        self.assertEqual(self.get_titles("q=서울"), ["City loft"])
+
+    def test_search_requires_every_term_and_prefix(self):
+        self.assertEqual(self.get_titles("q=ocean quiet"), ["Ocean view apartment"])
+        self.assertEqual(self.get_titles("q=down"), ["City loft"])
+        self.assertEqual(self.get_titles("q=ocean castle"), [])
+
+    def test_search_with_structured_filters(self):
+        self.assertEqual(self.get_titles("q=beach&max_price=150"), ["Beach house"])
+        self.assertEqual(
+            self.get_titles("q=beach&ordering=price"),
+            ["Beach house", "Ocean view apartment"],
+        )
+
+    def test_search_ranked_by_relevance(self):
+        if not fts5_enabled():
+            self.skipTest("FTS5 없음")
+        self.assertEqual(
+            self.get_titles("q=beach"), ["Beach house", "Ocean view apartment"]
+        )
+
+    def test_search_relevance_with_cursor(self):
+        res = self.client.get(f"{ROOM_URL}?q=beach&page_size=1")
+        titles = [room["title"] for room in res.data["results"]]
+        res = self.client.get(res.data["next"])
+        titles += [room["title"] for room in res.data["results"]]
+
+        self.assertCountEqual(titles, ["Beach house", "Ocean view apartment"])
+        self.assertIsNone(res.data["next"])
+
+    def test_search_index_follows_changes(self):
+        self.city.title = "Mountain cabin"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.city.save()
+        self.assertEqual(self.get_titles("q=mountain"), ["Mountain cabin"])
+        self.assertEqual(self.get_titles("q=loft"), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.city.delete()
+        self.assertEqual(self.get_titles("q=mountain"), [])
+
+    def test_search_rebuild_index(self):
+        if not fts5_enabled():
+            self.skipTest("FTS5 없음")
+        self.assertEqual(rebuild_search_index(batch_size=2), 3)
+        self.assertEqual(self.get_titles("q=loft"), ["City loft"])
+
+    def test_search_fallback_without_fts5(self):
+        with mock.patch("rooms.search.fts5_enabled", return_value=False):
+            self.assertCountEqual(
+                self.get_titles("q=beach"), ["Ocean view apartment", "Beach house"]
+            )
+            self.assertEqual(self.get_titles("q=ocean quiet"), ["Ocean view apartment"])
+
+    def test_relevance_without_query_raise_error(self):
+        res = self.client.get(f"{ROOM_URL}?ordering=relevance")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,99 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TransactionTestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from bookings.models import Booking
+from common.utils import DefaultObjectCreate
+
+generator = DefaultObjectCreate()
+
+
+def room_booking_url(room_id):
+    return reverse("rooms:booking-list", kwargs={"room_id": room_id})
+
+
+class ConcurrentRoomBookingTest(TransactionTestCase):
+    """여러 thread가 동시에 같은 기간을 예약해도 하나만 성공해야함"""
+
+    threads = 8
+    rounds = 10
+
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="user@example.com", password="password"
+        )
+        self.room = generator.create_room(owner=self.user)
+        self.today = timezone.localtime(timezone.now()).date()
+
+    def post_concurrently(self, payloads):
+        barrier = threading.Barrier(len(payloads))
+        status_codes = []
+
+        def post(payload):
+            client = APIClient()
+            client.force_authenticate(self.user)
+            try:
+                barrier.wait()
+                res = client.post(room_booking_url(self.room.id), payload)
+                status_codes.append(res.status_code)
+            finally:
+                connection.close()
+
+        workers = [
+            threading.Thread(target=post, args=(payload,)) for payload in payloads
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return status_codes
+
+    def test_no_double_booking(self):
+        started = time.perf_counter()
+        for i in range(self.rounds):
+            check_in = self.today + timedelta(days=10 + i * 5)
+            payload = {
+                "check_in": check_in.isoformat(),
+                "check_out": (check_in + timedelta(days=3)).isoformat(),
+                "guests": 2,
+            }
+            status_codes = self.post_concurrently([payload] * self.threads)
+
+            self.assertEqual(status_codes.count(status.HTTP_201_CREATED), 1)
+            self.assertEqual(
+                status_codes.count(status.HTTP_400_BAD_REQUEST), self.threads - 1
+            )
+        elapsed = time.perf_counter() - started
+
+        bookings = list(Booking.objects.filter(room=self.room).order_by("check_in"))
+        self.assertEqual(len(bookings), self.rounds)
+        for before, after in zip(bookings, bookings[1:]):
+            self.assertLessEqual(before.check_out, after.check_in)
+
+        # 요청이 직렬화 되더라도 처리량이 크게 떨어지지 않아야 함
+        self.assertLess(elapsed, self.rounds * self.threads * 0.5)
+
+    def test_non_overlapping_bookings_all_succeed(self):
+        payloads = []
+        for i in range(self.threads):
+            check_in = self.today + timedelta(days=10 + i * 3)
+            payloads.append(
+                {
+                    "check_in": check_in.isoformat(),
+                    "check_out": (check_in + timedelta(days=3)).isoformat(),
+                    "guests": 2,
+                }
+            )
+
+        status_codes = self.post_concurrently(payloads)
+
+        self.assertEqual(status_codes, [status.HTTP_201_CREATED] * self.threads)
+        self.assertEqual(Booking.objects.filter(room=self.room).count(), self.threads)
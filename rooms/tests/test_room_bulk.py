@@ -0,0 +1,230 @@
+import io
+import json
+import os
+import tempfile
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from common.utils import DefaultObjectCreate
+from medias.models import Photo
+from rooms.models import Room
+
+ROOM_IMPORT_URL = reverse("rooms:room-import")
+ROOM_EXPORT_URL = reverse("rooms:room-export")
+
+generator = DefaultObjectCreate()
+
+
+def ndjson(records):
+    return "\n".join(json.dumps(record) for record in records)
+
+
+class RoomBulkImportApiTest(TestCase):
+    def setUp(self):
+        self.user = generator.create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+        self.category = generator.create_category(kind="rooms")
+        self.wifi = generator.create_amenity(name="wifi")
+        self.kitchen = generator.create_amenity(name="kitchen")
+
+    def make_record(self, title, **kwargs):
+        record = {
+            **generator.room_defaults,
+            "title": title,
+            "category": self.category.id,
+            "amenities": [self.wifi.id, self.kitchen.id],
+        }
+        record.update(kwargs)
+        return record
+
+    def post(self, body, content_type="application/x-ndjson"):
+        return self.client.generic(
+            "POST", ROOM_IMPORT_URL, body, content_type=content_type
+        )
+
+    def test_import_requires_login(self):
+        res = APIClient().generic(
+            "POST", ROOM_IMPORT_URL, ndjson([self.make_record("a")])
+        )
+        self.assertIn(
+            res.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN]
+        )
+
+    def test_import_ndjson(self):
+        records = [self.make_record(f"room{i}") for i in range(30)]
+
+        res = self.post(ndjson(records))
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data, {"created": 30, "errors": []})
+        rooms = Room.objects.filter(owner=self.user)
+        self.assertEqual(rooms.count(), 30)
+        self.assertEqual(
+            Room.amenities.through.objects.filter(room__in=rooms).count(), 60
+        )
+        self.assertEqual(rooms.first().category, self.category)
+        self.assertEqual(
+            rooms.first().amenity_mask, (1 << self.wifi.bit) | (1 << self.kitchen.bit)
+        )
+
+    def test_import_queries_per_batch(self):
+        """room 갯수가 아니라 batch 갯수만큼 query"""
+        records = [
+            self.make_record(f"room{i}", amenities=[self.wifi.id]) for i in range(100)
+        ]
+
+        with self.settings(ROOM_IMPORT_BATCH_SIZE=25):
+            # batch마다 category, amenity 조회 + savepoint
+            # + insert room, through, 검색 index
+            with self.assertNumQueries(4 * 7):
+                res = self.post(ndjson(records))
+
+        self.assertEqual(res.data["created"], 100)
+
+    def test_import_csv(self):
+        body = (
+            "title,country,city,price,rooms,toilets,description,address,"
+            "pet_friendly,kind,category,amenities\n"
+            f"csv1,한국,서울,100,1,1,desc,addr,true,shared_room,"
+            f"{self.category.id},{self.wifi.id}|{self.kitchen.id}\n"
+            "csv2,한국,부산,200,2,1,desc,addr,false,private_room,,\n"
+        )
+
+        res = self.post(body, content_type="text/csv")
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data["created"], 2)
+        csv1 = Room.objects.get(title="csv1")
+        self.assertEqual(csv1.amenities.count(), 2)
+        csv2 = Room.objects.get(title="csv2")
+        self.assertIsNone(csv2.category)
+        self.assertFalse(csv2.pet_friendly)
+
+    def test_import_reports_invalid_lines(self):
+        experience = generator.create_category(kind="experiences")
+        body = "\n".join(
+            [
+                json.dumps(self.make_record("ok")),
+                "not json",
+                json.dumps(self.make_record("no price", price=None)),
+                json.dumps(self.make_record("bad amenity", amenities=[999])),
+                json.dumps(self.make_record("bad category", category=experience.id)),
+            ]
+        )
+
+        res = self.post(body)
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(res.data["created"], 1)
+        self.assertEqual([error["line"] for error in res.data["errors"]], [2, 3, 4, 5])
+        self.assertIn("999", str(res.data["errors"][2]["errors"]["amenities"]))
+        self.assertEqual(list(Room.objects.values_list("title", flat=True)), ["ok"])
+
+    def test_import_all_invalid_raise_error(self):
+        res = self.post("not json\n")
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Room.objects.exists())
+
+
+class RoomExportApiTest(TestCase):
+    def setUp(self):
+        self.user = generator.create_user()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+        self.category = generator.create_category(kind="rooms")
+        self.wifi = generator.create_amenity(name="wifi")
+        self.rooms = []
+        for i in range(5):
+            room = generator.create_room(
+                owner=self.user, title=f"room{i}", category=self.category
+            )
+            room.amenities.add(self.wifi)
+            Photo.objects.create(room=room, file=f"https://example.com/{i}.jpg")
+            self.rooms.append(room)
+        generator.create_review(
+            user=self.user, room=self.rooms[0], payload="good", rating=4
+        )
+
+    def test_export_requires_login(self):
+        res = APIClient().get(ROOM_EXPORT_URL)
+        self.assertIn(
+            res.status_code, [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN]
+        )
+
+    def test_export_streams_ndjson(self):
+        res = self.client.get(ROOM_EXPORT_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertTrue(res.streaming)
+        self.assertEqual(res["Content-Type"], "application/x-ndjson")
+
+        records = [
+            json.loads(line) for line in b"".join(res.streaming_content).splitlines()
+        ]
+        self.assertEqual([r["id"] for r in records], [r.id for r in self.rooms])
+        self.assertEqual(
+            records[0]["category"], {"id": self.category.id, "name": "category1"}
+        )
+        self.assertEqual(
+            records[0]["amenities"], [{"id": self.wifi.id, "name": "wifi"}]
+        )
+        self.assertEqual(records[0]["photos"][0]["file"], "https://example.com/0.jpg")
+        self.assertEqual(records[0]["rating"], 4)
+
+    def test_export_queries_per_chunk(self):
+        """room 조회 1번 + chunk마다 amenity, photo prefetch"""
+        with self.settings(ROOM_EXPORT_CHUNK_SIZE=2):
+            res = self.client.get(ROOM_EXPORT_URL)
+            with self.assertNumQueries(1 + 3 * 2):
+                lines = b"".join(res.streaming_content).splitlines()
+        self.assertEqual(len(lines), 5)
+
+
+class RoomBulkCommandTest(TestCase):
+    def setUp(self):
+        self.user = generator.create_user()
+        self.category = generator.create_category(kind="rooms")
+        self.wifi = generator.create_amenity(name="wifi")
+        for i in range(5):
+            room = generator.create_room(
+                owner=self.user, title=f"room{i}", category=self.category
+            )
+            room.amenities.add(self.wifi)
+
+    def test_export_ndjson(self):
+        out = io.StringIO()
+        call_command("export_rooms", "--chunk-size=2", stdout=out)
+
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([r["title"] for r in records], [f"room{i}" for i in range(5)])
+        self.assertEqual(records[0]["amenities"], [self.wifi.id])
+        self.assertEqual(records[0]["category"], self.category.id)
+
+    def test_export_import_round_trip(self):
+        for file_format in ["ndjson", "csv"]:
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, f"rooms.{file_format}")
+                call_command(
+                    "export_rooms", f"--format={file_format}", f"--output={path}"
+                )
+                before = Room.objects.count()
+                call_command(
+                    "import_rooms",
+                    path,
+                    f"--owner={self.user.email}",
+                    "--batch-size=2",
+                    stdout=io.StringIO(),
+                )
+
+            self.assertEqual(Room.objects.count(), before * 2)
+            self.assertEqual(
+                Room.amenities.through.objects.filter(amenity=self.wifi).count(),
+                before * 2,
+            )
@@ -1,6 +1,12 @@
-from django.db import IntegrityError
-from django.test import TransactionTestCase
+from unittest.mock import patch
 
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError, connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from common.admin import EstimatedCountPaginator
 from common.utils import DefaultObjectCreate
 from rooms.models import Room
 
@@ -92,3 +98,95 @@ class RoomsTest(TransactionTestCase):
         room.amenities.add(amenity1, amenity2)
 
         self.assertEqual(room.total_amenities(), 2)
+
+
+class RoomQuerySetTest(TestCase):
+    def setUp(self):
+        self.default_object_create = DefaultObjectCreate()
+        self.user = self.default_object_create.create_user()
+
+    def test_with_stats(self):
+        amenities = [
+            self.default_object_create.create_amenity(name=f"item{i}") for i in range(3)
+        ]
+        room = self.default_object_create.create_room(owner=self.user)
+        room.amenities.add(*amenities)
+        empty_room = self.default_object_create.create_room(owner=self.user)
+        for rating in [5, 4]:
+            self.default_object_create.create_review(
+                user=self.user, room=room, payload="review", rating=rating
+            )
+
+        with self.assertNumQueries(1):
+            rooms = {r.id: r for r in Room.objects.with_stats()}
+            self.assertEqual(rooms[room.id].total_amenities(), 3)
+            self.assertEqual(rooms[room.id].rating_score, 4.5)
+            self.assertEqual(rooms[room.id].rating(), 4.5)
+            self.assertEqual(rooms[empty_room.id].total_amenities(), 0)
+            self.assertEqual(rooms[empty_room.id].rating_score, 0)
+
+
+class RoomAdminTest(TestCase):
+    def setUp(self):
+        self.default_object_create = DefaultObjectCreate()
+        self.admin = get_user_model().objects.create_superuser(
+            email="admin@example.com", password="password123"
+        )
+        self.client.force_login(self.admin)
+        self.amenity = self.default_object_create.create_amenity(name="item")
+
+    def create_rooms(self, count):
+        for _ in range(count):
+            room = self.default_object_create.create_room(owner=self.admin)
+            room.amenities.add(self.amenity)
+
+    def count_changelist_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get(reverse("admin:rooms_room_changelist"))
+        self.assertEqual(res.status_code, 200)
+        return len(queries)
+
+    def test_changelist_queries_constant(self):
+        self.create_rooms(2)
+        few = self.count_changelist_queries()
+        self.create_rooms(8)
+        self.assertEqual(self.count_changelist_queries(), few)
+
+    def test_changelist_filter_price_range(self):
+        cheap = self.default_object_create.create_room(owner=self.admin, price=30000)
+        self.default_object_create.create_room(owner=self.admin, price=150000)
+
+        res = self.client.get(
+            reverse("admin:rooms_room_changelist"), {"price_range": "0-50000"}
+        )
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            [room.pk for room in res.context["cl"].result_list], [cheap.pk]
+        )
+
+    def test_changelist_filter_amenity(self):
+        self.create_rooms(1)
+        self.default_object_create.create_room(owner=self.admin)
+
+        res = self.client.get(
+            reverse("admin:rooms_room_changelist"), {"amenity": self.amenity.pk}
+        )
+
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(res.context["cl"].result_list), 1)
+
+    def test_changelist_estimated_count(self):
+        self.create_rooms(3)
+        Room.objects.order_by("pk").first().delete()
+
+        with patch.object(EstimatedCountPaginator, "ESTIMATE_THRESHOLD", 0):
+            res = self.client.get(reverse("admin:rooms_room_changelist"))
+            filtered = self.client.get(
+                reverse("admin:rooms_room_changelist"), {"kind": "shared_room"}
+            )
+
+        # 필터가 없으면 max(pk) 추정치, 필터가 있으면 정확한 COUNT(*)
+        self.assertEqual(res.context["cl"].result_count, Room.objects.last().pk)
+        self.assertEqual(filtered.context["cl"].result_count, 2)
+        self.assertIsNone(filtered.context["cl"].full_result_count)
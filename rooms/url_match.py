@@ -16,3 +16,7 @@ list_dict = {
 create_dict = {
     "post": "create",
 }
+
+retrieve_dict = {
+    "get": "retrieve",
+}
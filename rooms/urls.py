@@ -4,7 +4,9 @@ from rooms import views
 from rooms.url_match import (
     get_update_delete_dict,
     list_create_dict,
+    list_dict,
     create_dict,
+    retrieve_dict,
 )
 
 app_name = "rooms"
@@ -16,6 +18,21 @@ urlpatterns = [
         views.Rooms.as_view(list_create_dict),
         name="room-list",
     ),
+    path(
+        "available/",
+        views.AvailableRooms.as_view(list_dict),
+        name="room-available",
+    ),
+    path(
+        "import/",
+        views.RoomImport.as_view(),
+        name="room-import",
+    ),
+    path(
+        "export/",
+        views.RoomExport.as_view(),
+        name="room-export",
+    ),
     path(
         "<int:room_id>/",
         views.RoomDetail.as_view(get_update_delete_dict),
@@ -36,6 +53,11 @@ urlpatterns = [
         views.RoomBookingView.as_view(list_create_dict),
         name="booking-list",
     ),
+    path(
+        "<int:room_id>/calendar/",
+        views.RoomCalendarView.as_view(retrieve_dict),
+        name="room-calendar",
+    ),
     path(
         "amenities/",
         views.Amenities.as_view(),
@@ -1,5 +1,5 @@
-from django.conf import settings
 from django.db import transaction
+from django.http import QueryDict, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import status
@@ -21,14 +21,39 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.viewsets import GenericViewSet
 
+from bookings.calendar import get_room_calendar
 from bookings.models import Booking
-from bookings.serializers import PublicBookingSerializer, CreateRoomBookingSerializer
+from bookings.serializers import (
+    CreateRoomBookingSerializer,
+    PublicBookingSerializer,
+    RoomCalendarQuerySerializer,
+)
 from categories.models import Category
+from common.cache import get_or_build
+from common.conditional import conditional_view
 from common.exceptions import get_object_or_400
 from config.authentication import SimpleJWTAuthentication
 from medias.serializers import PhotoSerializer
 from reviews.serializers import ReviewSerializer
+from rooms.bulk import (
+    import_rooms,
+    iter_catalog_records,
+    iter_ndjson,
+    parse_csv,
+    parse_ndjson,
+)
+from rooms.cache import (
+    AMENITY_LIST,
+    ROOM_DETAIL,
+    ROOM_LIST,
+    amenity_list_state,
+    personalize,
+    room_detail_state,
+    room_namespace,
+)
+from rooms.filters import RoomAvailabilityFilterBackend, RoomFilterBackend
 from rooms.models import Amenity, Room
+from rooms.pagination import RoomCursorPagination, RoomReviewCursorPagination
 from rooms.serializers import (
     AmenitySerializer,
     RoomDetailSerializer,
@@ -36,13 +61,49 @@ from rooms.serializers import (
 )
 
 
+AMENITIES_APPEND = "append"
+AMENITIES_REPLACE = "replace"
+
+
+def get_request_amenities(data):
+    """
+    request.data의 amenities (없으면 None)
+    form 요청(QueryDict)은 amenities=1&amenities=2 처럼 같은 key로 여러 값을 보냄
+    """
+    if isinstance(data, QueryDict):
+        return data.getlist("amenities") if "amenities" in data else None
+    return data.get("amenities")
+
+
+def get_amenity_ids(amenities):
+    """
+    request.data["amenities"] -> amenity id set
+    query 한번으로 확인하고 없는 id가 있으면 400
+    """
+    if not isinstance(amenities, list):
+        raise ParseError("amenities는 id 리스트로 넣어주세요")
+    try:
+        amenity_ids = {int(amenity_id) for amenity_id in amenities}
+    except (TypeError, ValueError):
+        raise ParseError("amenity id는 숫자로 넣어주세요")
+
+    found = set(Amenity.objects.filter(id__in=amenity_ids).values_list("id", flat=True))
+    missing = sorted(amenity_ids - found)
+    if missing:
+        raise ParseError(f"Amenity not found: {missing}")
+    return amenity_ids
+
+
 class Amenities(APIView):
     """/api/v1/rooms/amenities"""
 
+    @conditional_view(amenity_list_state)
     def get(self, request):
-        all_amenities = Amenity.objects.all()
-        serializer = AmenitySerializer(all_amenities, many=True)
-        return Response(serializer.data)
+        def build():
+            all_amenities = Amenity.objects.all()
+            return list(AmenitySerializer(all_amenities, many=True).data)
+
+        return Response(get_or_build([AMENITY_LIST], build))
 
     def post(self, request: Request):
         serializer = AmenitySerializer(data=request.data)
@@ -98,6 +159,13 @@ class Rooms(
     queryset = Room.objects.all()
     serializer_class = RoomDetailSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
+    pagination_class = RoomCursorPagination
+    filter_backends = [RoomFilterBackend]
+
+    def get_queryset(self):
+        if self.action == "list":
+            return Room.objects.for_list(self.request.user)
+        return super().get_queryset()
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -105,9 +173,26 @@ class Rooms(
         return self.serializer_class
 
     def list(self, request, *args, **kwargs):
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        payload = get_or_build(
+            [ROOM_LIST],
+            self.build_list_payload,
+            request.build_absolute_uri(),
+        )
+        for room_data, (room_id, owner_id) in zip(
+            payload["data"]["results"], payload["owners"]
+        ):
+            personalize(room_data, room_id, owner_id, request)
+        return Response(payload["data"])
+
+    def build_list_payload(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        response = self.get_paginated_response(serializer.data)
+        return {
+            "data": {**response.data, "results": list(serializer.data)},
+            "owners": [(room.id, room.owner_id) for room in page],
+        }
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -128,19 +213,73 @@ class Rooms(
         if category.kind == Category.KindCategoryChoices.EXPERIENCES:
             raise ParseError("ROOM 카테고리만 넣을 수 있어요")
 
-        amenities = self.request.data.get("amenities", [])
-        try:
-            with transaction.atomic():
-                room = serializer.save(
-                    owner=self.request.user,
-                    category=category,
-                )
-                for amenity_id in amenities:
-                    amenity = Amenity.objects.get(id=amenity_id)
-                    room.amenities.add(amenity)
-                return room
-        except Exception:
-            raise ParseError("Amenity not found")
+        amenity_ids = get_amenity_ids(get_request_amenities(self.request.data) or [])
+        with transaction.atomic():
+            room = serializer.save(
+                owner=self.request.user,
+                category=category,
+            )
+            room.amenities.add(*amenity_ids)
+            return room
+
+
+class RoomImport(APIView):
+    """
+    /api/v1/rooms/import
+
+    body를 stream으로 읽어서 batch 단위로 생성
+    Content-Type: application/x-ndjson (기본) 또는 text/csv
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request: Request):
+        is_csv = request.META.get("CONTENT_TYPE", "").startswith("text/csv")
+        parse = parse_csv if is_csv else parse_ndjson
+        result = import_rooms(parse(request.stream or []), owner=request.user)
+
+        if result["errors"] and not result["created"]:
+            return Response(result, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result, status=status.HTTP_201_CREATED)
+
+
+class RoomExport(APIView):
+    """
+    /api/v1/rooms/export
+
+    전체 room catalog를 NDJSON으로 stream
+    chunk 단위로 조회하므로 room 갯수와 상관없이 메모리 사용량이 일정
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: Request):
+        response = StreamingHttpResponse(
+            iter_ndjson(iter_catalog_records()),
+            content_type="application/x-ndjson",
+        )
+        response["Content-Disposition"] = 'attachment; filename="rooms.ndjson"'
+        return response
+
+
+class AvailableRooms(
+    ListModelMixin,
+    GenericViewSet,
+):
+    """/api/v1/rooms/available?check_in=&check_out="""
+
+    serializer_class = RoomListSerializer
+    pagination_class = RoomCursorPagination
+    filter_backends = [RoomAvailabilityFilterBackend, RoomFilterBackend]
+
+    def get_queryset(self):
+        return Room.objects.for_list(self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
 
 class RoomDetail(
@@ -156,15 +295,54 @@ class RoomDetail(
     queryset = Room.objects.all()
     serializer_class = RoomDetailSerializer
 
+    def get_query_param_set(self, name):
+        """?expand=reviews,photos -> {"reviews", "photos"}"""
+        value = self.request.query_params.get(name)
+        if value is None:
+            return None
+        return {item.strip() for item in value.split(",") if item.strip()}
+
+    def get_queryset(self):
+        queryset = super().get_queryset().select_related("owner", "category")
+        if self.action == "retrieve":
+            # 요청한 nested collection만 prefetch
+            # with_stats는 조회에만 (수정 응답에 변경 전 amenity 갯수가 남지 않도록)
+            expand = self.get_query_param_set("expand") or set()
+            queryset = queryset.with_stats().prefetch_related(
+                *[name for name in ("amenities", "photos") if name in expand]
+            )
+        return queryset
+
+    @conditional_view(room_detail_state)
     def retrieve(self, request, *args, **kwargs):
+        room_id = kwargs[self.lookup_url_kwarg]
+        payload = get_or_build(
+            [ROOM_DETAIL, room_namespace(room_id)],
+            self.build_retrieve_payload,
+            request.build_absolute_uri(),
+        )
+        room_data = personalize(
+            payload["data"], payload["room_id"], payload["owner_id"], request
+        )
+        return Response(room_data)
+
+    def build_retrieve_payload(self):
         instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+        serializer = self.get_serializer(
+            instance,
+            fields=self.get_query_param_set("fields"),
+            expand=self.get_query_param_set("expand") or set(),
+        )
+        return {
+            "data": dict(serializer.data),
+            "room_id": instance.id,
+            "owner_id": instance.owner_id,
+        }
 
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop("partial", True)
         instance = self.get_object()
-        if instance.owner != request.user:
+        if instance.owner_id != request.user.pk:
             raise PermissionDenied("니가 작성한 것도 아닌데 수정하면 오또케~~")
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
@@ -180,17 +358,21 @@ class RoomDetail(
             if category.kind != Category.KindCategoryChoices.ROOMS:
                 raise ParseError("저기요!! 룸 카테고리만 넣을 수 있어요!")
 
-        amenities = self.request.data.get("amenities", None)
-        if amenities:
-            try:
-                with transaction.atomic():
-                    room = serializer.save()
-                    for amenity_id in amenities:
-                        amenity = Amenity.objects.get(id=amenity_id)
-                        room.amenities.add(amenity)
-                    return room
-            except Exception:
-                raise ParseError("Amenity not found")
+        amenities = get_request_amenities(self.request.data)
+        if amenities is not None:
+            amenity_ids = get_amenity_ids(amenities)
+            mode = self.request.data.get("amenities_mode", AMENITIES_APPEND)
+            if mode not in (AMENITIES_APPEND, AMENITIES_REPLACE):
+                raise ParseError(
+                    f"amenities_mode는 {AMENITIES_APPEND} 또는 {AMENITIES_REPLACE}만 가능해요"
+                )
+            with transaction.atomic():
+                room = serializer.save()
+                if mode == AMENITIES_REPLACE:
+                    room.amenities.set(amenity_ids)
+                else:
+                    room.amenities.add(*amenity_ids)
+                return room
 
         room = serializer.save()
         return room
@@ -215,20 +397,18 @@ class RoomReviews(
     serializer_class = ReviewSerializer
     lookup_field = "id"
     lookup_url_kwarg = "room_id"
+    pagination_class = RoomReviewCursorPagination
 
     def list(self, request, *args, **kwargs):
-        try:
-            page = request.query_params.get("page", 1)
-            page = int(page)
-        except ValueError:
-            page = 1
-        page_size = settings.PAGE_SIZE
-
-        start = page_size * (page - 1)
-        end = start + 3
         room = self.get_object()
-        serializer = self.get_serializer(room.reviews.all()[start:end], many=True)
-        return Response(serializer.data)
+        reviews = room.reviews.select_related("user")
+        page = self.paginate_queryset(reviews)
+        serializer = self.get_serializer(page, many=True)
+        # 전체 갯수는 COUNT 대신 room에 저장된 review_count 사용
+        return self.paginator.get_paginated_response(
+            serializer.data,
+            count=room.review_count,
+        )
 
     def create(self, request, *args, **kwargs):
         room = self.get_object()
@@ -302,7 +482,10 @@ class RoomBookingView(
 
     def create(self, request, *args, **kwargs):
         room = self.get_object()
-        serializer = self.get_serializer(data=request.data)
+        serializer = self.get_serializer(
+            data=request.data,
+            context={**self.get_serializer_context(), "room": room},
+        )
         serializer.is_valid(raise_exception=True)
 
         updated_room = self.perform_create(
@@ -319,3 +502,26 @@ class RoomBookingView(
 
     def perform_create(self, serializer, **kwargs):
         return serializer.save(**kwargs)
+
+
+class RoomCalendarView(RetrieveModelMixin, GenericViewSet):
+    """
+    /api/v1/rooms/1/calendar?month=2023-08
+
+    occupied: 1일부터 하루당 1bit (첫 byte의 최하위 bit가 1일), base64
+    """
+
+    queryset = Room.objects.all()
+    serializer_class = RoomCalendarQuerySerializer
+    lookup_field = "id"
+    lookup_url_kwarg = "room_id"
+
+    def retrieve(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.query_params.dict())
+        serializer.is_valid(raise_exception=True)
+        month = serializer.validated_data.get(
+            "month", timezone.localtime(timezone.now()).date()
+        )
+
+        room = self.get_object()
+        return Response(get_room_calendar(room.id, month))
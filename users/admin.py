@@ -2,9 +2,11 @@ from django.contrib import admin
 from django.contrib.auth import get_user_model
 from django.contrib.auth.admin import UserAdmin
 
+from common.admin import LargeTableAdminMixin
+
 
 @admin.register(get_user_model())
-class UserAdmin(UserAdmin):
+class UserAdmin(LargeTableAdminMixin, UserAdmin):
     fieldsets = [
         (
             "Profile",
@@ -0,0 +1,46 @@
+from django.conf import settings
+from django.core.cache import cache
+
+# access token claim 인증(config.authentication)에서 쓰는 user 필드 cache
+# password는 cache에 넣지 않음 (필요하면 DB에서 따로 불러옴)
+USER_CACHE_EXCLUDE = ("password",)
+
+
+# token claim 인증에서 user마다 확인하는 상태 (get_user_status)
+USER_ACTIVE = "active"
+USER_INACTIVE = "inactive"
+USER_DELETED = "deleted"
+
+
+def _user_key(user_id):
+    return f"user-fields:{user_id}"
+
+
+def _status_key(user_id):
+    return f"user-status:{user_id}"
+
+
+def get_user_fields(user_id):
+    return cache.get(_user_key(user_id))
+
+
+def set_user_fields(user):
+    fields = {
+        field.attname: getattr(user, field.attname)
+        for field in user._meta.concrete_fields
+        if field.attname not in USER_CACHE_EXCLUDE
+    }
+    cache.set(_user_key(user.pk), fields, timeout=settings.JWT_USER_CACHE_TIMEOUT)
+    return fields
+
+
+def get_user_status(user_id):
+    return cache.get(_status_key(user_id))
+
+
+def set_user_status(user_id, status):
+    cache.set(_status_key(user_id), status, timeout=settings.JWT_USER_CACHE_TIMEOUT)
+
+
+def invalidate_user_fields(user_id):
+    cache.delete_many([_user_key(user_id), _status_key(user_id)])
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from users.revocation import revocation_store
+
+
+class Command(BaseCommand):
+    help = "만료된 폐기 token을 지우고 bloom filter를 다시 만들게 합니다. (주기적으로 실행)"
+
+    def handle(self, *args, **options):
+        deleted = revocation_store.compact()
+        self.stdout.write(self.style.SUCCESS(f"만료된 폐기 token {deleted}개를 지웠습니다."))
@@ -1,6 +1,18 @@
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, AbstractUser
-from django.db import models
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, models
+
+from common.models import CommonModel
+from users.cache import (
+    USER_ACTIVE,
+    USER_DELETED,
+    USER_INACTIVE,
+    get_user_fields,
+    get_user_status,
+    set_user_fields,
+    set_user_status,
+)
 
 
 class UserManager(BaseUserManager):
@@ -87,3 +99,89 @@ class User(AbstractUser):
 
     def __str__(self):
         return self.username
+
+
+class TokenClaimsUser(User):
+    """
+    access token claim 인증에서 쓰는 user (config.authentication)
+    id와 claim(is_staff, is_host), is_active만 가지고 나머지 필드는 deferred
+    deferred 필드에 처음 접근하면 password를 제외한 필드를 한번에 불러옴
+    (cache에 없으면 DB에서 한번)
+    """
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_claims(cls, user_id, claims):
+        """
+        claim으로 user를 만듦 (user가 없으면 None)
+        삭제/비활성화 여부는 cache된 user 상태로 확인 (cache에 없으면 DB에서 한번)
+        """
+        status = get_user_status(user_id)
+        if status is None:
+            is_active = (
+                cls._default_manager.filter(pk=user_id)
+                .values_list("is_active", flat=True)
+                .first()
+            )
+            if is_active is None:
+                status = USER_DELETED
+            else:
+                status = USER_ACTIVE if is_active else USER_INACTIVE
+            set_user_status(user_id, status)
+        if status == USER_DELETED:
+            return None
+
+        values = {"id": user_id, "is_active": status == USER_ACTIVE, **claims}
+        # from_db는 values가 concrete field 순서라고 가정
+        field_names = [
+            field.attname
+            for field in cls._meta.concrete_fields
+            if field.attname in values
+        ]
+        return cls.from_db(
+            DEFAULT_DB_ALIAS, field_names, [values[name] for name in field_names]
+        )
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        deferred = self.get_deferred_fields()
+        if fields is None or not set(fields) <= deferred or "password" in fields:
+            return super().refresh_from_db(using=using, fields=fields, **kwargs)
+
+        values = get_user_fields(self.pk)
+        if values is None:
+            values = set_user_fields(
+                User._default_manager.defer("password").get(pk=self.pk)
+            )
+        # claim으로 받은 값은 그대로 두고 deferred 필드만 채움
+        for attname, value in values.items():
+            if attname in deferred:
+                self.__dict__[attname] = value
+
+
+class RevokedToken(CommonModel):
+    """
+    폐기된 JWT (users.revocation)
+    key: token의 jti, user의 모든 token을 폐기한 경우 "user:<id>"
+    """
+
+    key = models.CharField(
+        max_length=255,
+        unique=True,
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="revoked_tokens",
+    )
+    revoked_at = models.DateTimeField()
+    # 이 시각 이후에는 token이 만료되므로 삭제 가능 (compact_revoked_tokens)
+    expires_at = models.DateTimeField(
+        db_index=True,
+    )
+
+    def __str__(self):
+        return self.key
@@ -0,0 +1,224 @@
+import threading
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone as django_timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from common.bloom import BloomFilter
+from common.cache import bump, get_versions
+from users.models import RevokedToken
+
+# compaction(전체 다시 읽기)마다 version이 바뀌는 namespace (common.cache)
+EPOCH = "token-revocation-epoch"
+# 마지막으로 읽은 id보다 작은 빈 번호는 늦게 commit될 수 있으므로 이 시간 동안 다시 확인
+# (rollback/삭제된 번호는 이후 확인하지 않음)
+PENDING_ID_TIMEOUT = 60
+PENDING_ID_LIMIT = 1000
+
+
+def user_key(user_id):
+    return f"user:{user_id}"
+
+
+def _entry_key(key):
+    return f"revoked-token:{key}"
+
+
+def _max_token_lifetime():
+    return max(api_settings.ACCESS_TOKEN_LIFETIME, api_settings.REFRESH_TOKEN_LIFETIME)
+
+
+class RevocationStore:
+    """
+    폐기된 token 확인
+    1. process마다 가진 bloom filter에 없으면 폐기되지 않은 token (I/O 없음)
+    2. bloom filter에 있으면 cache -> DB 순서로 확인
+
+    다른 process에서 폐기한 token은 TOKEN_REVOCATION_SYNC_INTERVAL초마다
+    마지막으로 읽은 id 이후에 추가된 RevokedToken만 DB에서 읽어서 반영
+    (process마다 cache가 따로 있어도 동작)
+    id 순서와 commit 순서가 다를 수 있으므로 건너뛴 id는 잠시 동안 따로 다시 확인
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom = None
+        self._epoch = None
+        self._last_id = 0
+        # 아직 보지 못한 id -> 더 이상 확인하지 않을 시각 (time.monotonic)
+        self._pending_ids = {}
+        self._synced_at = 0.0
+
+    def is_revoked(self, token):
+        self._sync()
+        jti = token.get(api_settings.JTI_CLAIM)
+        if jti is not None and self._revoked_at(jti) is not None:
+            return True
+
+        # user의 모든 token 폐기 (logout-all) 이전에 발급된 token
+        user_id = token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return False
+        revoked_at = self._revoked_at(user_key(user_id))
+        # iat는 초 단위(내림), revoked_at도 초 단위로 내림해서 저장 (revoke_user)
+        # 같은 초에 발급된 token은 폐기 이전/이후를 구분할 수 없으므로 폐기로 처리
+        # (폐기한 초에 다시 로그인한 경우 한번 더 로그인해야 함)
+        return revoked_at is not None and token.get("iat", 0) <= revoked_at
+
+    def revoke_token(self, token):
+        """
+        token 하나를 폐기
+        이미 폐기된 token이면 False (같은 refresh token의 동시 rotation 방지)
+        """
+        user_id = token.get(api_settings.USER_ID_CLAIM)
+        return self.revoke(
+            token[api_settings.JTI_CLAIM],
+            expires_at=datetime.fromtimestamp(token["exp"], tz=timezone.utc),
+            user_id=user_id and int(user_id),
+        )
+
+    def revoke_user(self, user_id):
+        """지금까지 user에게 발급된 모든 token을 폐기"""
+        key = user_key(user_id)
+        now = django_timezone.now().replace(microsecond=0)
+        with transaction.atomic():
+            # 새 id로 다시 만들어야 다른 process가 새 row로 읽음
+            RevokedToken.objects.filter(key=key).delete()
+            self.revoke(
+                key,
+                expires_at=now + _max_token_lifetime(),
+                user_id=user_id,
+                revoked_at=now,
+            )
+
+    def revoke(self, key, expires_at, user_id=None, revoked_at=None):
+        revoked_at = revoked_at or django_timezone.now()
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(
+                    key=key,
+                    user_id=user_id,
+                    revoked_at=revoked_at,
+                    expires_at=expires_at,
+                )
+        except IntegrityError:
+            return False
+
+        with self._lock:
+            if self._bloom is not None:
+                self._bloom.add(key)
+
+        def remember():
+            # commit 전에 cache에 넣으면 rollback된 폐기가 남을 수 있음
+            timeout = int((expires_at - django_timezone.now()).total_seconds())
+            cache.set(_entry_key(key), revoked_at.timestamp(), timeout=max(timeout, 1))
+
+        transaction.on_commit(remember)
+        return True
+
+    def compact(self):
+        """만료된 RevokedToken을 지우고 모든 process의 bloom filter를 다시 만들게 함"""
+        deleted, _ = RevokedToken.objects.filter(
+            expires_at__lte=django_timezone.now()
+        ).delete()
+        bump(EPOCH)
+        return deleted
+
+    def _revoked_at(self, key):
+        if key not in self._bloom:
+            return None
+        revoked_at = cache.get(_entry_key(key))
+        if revoked_at is None:
+            revoked = (
+                RevokedToken.objects.filter(
+                    key=key, expires_at__gt=django_timezone.now()
+                )
+                .values_list("revoked_at", flat=True)
+                .first()
+            )
+            # false positive(폐기되지 않음)는 cache하지 않음
+            # 다른 process에서 나중에 폐기해도 cache 때문에 놓치지 않도록
+            if revoked is None:
+                return None
+            revoked_at = revoked.timestamp()
+            cache.set(
+                _entry_key(key),
+                revoked_at,
+                timeout=int(_max_token_lifetime().total_seconds()),
+            )
+        return revoked_at
+
+    def _sync(self):
+        interval = settings.TOKEN_REVOCATION_SYNC_INTERVAL
+        if self._bloom is not None and time.monotonic() - self._synced_at < interval:
+            return
+
+        with self._lock:
+            # cache가 비워진 경우 새 epoch -> 다른 process도 전체를 다시 읽음
+            (epoch,) = get_versions(EPOCH)
+            if self._bloom is None or epoch != self._epoch or self._bloom.is_full:
+                self._rebuild()
+            else:
+                self._load_new()
+            self._epoch = epoch
+            self._synced_at = time.monotonic()
+
+    def _rebuild(self):
+        revoked = RevokedToken.objects.filter(expires_at__gt=django_timezone.now())
+        # 추가로 폐기될 token을 위해 여유있게
+        capacity = max(settings.TOKEN_REVOCATION_BLOOM_CAPACITY, revoked.count() * 2)
+        self._bloom = BloomFilter(capacity, settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE)
+        self._last_id = 0
+        self._pending_ids = {}
+        self._load(revoked)
+
+    def _load_new(self):
+        """마지막으로 읽은 id 이후의 row와 아직 보지 못한 id만 읽음"""
+        now = time.monotonic()
+        self._pending_ids = {
+            pk: expires for pk, expires in self._pending_ids.items() if expires > now
+        }
+        condition = Q(id__gt=self._last_id)
+        if self._pending_ids:
+            condition |= Q(id__in=list(self._pending_ids))
+        self._load(RevokedToken.objects.filter(condition))
+
+    def _load(self, revoked):
+        ids = set()
+        user_keys = []
+        for pk, key in revoked.values_list("id", "key").iterator(chunk_size=10_000):
+            ids.add(pk)
+            if key.startswith(user_key("")):
+                user_keys.append(key)
+            # 다시 확인한 key는 건너뜀 (bloom filter 갯수가 늘지 않도록)
+            if key not in self._bloom:
+                self._bloom.add(key)
+        # logout-all을 다시 하면 revoked_at이 바뀜 -> 이전 값의 cache를 지움
+        cache.delete_many([_entry_key(key) for key in user_keys])
+        self._track_ids(ids)
+
+    def _track_ids(self, ids):
+        for pk in ids:
+            self._pending_ids.pop(pk, None)
+        last_id = max(ids, default=self._last_id)
+        if last_id <= self._last_id:
+            return
+        # 건너뛴 번호 중 최근 PENDING_ID_LIMIT개만 다시 확인
+        expires = time.monotonic() + PENDING_ID_TIMEOUT
+        start = max(self._last_id, last_id - PENDING_ID_LIMIT)
+        for pk in range(start + 1, last_id):
+            if pk not in ids:
+                self._pending_ids[pk] = expires
+        if len(self._pending_ids) > PENDING_ID_LIMIT:
+            self._pending_ids = dict(
+                sorted(self._pending_ids.items())[-PENDING_ID_LIMIT:]
+            )
+        self._last_id = last_id
+
+
+revocation_store = RevocationStore()
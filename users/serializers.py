@@ -3,7 +3,17 @@ from rest_framework import serializers
 from rest_framework import status
 from rest_framework.exceptions import ParseError
 from rest_framework.serializers import ModelSerializer, Serializer
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+    TokenVerifySerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import UntypedToken
+
+from config.authentication import ClaimsRefreshToken
+from users.revocation import revocation_store
 
 
 class TinyUserSerializer(ModelSerializer):
@@ -110,3 +120,35 @@ class PasswordChangeSerializer(serializers.ModelSerializer):
 
 class SocialLocalSerializer(serializers.Serializer):
     pass
+
+
+class ClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """user claim이 들어간 token 발급 (config.authentication)"""
+
+    token_class = ClaimsRefreshToken
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    폐기된 refresh token은 거절하고, rotation할 때 이전 refresh token을 폐기
+    (simplejwt token_blacklist app 대신 users.revocation)
+    """
+
+    token_class = ClaimsRefreshToken
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        if revocation_store.is_revoked(refresh):
+            raise InvalidToken("폐기된 token이에요")
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            # 같은 refresh token으로 동시에 요청하면 먼저 폐기한 요청만 통과
+            if not revocation_store.revoke_token(refresh):
+                raise InvalidToken("이미 사용된 token이에요")
+        return super().validate(attrs)
+
+
+class RevocableTokenVerifySerializer(TokenVerifySerializer):
+    def validate(self, attrs):
+        if revocation_store.is_revoked(UntypedToken(attrs["token"])):
+            raise InvalidToken("폐기된 token이에요")
+        return super().validate(attrs)
@@ -0,0 +1,15 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.cache import invalidate_user_fields
+from users.models import TokenClaimsUser
+
+
+# 인증된 request.user(TokenClaimsUser)를 저장해도 sender가 달라서 같이 연결
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+@receiver(post_save, sender=TokenClaimsUser)
+@receiver(post_delete, sender=TokenClaimsUser)
+def invalidate_user_cache(sender, instance, **kwargs):
+    invalidate_user_fields(instance.pk)
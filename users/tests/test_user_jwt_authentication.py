@@ -0,0 +1,140 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from config.authentication import SimpleJWTAuthentication
+from config.snippets import get_tokens_for_user
+from users.revocation import revocation_store
+from wishlists.models import Wishlist
+
+
+def create_user(email="test@example.com", password="test123!@#"):
+    return get_user_model().objects.create_user(email, password)
+
+
+@override_settings(TOKEN_REVOCATION_SYNC_INTERVAL=60, JWT_TRUSTED_CLAIMS=True)
+class SimpleJWTAuthenticationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.user.is_host = True
+        self.user.save()
+        _, self.access_token = get_tokens_for_user(self.user)
+        # 폐기 token bloom filter를 미리 읽어둠 (users.revocation)
+        revocation_store.is_revoked(AccessToken(self.access_token))
+
+    def authenticate(self, access_token=None):
+        request = APIRequestFactory().get("/")
+        request.COOKIES["access_token"] = access_token or self.access_token
+        user, _ = SimpleJWTAuthentication().authenticate(request)
+        return user
+
+    def test_authenticate_from_claims(self):
+        # 삭제/비활성화 여부만 처음 한번 DB에서 확인하고 이후 요청은 cache 사용
+        with self.assertNumQueries(1):
+            self.authenticate()
+
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+            self.assertEqual(user.pk, self.user.pk)
+            self.assertTrue(user.is_authenticated)
+            self.assertIs(user.is_host, True)
+            self.assertIs(user.is_staff, False)
+            self.assertEqual(user, self.user)
+
+    def test_load_other_fields_once(self):
+        user = self.authenticate()
+        with self.assertNumQueries(1):
+            self.assertEqual(user.email, self.user.email)
+            self.assertEqual(user.username, self.user.username)
+
+        # 다른 요청은 cache에서 불러옴
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate().email, self.user.email)
+
+    def test_claims_win_over_cached_fields(self):
+        """is_staff/is_host는 token의 claim 값 (새 token을 발급받을 때 반영)"""
+        self.authenticate().email
+        get_user_model().objects.filter(pk=self.user.pk).update(is_host=False)
+
+        user = self.authenticate()
+        user.email
+        self.assertIs(user.is_host, True)
+
+    def test_inactive_user(self):
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_deleted_user(self):
+        self.authenticate()
+        self.user.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_deleted_user_api_401(self):
+        self.user.delete()
+        client = APIClient()
+        client.cookies["access_token"] = self.access_token
+
+        res = client.get(reverse("wishlists:list"))
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_user_update_invalidates_cache(self):
+        self.authenticate()
+        self.user.username = "changed"
+        self.user.save()
+
+        self.assertEqual(self.authenticate().username, "changed")
+
+    def test_token_without_claims(self):
+        """claim이 없는 이전 token은 DB에서 user를 조회"""
+        access_token = str(RefreshToken.for_user(self.user).access_token)
+        with self.assertNumQueries(1):
+            user = self.authenticate(access_token)
+        self.assertEqual(user.pk, self.user.pk)
+
+    @override_settings(JWT_TRUSTED_CLAIMS=False)
+    def test_trusted_claims_disabled(self):
+        with self.assertNumQueries(1):
+            user = self.authenticate()
+        self.assertEqual(user.email, self.user.email)
+
+    def test_save_claims_user_invalidates_cache(self):
+        user = self.authenticate()
+        user.username = "changed"
+        user.save()
+
+        self.assertEqual(self.authenticate().username, "changed")
+        self.assertEqual(get_user_model().objects.get().username, "changed")
+
+
+@override_settings(TOKEN_REVOCATION_SYNC_INTERVAL=60, JWT_TRUSTED_CLAIMS=True)
+class WishlistWithCookieTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        Wishlist.objects.create(user=self.user, name="wishlist")
+        _, access_token = get_tokens_for_user(self.user)
+        self.client = APIClient()
+        self.client.cookies["access_token"] = access_token
+        # 폐기 token bloom filter를 미리 읽어둠 (users.revocation)
+        revocation_store.is_revoked(AccessToken(access_token))
+        self.client.get(reverse("wishlists:list"))
+
+    def test_list_without_user_query(self):
+        # wishlist + rooms_count, cover photos (user 조회 없음)
+        with self.assertNumQueries(2):
+            res = self.client.get(reverse("wishlists:list"))
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 1)
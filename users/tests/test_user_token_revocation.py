@@ -0,0 +1,227 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from config.authentication import ClaimsRefreshToken
+from users.models import RevokedToken
+from users.revocation import RevocationStore, revocation_store
+
+REFRESH_URL = reverse("users:token-refresh")
+VERIFY_URL = reverse("users:token-verify")
+LOGOUT_ALL_URL = reverse("users:logout-all")
+WISHLIST_URL = reverse("wishlists:list")
+
+
+def create_user(email="test@example.com", password="test123!@#"):
+    return get_user_model().objects.create_user(email, password)
+
+
+def revoked_at(seconds):
+    """이 안에서 revoke_user를 하면 지금부터 seconds초 후에 폐기한 것으로 저장"""
+    return patch(
+        "users.revocation.django_timezone.now",
+        return_value=timezone.now() + timedelta(seconds=seconds),
+    )
+
+
+@override_settings(TOKEN_REVOCATION_SYNC_INTERVAL=0)
+class RevocationStoreTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.store = RevocationStore()
+
+    def test_revoke_token(self):
+        token = RefreshToken.for_user(self.user)
+        other = RefreshToken.for_user(self.user)
+
+        self.assertTrue(self.store.revoke_token(token))
+        self.assertFalse(self.store.revoke_token(token))
+
+        self.assertTrue(self.store.is_revoked(token))
+        self.assertFalse(self.store.is_revoked(other))
+
+    @override_settings(TOKEN_REVOCATION_SYNC_INTERVAL=60)
+    def test_not_revoked_without_query(self):
+        self.store.revoke_token(RefreshToken.for_user(self.user))
+        token = AccessToken.for_user(self.user)
+        self.store.is_revoked(token)
+
+        with self.assertNumQueries(0):
+            self.assertFalse(self.store.is_revoked(token))
+
+    def test_revoked_in_other_process(self):
+        token = RefreshToken.for_user(self.user)
+        self.assertFalse(self.store.is_revoked(token))
+
+        # 다른 process의 store에서 폐기 (cache도 process마다 따로 있는 경우)
+        RevocationStore().revoke_token(token)
+        cache.clear()
+
+        self.assertTrue(self.store.is_revoked(token))
+        self.assertTrue(RevocationStore().is_revoked(token))
+
+    def test_sync_reads_only_new_rows(self):
+        self.store.revoke_token(RefreshToken.for_user(self.user))
+        self.store.is_revoked(AccessToken.for_user(self.user))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.store.is_revoked(AccessToken.for_user(self.user))
+        self.assertNotIn("created_at", queries[0]["sql"])
+        self.assertEqual(self.store._last_id, RevokedToken.objects.latest("id").id)
+
+    def test_sync_late_committed_row(self):
+        """id 순서보다 늦게 commit된 row도 다음 동기화에서 읽음"""
+        self.store.is_revoked(AccessToken.for_user(self.user))
+        late = RefreshToken.for_user(self.user)
+        expires_at = timezone.now() + timedelta(days=1)
+        first = RevokedToken.objects.create(
+            key="first", expires_at=expires_at, revoked_at=timezone.now()
+        )
+        RevokedToken.objects.create(
+            id=first.id + 2,
+            key="second",
+            expires_at=expires_at,
+            revoked_at=timezone.now(),
+        )
+        self.assertFalse(self.store.is_revoked(late))
+
+        RevokedToken.objects.create(
+            id=first.id + 1,
+            key=late["jti"],
+            expires_at=expires_at,
+            revoked_at=timezone.now(),
+        )
+        cache.clear()
+
+        self.assertTrue(self.store.is_revoked(late))
+
+    def test_cache_written_after_commit(self):
+        token = RefreshToken.for_user(self.user)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.store.revoke_token(token)
+            self.assertIsNone(cache.get(f"revoked-token:{token['jti']}"))
+
+        for callback in callbacks:
+            callback()
+        self.assertIsNotNone(cache.get(f"revoked-token:{token['jti']}"))
+
+    def test_revoke_user(self):
+        refresh = RefreshToken.for_user(self.user)
+        access = AccessToken.for_user(self.user)
+        other_user_token = AccessToken.for_user(create_user("other@example.com"))
+
+        self.store.revoke_user(self.user.pk)
+
+        self.assertTrue(self.store.is_revoked(refresh))
+        self.assertTrue(self.store.is_revoked(access))
+        self.assertFalse(self.store.is_revoked(other_user_token))
+
+    def test_token_issued_in_same_second(self):
+        """logout-all과 같은 초에 발급된 token은 이전/이후와 상관없이 폐기"""
+        now = timezone.now().replace(microsecond=50_000)
+        with patch("rest_framework_simplejwt.tokens.aware_utcnow", return_value=now):
+            token = RefreshToken.for_user(self.user)
+        with patch(
+            "users.revocation.django_timezone.now",
+            return_value=now.replace(microsecond=350_000),
+        ):
+            self.store.revoke_user(self.user.pk)
+
+        self.assertTrue(self.store.is_revoked(token))
+        self.assertTrue(self.store.is_revoked(token.access_token))
+
+    def test_token_issued_after_revoke_user(self):
+        with revoked_at(seconds=-2):
+            self.store.revoke_user(self.user.pk)
+
+        self.assertFalse(self.store.is_revoked(AccessToken.for_user(self.user)))
+        self.assertFalse(self.store.is_revoked(RefreshToken.for_user(self.user)))
+
+    def test_revoke_user_again(self):
+        with revoked_at(seconds=-5):
+            self.store.revoke_user(self.user.pk)
+        token = AccessToken.for_user(self.user)
+        other_process = RevocationStore()
+        self.assertFalse(other_process.is_revoked(token))
+
+        self.store.revoke_user(self.user.pk)
+
+        self.assertTrue(other_process.is_revoked(token))
+
+    def test_compact(self):
+        token = RefreshToken.for_user(self.user)
+        self.store.revoke_token(token)
+        RevokedToken.objects.create(
+            key="expired",
+            revoked_at=timezone.now() - timedelta(days=2),
+            expires_at=timezone.now() - timedelta(days=1),
+        )
+
+        call_command("compact_revoked_tokens", stdout=StringIO())
+
+        self.assertEqual(
+            list(RevokedToken.objects.values_list("key", flat=True)),
+            [token["jti"]],
+        )
+        self.assertTrue(self.store.is_revoked(token))
+
+
+@override_settings(TOKEN_REVOCATION_SYNC_INTERVAL=0)
+class TokenRevocationApiTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = create_user()
+        self.client = APIClient()
+        self.refresh = ClaimsRefreshToken.for_user(self.user)
+
+    def test_refresh_rotation_revokes_old_token(self):
+        res = self.client.post(REFRESH_URL, {"refresh": str(self.refresh)})
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn("refresh", res.data)
+
+        # 이전 refresh token은 다시 쓸 수 없음
+        res = self.client.post(REFRESH_URL, {"refresh": str(self.refresh)})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        res = self.client.post(VERIFY_URL, {"token": str(self.refresh)})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_all(self):
+        self.client.cookies["access_token"] = str(self.refresh.access_token)
+        res = self.client.get(WISHLIST_URL)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.client.force_authenticate(self.user)
+        res = self.client.post(LOGOUT_ALL_URL)
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.client.force_authenticate(None)
+
+        res = self.client.get(WISHLIST_URL)
+        self.assertNotEqual(res.status_code, status.HTTP_200_OK)
+        res = self.client.post(REFRESH_URL, {"refresh": str(self.refresh)})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_revokes_cookie_tokens(self):
+        access_token = self.refresh.access_token
+        self.client.force_authenticate(self.user)
+        self.client.cookies["access_token"] = str(access_token)
+        self.client.cookies["refresh_token"] = str(self.refresh)
+
+        res = self.client.post(reverse("users:logout"))
+
+        self.assertEqual(res.status_code, status.HTTP_202_ACCEPTED)
+        self.assertTrue(revocation_store.is_revoked(access_token))
+        self.assertTrue(revocation_store.is_revoked(self.refresh))
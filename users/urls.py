@@ -20,6 +20,11 @@ urlpatterns = [
         views.LogoutView.as_view(url_match.create_dict),
         name="logout",
     ),
+    path(
+        "logout-all/",
+        views.LogoutAllView.as_view(url_match.create_dict),
+        name="logout-all",
+    ),
     path(
         "token/",
         views.CreateJWTView.as_view(),
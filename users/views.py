@@ -10,9 +10,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.serializers import (
     TokenObtainPairSerializer,
 )
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
@@ -22,19 +24,20 @@ from rest_framework_simplejwt.views import (
 from common.shortcut import get_object_or_404
 
 from users import serializers
+from users.revocation import revocation_store
 from users.serializers import UserSerializer
 
 
 class CreateJWTView(TokenObtainPairView):
-    pass
+    serializer_class = serializers.ClaimsTokenObtainPairSerializer
 
 
 class VerifyJWTView(TokenVerifyView):
-    pass
+    serializer_class = serializers.RevocableTokenVerifySerializer
 
 
 class RefreshJWTView(TokenRefreshView):
-    pass
+    serializer_class = serializers.RevocableTokenRefreshSerializer
 
 
 class CreateUserView(APIView):
@@ -97,12 +100,36 @@ class LogoutView(mixins.CreateModelMixin, viewsets.GenericViewSet):
 
     def create(self, request, *args, **kwargs):
         logout(request)
+        # cookie에 있는 jwt도 더 이상 사용할 수 없도록 폐기
+        for token_class, cookie in (
+            (AccessToken, "access_token"),
+            (RefreshToken, "refresh_token"),
+        ):
+            try:
+                token = token_class(request.COOKIES[cookie])
+            except (KeyError, TokenError):
+                continue
+            revocation_store.revoke_token(token)
+
         response = Response(
             {"message": "Logout success"}, status=status.HTTP_202_ACCEPTED
         )
         return response
 
 
+class LogoutAllView(mixins.CreateModelMixin, viewsets.GenericViewSet):
+    """지금까지 발급된 user의 모든 jwt를 폐기 (모든 기기에서 로그아웃)"""
+
+    serializer_class = serializers.UserLogoutSerializer
+    queryset = get_user_model().objects.all()
+    permission_classes = [IsAuthenticated]
+
+    def create(self, request, *args, **kwargs):
+        revocation_store.revoke_user(request.user.pk)
+        logout(request)
+        return Response({"message": "Logout success"}, status=status.HTTP_202_ACCEPTED)
+
+
 class UserMeView(
     mixins.ListModelMixin,
     mixins.UpdateModelMixin,
@@ -1,9 +1,99 @@
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import F, Func, OuterRef, Subquery, Window
+from django.db.models.functions import Coalesce, RowNumber
 
 from common.models import CommonModel
 
 
+class WishlistQuerySet(models.QuerySet):
+    def with_rooms_count(self):
+        """room 갯수(rooms_count)를 wishlist 목록 query 한번으로 조회"""
+        rooms_count = (
+            self.model.rooms.through.objects.filter(wishlist=OuterRef("pk"))
+            .order_by()
+            .annotate(count=Func(F("pk"), function="COUNT"))
+            .values("count")
+        )
+        return self.annotate(rooms_count=Coalesce(Subquery(rooms_count), 0))
+
+    def attach_cover_photos(self, wishlists, limit=3):
+        """
+        wishlist마다 담긴 room의 photo를 limit개씩 cover_photos에 넣음
+        wishlist 갯수와 상관없이 query 한번 (ROW_NUMBER로 wishlist별 상위 n개)
+        """
+        from medias.models import Photo
+
+        covers = {wishlist.pk: [] for wishlist in wishlists}
+        photos = (
+            Photo.objects.filter(room__wishlist__in=list(covers))
+            .annotate(
+                wishlist_id=F("room__wishlist"),
+                row_number=Window(
+                    RowNumber(),
+                    partition_by=F("room__wishlist"),
+                    order_by=(F("room_id").asc(), F("pk").asc()),
+                ),
+            )
+            .filter(row_number__lte=limit)
+            .only("pk", "file", "description")
+            .order_by("wishlist_id", "row_number")
+        )
+        for photo in photos:
+            covers[photo.wishlist_id].append(photo)
+        for wishlist in wishlists:
+            wishlist.cover_photos = covers[wishlist.pk]
+        return wishlists
+
+    def liked_room_ids(self, user):
+        """user의 wishlist들에 담긴 room id set (쿼리 1번)"""
+        return set(
+            self.model.rooms.through.objects.filter(wishlist__user=user).values_list(
+                "room_id", flat=True
+            )
+        )
+
+    def toggle_room(self, user, wishlist_id, room_id):
+        """
+        user의 wishlist에 room이 있으면 빼고 없으면 넣음
+        through 테이블에 DELETE 한번, 지워진게 없으면 조건부 INSERT 한번
+
+        return 바뀐 뒤 포함 여부 (wishlist나 room이 없으면 None)
+        """
+        through = self.model.rooms.through
+        deleted, _ = through.objects.filter(
+            wishlist_id=wishlist_id, wishlist__user=user, room_id=room_id
+        ).delete()
+        if deleted:
+            return False
+
+        try:
+            # 연타로 다른 요청이 먼저 넣은 경우 unique 제약에 걸림 -> 이미 담긴 상태
+            with transaction.atomic(using=self.db):
+                inserted = self._insert_room(through, user, wishlist_id, room_id)
+        except IntegrityError:
+            return True
+        return True if inserted else None
+
+    def _insert_room(self, through, user, wishlist_id, room_id):
+        # wishlist 주인과 room 존재 여부를 INSERT ... SELECT 조건으로 확인
+        connection = connections[self.db]
+        qn = connection.ops.quote_name
+        room_model = through._meta.get_field("room").related_model
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {qn(through._meta.db_table)} "
+                f"({qn('wishlist_id')}, {qn('room_id')}) "
+                f"SELECT w.{qn('id')}, r.{qn('id')} "
+                f"FROM {qn(self.model._meta.db_table)} w, "
+                f"{qn(room_model._meta.db_table)} r "
+                f"WHERE w.{qn('id')} = %s AND w.{qn('user_id')} = %s "
+                f"AND r.{qn('id')} = %s",
+                [wishlist_id, user.pk, room_id],
+            )
+            return cursor.rowcount
+
+
 class Wishlist(CommonModel):
     """Wishlist Model Definition"""
 
@@ -24,6 +114,8 @@ class Wishlist(CommonModel):
         related_name="wishlists",
     )
 
+    objects = WishlistQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
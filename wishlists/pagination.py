@@ -0,0 +1,12 @@
+from django.conf import settings
+
+from common.pagination import NewestFirstCursorPagination
+
+
+class WishlistRoomCursorPagination(NewestFirstCursorPagination):
+    """
+    wishlist에 담긴 room 목록
+    검색/정렬 필터가 없으므로 ?ordering=, ?q=는 무시하고 최신순 고정
+    """
+
+    page_size = settings.ROOMS_PAGE_SIZE
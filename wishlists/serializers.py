@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from medias.serializers import PhotoSerializer
 from rooms.serializers import RoomListSerializer
 from wishlists.models import Wishlist
 
@@ -16,5 +17,24 @@ class WishlistSerializer(serializers.ModelSerializer):
         )
 
 
+class WishlistSummarySerializer(serializers.ModelSerializer):
+    """
+    목록용 요약 (room 대신 갯수와 cover photo)
+    Wishlist.objects.with_rooms_count(), attach_cover_photos()로 조회한 wishlist
+    """
+
+    rooms_count = serializers.IntegerField(read_only=True)
+    cover_photos = PhotoSerializer(read_only=True, many=True)
+
+    class Meta:
+        model = Wishlist
+        fields = (
+            "id",
+            "name",
+            "rooms_count",
+            "cover_photos",
+        )
+
+
 class WishlistToggleSerializer(serializers.Serializer):
     pass
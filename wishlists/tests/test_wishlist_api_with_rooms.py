@@ -0,0 +1,112 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from common.utils import DefaultObjectCreate
+from config.snippets import get_tokens_for_user
+from medias.models import Photo
+from wishlists.models import Wishlist
+
+WISHLIST_URL = reverse("wishlists:list")
+
+
+def wishlist_rooms_url(wishlist_id):
+    return reverse("wishlists:wishlist-rooms", kwargs={"wishlist_id": wishlist_id})
+
+
+class WishlistSummaryApiTest(TestCase):
+    def setUp(self):
+        self.default_object_create = DefaultObjectCreate()
+        self.user = get_user_model().objects.create_user(
+            email="test@example.com", password="test123!@3"
+        )
+        self.client = APIClient()
+        access_token, _ = get_tokens_for_user(self.user)
+        self.client.force_authenticate(self.user, token=access_token)
+
+    def create_wishlist(self, room_count, photo_count=2):
+        wishlist = Wishlist.objects.create(user=self.user, name="wishlist")
+        for _ in range(room_count):
+            room = self.default_object_create.create_room(owner=self.user)
+            for i in range(photo_count):
+                Photo.objects.create(
+                    file=f"https://example.com/{room.id}/{i}.jpg",
+                    description="photo",
+                    room=room,
+                )
+            wishlist.rooms.add(room)
+        return wishlist
+
+    def test_list_summary(self):
+        wishlist = self.create_wishlist(room_count=3)
+        empty_wishlist = self.create_wishlist(room_count=0)
+
+        res = self.client.get(WISHLIST_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        summaries = {summary["id"]: summary for summary in res.data}
+        self.assertEqual(summaries[wishlist.id]["rooms_count"], 3)
+        self.assertEqual(len(summaries[wishlist.id]["cover_photos"]), 3)
+        self.assertNotIn("rooms", summaries[wishlist.id])
+        self.assertEqual(summaries[empty_wishlist.id]["rooms_count"], 0)
+        self.assertEqual(summaries[empty_wishlist.id]["cover_photos"], [])
+
+    def test_list_queries_constant(self):
+        self.create_wishlist(room_count=1)
+        with self.assertNumQueries(2):
+            self.client.get(WISHLIST_URL)
+
+        for _ in range(3):
+            self.create_wishlist(room_count=4)
+        # wishlist + rooms_count, cover photos
+        with self.assertNumQueries(2):
+            self.client.get(WISHLIST_URL)
+
+    def test_list_rooms_paginated(self):
+        wishlist = self.create_wishlist(room_count=3)
+        self.create_wishlist(room_count=2)
+
+        res = self.client.get(wishlist_rooms_url(wishlist.id), {"page_size": 2})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data["results"]), 2)
+        self.assertTrue(all(room["is_liked"] for room in res.data["results"]))
+        self.assertIsNotNone(res.data["next"])
+
+        res = self.client.get(res.data["next"])
+        self.assertEqual(len(res.data["results"]), 1)
+
+    def test_list_rooms_ignores_room_ordering_and_search(self):
+        wishlist = self.create_wishlist(room_count=2)
+
+        for params in (
+            {"ordering": "rating"},
+            {"ordering": "distance"},
+            {"q": "abc"},
+        ):
+            res = self.client.get(wishlist_rooms_url(wishlist.id), params)
+            self.assertEqual(res.status_code, status.HTTP_200_OK, params)
+            self.assertEqual(len(res.data["results"]), 2, params)
+
+    def test_list_rooms_queries_constant(self):
+        wishlist = self.create_wishlist(room_count=1)
+        # wishlist 확인, room, photos, is_liked
+        with self.assertNumQueries(4):
+            self.client.get(wishlist_rooms_url(wishlist.id))
+
+        for _ in range(5):
+            wishlist.rooms.add(self.default_object_create.create_room(owner=self.user))
+        with self.assertNumQueries(4):
+            self.client.get(wishlist_rooms_url(wishlist.id))
+
+    def test_list_rooms_of_other_user_wishlist(self):
+        other_user = get_user_model().objects.create_user(
+            email="other@example.com", password="test123!@3"
+        )
+        wishlist = Wishlist.objects.create(user=other_user, name="other")
+
+        res = self.client.get(wishlist_rooms_url(wishlist.id))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,5 +1,9 @@
+from unittest.mock import patch
+
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -66,6 +70,11 @@ def wishlist_toggle_url(wishlist_id, room_id):
     )
 
 
+def statements(queries):
+    # TestCase의 transaction 안에서만 생기는 SAVEPOINT는 제외
+    return [q for q in queries if "SAVEPOINT" not in q["sql"]]
+
+
 def wishlist_detail_url(wishlist_id):
     return reverse("wishlists:detail", args=(wishlist_id,))
 
@@ -130,3 +139,63 @@ class PrivateWishlistWithSomeActionTest(TestCase):
         target_url = wishlist_detail_url(wishlist.id)
         res = self.client.get(target_url)
         self.assertEqual(len(res.data["rooms"]), 0)
+
+    def test_put_toggle_returns_state_and_size(self):
+        wishlist = create_wishlist(self.user)
+        room = create_room(self.user)
+        target_url = wishlist_toggle_url(wishlist.id, room.id)
+
+        # through DELETE, 조건부 INSERT, COUNT
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.put(target_url)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, {"is_liked": True, "rooms_count": 1})
+        self.assertEqual(len(statements(queries)), 3)
+
+        # 빼는 경우는 DELETE, COUNT
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.put(target_url)
+        self.assertEqual(len(statements(queries)), 2)
+        self.assertEqual(res.data, {"is_liked": False, "rooms_count": 0})
+
+    def test_put_toggle_not_found(self):
+        other_user = get_user_model().objects.create_user(
+            email="other@example.com", password="test123!@3"
+        )
+        other_wishlist = create_wishlist(other_user)
+        wishlist = create_wishlist(self.user)
+        room = create_room(self.user)
+
+        res = self.client.put(wishlist_toggle_url(other_wishlist.id, room.id))
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        res = self.client.put(wishlist_toggle_url(wishlist.id, room.id + 100))
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(other_wishlist.rooms.exists())
+        self.assertFalse(wishlist.rooms.exists())
+
+
+class WishlistToggleRoomTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            email="test@example.com", password="test123!@3"
+        )
+        self.wishlist = create_wishlist(self.user)
+        self.room = create_room(self.user)
+
+    def test_toggle_room(self):
+        toggle = Wishlist.objects.toggle_room
+        self.assertIs(toggle(self.user, self.wishlist.id, self.room.id), True)
+        self.assertIs(toggle(self.user, self.wishlist.id, self.room.id), False)
+        self.assertIsNone(toggle(self.user, self.wishlist.id + 100, self.room.id))
+
+    def test_toggle_room_double_tap(self):
+        """DELETE 이후에 다른 요청이 먼저 INSERT한 경우 에러 없이 담긴 상태"""
+        self.wishlist.rooms.add(self.room)
+
+        with patch("django.db.models.query.QuerySet.delete", return_value=(0, {})):
+            is_liked = Wishlist.objects.toggle_room(
+                self.user, self.wishlist.id, self.room.id
+            )
+
+        self.assertIs(is_liked, True)
+        self.assertEqual(self.wishlist.rooms.count(), 1)
@@ -1,6 +1,11 @@
 from django.urls import path
 
-from common.url_match import list_create_dict, retrieve_update_destroy_dict, update_dict
+from common.url_match import (
+    list_create_dict,
+    list_dict,
+    retrieve_update_destroy_dict,
+    update_dict,
+)
 from wishlists import views
 
 app_name = "wishlists"
@@ -11,6 +16,11 @@ urlpatterns = [
         views.WishlistDetailView.as_view(retrieve_update_destroy_dict),
         name="detail",
     ),
+    path(
+        "<int:wishlist_id>/rooms/",
+        views.WishlistRoomsView.as_view(list_dict),
+        name="wishlist-rooms",
+    ),
     path(
         "<int:wishlist_id>/rooms/<int:room_id>/",
         views.WishlistToggleView.as_view(update_dict),
@@ -1,4 +1,6 @@
+from django.conf import settings
 from rest_framework import status
+from rest_framework.exceptions import NotFound
 from rest_framework.mixins import (
     ListModelMixin,
     CreateModelMixin,
@@ -10,11 +12,16 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
-from common.shortcut import get_object_or_404
 from config.authentication import SimpleJWTAuthentication
 from rooms.models import Room
+from rooms.serializers import RoomListSerializer
 from wishlists.models import Wishlist
-from wishlists.serializers import WishlistSerializer, WishlistToggleSerializer
+from wishlists.pagination import WishlistRoomCursorPagination
+from wishlists.serializers import (
+    WishlistSerializer,
+    WishlistSummarySerializer,
+    WishlistToggleSerializer,
+)
 
 
 class WishlistsView(
@@ -30,11 +37,18 @@ class WishlistsView(
     def get_queryset(self):
         return self.queryset.filter(user=self.request.user)
 
+    def get_serializer_class(self):
+        if self.action == "list":
+            return WishlistSummarySerializer
+        return self.serializer_class
+
     def list(self, request, *args, **kwargs):
-        wishlists = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(
-            wishlists, many=True, context={"request": request}
+        # room 목록은 /wishlists/<id>/rooms/에서 페이지 단위로 조회
+        wishlists = list(self.filter_queryset(self.get_queryset().with_rooms_count()))
+        Wishlist.objects.attach_cover_photos(
+            wishlists, limit=settings.WISHLIST_COVER_PHOTOS
         )
+        serializer = self.get_serializer(wishlists, many=True)
         return Response(serializer.data)
 
     def create(self, request, *args, **kwargs):
@@ -97,6 +111,20 @@ class WishlistDetailView(
         wishlist.delete()
 
 
+class WishlistRoomsView(ListModelMixin, GenericViewSet):
+    """wishlist에 담긴 room 목록 (cursor 페이지네이션)"""
+
+    serializer_class = RoomListSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = WishlistRoomCursorPagination
+
+    def get_queryset(self):
+        wishlist_id = self.kwargs.get("wishlist_id")
+        if not Wishlist.objects.filter(id=wishlist_id, user=self.request.user).exists():
+            raise NotFound("wishlist를 찾을 수 없어요")
+        return Room.objects.for_list(self.request.user).filter(wishlist=wishlist_id)
+
+
 class WishlistToggleView(UpdateModelMixin, GenericViewSet):
     queryset = Wishlist.objects.all()
     serializer_class = WishlistToggleSerializer
@@ -108,10 +136,18 @@ class WishlistToggleView(UpdateModelMixin, GenericViewSet):
         return self.queryset.filter(user=self.request.user)
 
     def update(self, request, *args, **kwargs):
-        wishlist = self.get_object()
-        room = get_object_or_404(Room, id=kwargs.get("room_id"))
+        wishlist_id = kwargs.get(self.lookup_url_kwarg)
+        room_id = kwargs.get("room_id")
 
-        rooms = wishlist.rooms
-        rooms.remove(room) if rooms.filter(id=room.id).exists() else rooms.add(room)
+        # get_object / room 조회 / exists 없이 through 테이블만 건드림
+        is_liked = Wishlist.objects.toggle_room(request.user, wishlist_id, room_id)
+        if is_liked is None:
+            raise NotFound("wishlist나 room을 찾을 수 없어요")
 
-        return Response(status=status.HTTP_200_OK)
+        rooms_count = Wishlist.rooms.through.objects.filter(
+            wishlist_id=wishlist_id
+        ).count()
+        return Response(
+            {"is_liked": is_liked, "rooms_count": rooms_count},
+            status=status.HTTP_200_OK,
+        )